@@ -0,0 +1,221 @@
+import ifcopenshell
+import ifcopenshell.guid
+import random
+
+
+# Systemarten der synthetischen Modelle, die Bezeichner entsprechen den Standardkonventionen SYSTEM_NAMING_CONVENTIONS
+# Vorlauf- und Rücklaufsysteme folgen paarweise aufeinander und werden über eine Verbindung an der Quelle gekoppelt
+# (Bezeichner, PredefinedType des Systems, Klasse der Quelle, des Segments, des Formteils und des Endgeräts, Art der Ports)
+SYSTEM_KINDS = [('HVL Heizung', 'HEATING', 'IfcBoiler', 'IfcPipeSegment', 'IfcPipeFitting', 'IfcSpaceHeater', 'PIPE'),
+                ('HRL Heizung', 'HEATING', 'IfcPump', 'IfcPipeSegment', 'IfcPipeFitting', 'IfcSpaceHeater', 'PIPE'),
+                ('Zuluft Anlage', 'VENTILATION', 'IfcFan', 'IfcDuctSegment', 'IfcDuctFitting', 'IfcAirTerminal', 'DUCT'),
+                ('Abluft Anlage', 'VENTILATION', 'IfcFan', 'IfcDuctSegment', 'IfcDuctFitting', 'IfcAirTerminal', 'DUCT'),
+                ('Trinkwasser PWC', 'DOMESTICCOLDWATER', 'IfcPump', 'IfcPipeSegment', 'IfcPipeFitting', 'IfcSanitaryTerminal', 'PIPE'),
+                ('Abwasser', 'WASTEWATER', 'IfcTank', 'IfcPipeSegment', 'IfcPipeFitting', 'IfcWasteTerminal', 'PIPE'),
+                ('c_Kaltwasser VL', 'CHILLEDWATER', 'IfcChiller', 'IfcPipeSegment', 'IfcPipeFitting', 'IfcCooledBeam', 'PIPE'),
+                ('c_Kaltwasser RL', 'CHILLEDWATER', 'IfcPump', 'IfcPipeSegment', 'IfcPipeFitting', 'IfcCooledBeam', 'PIPE')]
+
+# Die Verbindungen zwischen Ports werden wie in den exportierenden Anwendungen vom Eingang (RelatingPort) zum Ausgang (RelatedPort) angelegt
+
+# Länge der Elemente, Abstand der Stränge und Höhe der Geschosse in mm
+ELEMENT_LENGTH = 1000.
+ROW_DISTANCE = 2000.
+STOREY_HEIGHT = 3000.
+
+
+def create_placement(model, relative_placement, axis_placement):
+    # Lokale Platzierung relativ zur übergeordneten Platzierung
+    return model.createIfcLocalPlacement(relative_placement, axis_placement)
+
+
+def create_axis_placement(model, coordinates, axis, ref_direction):
+    # Koordinatensystem an der angegebenen Position in mm
+    return model.createIfcAxis2Placement3D(model.createIfcCartesianPoint(coordinates), axis, ref_direction)
+
+
+def create_port(model, port_placement, flow_direction, port_type, system_type):
+    # Port mit Fließrichtung, Art und Systemzuordnung
+    return model.createIfcDistributionPort(ifcopenshell.guid.new(), None, 'Port', None, None, port_placement, None, flow_direction, port_type, system_type)
+
+
+def assign_ports(model, element, port_list, nests):
+    # Zuordnung der Ports zum Element über IfcRelNests oder IfcRelConnectsPortToElement
+    if nests:
+        model.createIfcRelNests(ifcopenshell.guid.new(), None, None, None, element, port_list)
+    else:
+        for port in port_list:
+            model.createIfcRelConnectsPortToElement(ifcopenshell.guid.new(), None, None, None, port, element)
+
+
+def create_ifc_model(file_path, num_elements, chain_length=50, system_size=500, fitting_interval=5, systems_per_storey=8, nests=True, open_port_rate=0.05, properties=True, seed=0):
+    # Erzeugung eines synthetischen IFC4-Modells mit Verteilnetzen aus Quellen, Segmenten, Formteilen und Endgeräten
+    # Jedes System besteht aus einem Strang, der nach chain_length Elementen in einer neuen Reihe fortgesetzt wird
+    # An jedem fitting_interval-ten Element wird ein Formteil mit einem Abzweig zu einem Endgerät eingesetzt
+    # Verbindungen zwischen Ports werden mit der Rate open_port_rate ausgelassen, die Ports liegen weiterhin an derselben Position
+    rand = random.Random(seed)
+    model = ifcopenshell.file(schema='IFC4')
+
+    result_dict = dict()
+    result_dict['Elements'] = 0
+    result_dict['Segments'] = 0
+    result_dict['Fittings'] = 0
+    result_dict['Terminals'] = 0
+    result_dict['Sources'] = 0
+    result_dict['Systems'] = 0
+    result_dict['Ports'] = 0
+    result_dict['Open ports'] = 0
+    result_dict['Spaces'] = 0
+    result_dict['Storeys'] = 0
+
+    # Koordinatensysteme, die von allen Platzierungen gemeinsam verwendet werden
+    axis = model.createIfcDirection((0., 0., 1.))
+    ref_direction = model.createIfcDirection((1., 0., 0.))
+    origin_axis = create_axis_placement(model, (0., 0., 0.), axis, ref_direction)
+    end_axis = create_axis_placement(model, (ELEMENT_LENGTH, 0., 0.), axis, ref_direction)
+    branch_axis = create_axis_placement(model, (0., ELEMENT_LENGTH, 0.), axis, ref_direction)
+
+    # Projekt mit Längeneinheit in mm und dreidimensionalem Kontext
+    length_unit = model.createIfcSIUnit(UnitType='LENGTHUNIT', Prefix='MILLI', Name='METRE')
+    context = model.createIfcGeometricRepresentationContext(None, 'Model', 3, 1e-5, origin_axis, None)
+    project = model.createIfcProject(ifcopenshell.guid.new(), None, 'Synthetic MEP Project', None, None, None, None, [context], model.createIfcUnitAssignment([length_unit]))
+
+    # Räumliche Struktur aus Grundstück, Gebäude und Geschossen
+    site_placement = create_placement(model, None, origin_axis)
+    site = model.createIfcSite(ifcopenshell.guid.new(), None, 'Site', None, None, site_placement, None, None, 'ELEMENT', None, None, None, None, None)
+    building_placement = create_placement(model, site_placement, origin_axis)
+    building = model.createIfcBuilding(ifcopenshell.guid.new(), None, 'Building', None, None, building_placement, None, None, 'ELEMENT', None, None, None)
+    model.createIfcRelAggregates(ifcopenshell.guid.new(), None, None, None, project, [site])
+    model.createIfcRelAggregates(ifcopenshell.guid.new(), None, None, None, site, [building])
+
+    storey_list = []
+    storey_placement = None
+    storey_elements = []
+    storey_spaces = []
+    storey_y = 0.
+    previous_source = None
+    system_index = 0
+
+    while result_dict['Elements'] < num_elements:
+        # Anlegen eines neuen Geschosses nach systems_per_storey Systemen
+        if system_index % systems_per_storey == 0:
+            if storey_list:
+                model.createIfcRelAggregates(ifcopenshell.guid.new(), None, None, None, storey_list[-1], storey_spaces)
+                model.createIfcRelContainedInSpatialStructure(ifcopenshell.guid.new(), None, None, None, storey_elements, storey_list[-1])
+            storey_placement = create_placement(model, building_placement, create_axis_placement(model, (0., 0., len(storey_list) * STOREY_HEIGHT), axis, ref_direction))
+            storey = model.createIfcBuildingStorey(ifcopenshell.guid.new(), None, 'Storey %d' % len(storey_list), None, None, storey_placement, None, None, 'ELEMENT', len(storey_list) * STOREY_HEIGHT)
+            storey_list.append(storey)
+            storey_elements = []
+            storey_spaces = []
+            storey_y = 0.
+
+        system_kind = SYSTEM_KINDS[system_index % len(SYSTEM_KINDS)]
+        system_name, system_type, source_class, segment_class, fitting_class, terminal_class, port_type = system_kind
+        system = model.createIfcDistributionSystem(ifcopenshell.guid.new(), None, '%s %d' % (system_name, system_index // len(SYSTEM_KINDS) + 1), None, None, None, system_type)
+        system_members = []
+        system_y = storey_y
+
+        # Gemeinsamer Eigenschaftssatz aller Elemente eines Systems
+        if properties:
+            shared_pset = model.createIfcPropertySet(ifcopenshell.guid.new(), None, 'Pset_ManufacturerTypeInformation', None,
+                                                     [model.createIfcPropertySingleValue('Manufacturer', None, model.createIfcLabel('Synthetic'), None),
+                                                      model.createIfcPropertySingleValue('ModelReference', None, model.createIfcLabel(system_name), None)])
+
+        previous_port = None
+        num_system_elements = min(system_size, num_elements - result_dict['Elements'])
+        position = 0
+        while len(system_members) < num_system_elements:
+            row, column = divmod(position, chain_length)
+            coordinates = (column * ELEMENT_LENGTH, system_y + row * ROW_DISTANCE, 0.)
+            element_placement = create_placement(model, storey_placement, create_axis_placement(model, coordinates, axis, ref_direction))
+            if position == 0:
+                element_class = source_class
+                result_dict['Sources'] += 1
+            elif position % fitting_interval == 0 and len(system_members) + 2 < num_system_elements:
+                element_class = fitting_class
+                result_dict['Fittings'] += 1
+            else:
+                element_class = segment_class
+                result_dict['Segments'] += 1
+
+            element = model.create_entity(element_class, GlobalId=ifcopenshell.guid.new(), Name='%s %d' % (element_class[3:], position), ObjectPlacement=element_placement, PredefinedType='NOTDEFINED')
+            system_members.append(element)
+            port_list = []
+
+            # Eingang am Anfang des Elements, zu Beginn einer neuen Reihe liegen die Ports nicht übereinander und werden immer verbunden
+            if position > 0:
+                in_port = create_port(model, create_placement(model, element_placement, origin_axis), 'SINK', port_type, system_type)
+                port_list.append(in_port)
+                if column > 0 and rand.random() < open_port_rate:
+                    result_dict['Open ports'] += 2
+                else:
+                    model.createIfcRelConnectsPorts(ifcopenshell.guid.new(), None, None, None, in_port, previous_port, None)
+
+            # Kopplung der Quelle eines Rücklaufsystems mit der Quelle des vorangegangenen Vorlaufsystems
+            elif previous_source is not None:
+                coupling_port = create_port(model, create_placement(model, element_placement, origin_axis), 'SINK', port_type, system_type)
+                source_port = create_port(model, create_placement(model, previous_source.ObjectPlacement, origin_axis), 'SOURCE', port_type, system_type)
+                port_list.append(coupling_port)
+                assign_ports(model, previous_source, [source_port], nests)
+                model.createIfcRelConnectsPorts(ifcopenshell.guid.new(), None, None, None, coupling_port, source_port, None)
+                result_dict['Ports'] += 1
+
+            # Abzweig des Formteils zu einem Endgerät
+            if element_class == fitting_class:
+                branch_port = create_port(model, create_placement(model, element_placement, branch_axis), 'SOURCE', port_type, system_type)
+                port_list.append(branch_port)
+                terminal_placement = create_placement(model, storey_placement, create_axis_placement(model, (coordinates[0], coordinates[1] + ELEMENT_LENGTH, 0.), axis, ref_direction))
+                terminal = model.create_entity(terminal_class, GlobalId=ifcopenshell.guid.new(), Name='%s %d' % (terminal_class[3:], position), ObjectPlacement=terminal_placement, PredefinedType='NOTDEFINED')
+                terminal_port = create_port(model, create_placement(model, terminal_placement, origin_axis), 'SINK', port_type, system_type)
+                assign_ports(model, terminal, [terminal_port], nests)
+                model.createIfcRelConnectsPorts(ifcopenshell.guid.new(), None, None, None, terminal_port, branch_port, None)
+                system_members.append(terminal)
+                result_dict['Terminals'] += 1
+                result_dict['Ports'] += 1
+
+            # Ausgang am Ende des Elements, das letzte Element des Strangs hat keinen Ausgang
+            if len(system_members) < num_system_elements:
+                previous_port = create_port(model, create_placement(model, element_placement, end_axis), 'SOURCE', port_type, system_type)
+                port_list.append(previous_port)
+
+            assign_ports(model, element, port_list, nests)
+            result_dict['Ports'] += len(port_list)
+            position += 1
+
+        result_dict['Elements'] += len(system_members)
+        if system_index % 2 == 0:
+            previous_source = system_members[0]
+        else:
+            previous_source = None
+
+        model.createIfcRelAssignsToGroup(ifcopenshell.guid.new(), None, None, None, system_members, None, system)
+        if properties:
+            model.createIfcRelDefinesByProperties(ifcopenshell.guid.new(), None, None, None, system_members, shared_pset)
+        storey_elements.extend(system_members)
+
+        # Raum, der den Strang des Systems einschließlich der Endgeräte umschließt
+        rows = -(-position // chain_length)
+        width = min(position, chain_length) * ELEMENT_LENGTH + ELEMENT_LENGTH
+        depth = rows * ROW_DISTANCE
+        profile_position = model.createIfcAxis2Placement2D(model.createIfcCartesianPoint((width / 2. - ELEMENT_LENGTH / 2., system_y + depth / 2. - ROW_DISTANCE / 4.)), None)
+        profile = model.createIfcRectangleProfileDef('AREA', None, profile_position, width, depth)
+        solid = model.createIfcExtrudedAreaSolid(profile, create_axis_placement(model, (0., 0., -STOREY_HEIGHT / 2.), axis, ref_direction), axis, STOREY_HEIGHT)
+        representation = model.createIfcShapeRepresentation(context, 'Body', 'SweptSolid', [solid])
+        space = model.createIfcSpace(ifcopenshell.guid.new(), None, 'Space %d' % system_index, None, None, create_placement(model, storey_placement, origin_axis),
+                                     model.createIfcProductDefinitionShape(None, None, [representation]), None, 'ELEMENT', 'INTERNAL', None)
+        storey_spaces.append(space)
+
+        storey_y += depth + ROW_DISTANCE
+        system_index += 1
+
+    model.createIfcRelAggregates(ifcopenshell.guid.new(), None, None, None, storey_list[-1], storey_spaces)
+    model.createIfcRelContainedInSpatialStructure(ifcopenshell.guid.new(), None, None, None, storey_elements, storey_list[-1])
+    model.createIfcRelAggregates(ifcopenshell.guid.new(), None, None, None, building, storey_list)
+
+    result_dict['Systems'] = system_index
+    result_dict['Spaces'] = system_index
+    result_dict['Storeys'] = len(storey_list)
+    result_dict['Relationship'] = 'IfcRelNests' if nests else 'IfcRelConnectsPortToElement'
+
+    model.write(file_path)
+
+    return result_dict
@@ -0,0 +1,233 @@
+import argparse
+import datetime
+import glob
+import json
+import logging
+import math
+import os
+import shlex
+import subprocess
+import sys
+import time
+
+from helper_generate import *
+
+
+# Pfad des IFC2TSO Prozesses, dessen Prozessschritte vermessen werden
+IFC2TSO_MAIN = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'src', 'main.py')
+
+# Die Hilfsfunktionen des Prozessschritts GRAPH2TSO importieren sich gegenseitig ohne Paketpfad, daher wird deren Verzeichnis dem Suchpfad hinzugefügt
+IFC2TSO_PYTHONPATH = [os.path.join(os.path.dirname(IFC2TSO_MAIN), 'GRAPH2TSO')]
+
+
+def run_ifc2tso(args, ifc_path):
+    # Aufruf des IFC2TSO Prozesses in einem eigenen Prozess, damit der maximale Arbeitsspeicher je Modellgröße getrennt erfasst wird
+    # Rückgabe des Berichts des Profilings und bei einem Abbruch der Fehlermeldung
+    command = [sys.executable, IFC2TSO_MAIN, ifc_path, '-profile'] + shlex.split(args.options)
+    if not args.no_spatial:
+        command.extend(['-add_spatial', ifc_path])
+
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(IFC2TSO_PYTHONPATH + [path for path in [env.get('PYTHONPATH')] if path])
+
+    start_time = time.time()
+    try:
+        process = subprocess.run(command, cwd=os.path.dirname(IFC2TSO_MAIN), env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, timeout=args.timeout)
+    except subprocess.TimeoutExpired:
+        return None, 'IFC2TSO process exceeded the timeout of %d s' % args.timeout
+
+    if process.returncode != 0:
+        error_lines = process.stderr.decode(errors='replace').strip().splitlines()
+        return None, 'IFC2TSO process failed with return code %d: %s' % (process.returncode, error_lines[-1] if error_lines else '')
+
+    # Der Bericht des Profilings wird am Pfad des Modells mit dem Präfix PROFILE_ abgelegt
+    profile_list = [profile_path for profile_path in glob.glob(os.path.join(os.path.dirname(ifc_path), 'PROFILE_*.json')) if os.path.getmtime(profile_path) >= start_time]
+    if not profile_list:
+        return None, 'Profiling report of the IFC2TSO process could not be found'
+
+    with open(max(profile_list, key=os.path.getmtime), 'r', encoding='utf8') as json_file:
+        return json.load(json_file), None
+
+
+def summarize_profile(profile_dict):
+    # Zusammenfassung der Messwerte je Prozessschritt, Schritte mehrerer IFC-Modelle werden addiert
+    result_dict = dict()
+    for step in profile_dict['Steps']:
+        if step['Step'] not in result_dict:
+            result_dict[step['Step']] = {'Wall time [s]': 0., 'CPU time [s]': 0., 'Peak RSS [MB]': None, 'Counts': dict()}
+        step_dict = result_dict[step['Step']]
+        step_dict['Wall time [s]'] += step['Wall time [s]']
+        step_dict['CPU time [s]'] += step['CPU time [s]']
+        if step['Peak RSS [MB]'] is not None:
+            step_dict['Peak RSS [MB]'] = max(step_dict['Peak RSS [MB]'] or 0., step['Peak RSS [MB]'])
+        for key, value in step['Counts'].items():
+            step_dict['Counts'][key] = step_dict['Counts'].get(key, 0) + value
+
+    return result_dict
+
+
+def calculate_scaling(run_list, threshold):
+    # Abschätzung des Skalierungsverhaltens je Prozessschritt über die Steigung der Wandzeit über der Modellgröße im doppelt logarithmischen Maßstab
+    # Eine Steigung von 1 entspricht linearem Verhalten, Prozessschritte oberhalb des Schwellwerts skalieren superlinear
+    result_dict = dict()
+    step_list = []
+    for run in run_list:
+        for step in run['Steps']:
+            if step not in step_list:
+                step_list.append(step)
+
+    for step in step_list:
+        size_list = []
+        time_list = []
+        rss_list = []
+        for run in run_list:
+            if step in run['Steps']:
+                size_list.append(run['Model']['Elements'])
+                time_list.append(run['Steps'][step]['Wall time [s]'])
+                rss_list.append(run['Steps'][step]['Peak RSS [MB]'])
+
+        # Die Messwerte unterhalb einer Millisekunde werden nicht berücksichtigt, da sie vom Messrauschen dominiert werden
+        point_list = [(math.log(size), math.log(wall_time)) for size, wall_time in zip(size_list, time_list) if size > 0 and wall_time >= 0.001]
+        exponent = None
+        if len(point_list) >= 2:
+            mean_x = sum(point[0] for point in point_list) / len(point_list)
+            mean_y = sum(point[1] for point in point_list) / len(point_list)
+            var_x = sum((point[0] - mean_x) ** 2 for point in point_list)
+            if var_x > 0:
+                exponent = round(sum((point[0] - mean_x) * (point[1] - mean_y) for point in point_list) / var_x, 2)
+
+        result_dict[step] = {'Elements': size_list,
+                             'Wall time [s]': time_list,
+                             'Peak RSS [MB]': rss_list,
+                             'Exponent': exponent,
+                             'Super-linear': exponent is not None and exponent > threshold}
+
+    return result_dict
+
+
+def split_sizes(value):
+    # Aufteilung der mit -sizes kommagetrennt angegebenen Anzahl der Elemente
+    return [int(size) for size in value.split(',') if size.strip()]
+
+
+def configure_logging(args):
+    # Konfiguration des Logs
+    if args.l:
+        logging.basicConfig(handlers=[logging.FileHandler(os.path.join(args.output_dir, 'LOG_BENCHMARK.log')), logging.StreamHandler()],
+                            level=logging.INFO, format='%(asctime)s | %(levelname)s | %(message)s')
+    else:
+        logging.basicConfig(level=logging.INFO, format='%(asctime)s | %(levelname)s | %(message)s')
+
+
+def main(args):
+    os.makedirs(args.output_dir, exist_ok=True)
+    configure_logging(args)
+
+    logging.info('Benchmark started with options %r', args)
+
+    run_list = []
+    for size in args.sizes:
+        # Erzeugung des synthetischen Modells der angegebenen Größe
+        ifc_path = os.path.abspath(os.path.join(args.output_dir, 'BENCHMARK_%d.ifc' % size))
+        logging.info('Synthetic model with %d elements is being created', size)
+        start_time = time.perf_counter()
+        model_dict = create_ifc_model(ifc_path, size, chain_length=args.chain, system_size=args.system_size, fitting_interval=args.fitting_interval,
+                                      nests=not args.pte, open_port_rate=args.open_ports, properties=not args.no_props, seed=args.seed)
+        generation_time = round(time.perf_counter() - start_time, 4)
+        logging.info('Synthetic model with %d elements, %d ports and %d systems was successfully created', model_dict['Elements'], model_dict['Ports'], model_dict['Systems'])
+
+        # Vermessung der Prozessschritte des IFC2TSO Prozesses
+        logging.info('IFC2TSO process is being profiled for %d elements', size)
+        profile_dict, error = run_ifc2tso(args, ifc_path)
+        if profile_dict is None:
+            logging.warning('IFC2TSO process could not be profiled for %d elements: %s', size, error)
+            run_list.append({'Size': size, 'Model': model_dict, 'Generation time [s]': generation_time, 'Failed': True, 'Error': error, 'Steps': dict()})
+        else:
+            run_list.append({'Size': size, 'Model': model_dict, 'Generation time [s]': generation_time, 'Failed': False, 'Error': None, 'Steps': summarize_profile(profile_dict)})
+            logging.info('IFC2TSO process was successfully profiled for %d elements', size)
+
+        # Die Ausgaben des IFC2TSO Prozesses werden bei großen Modellen schnell mehrere GB groß, daher bleibt nur der Bericht des Profilings erhalten
+        if not args.keep:
+            os.remove(ifc_path)
+            for output_path in glob.glob(os.path.join(args.output_dir, 'LD-REP_*')) + glob.glob(os.path.join(args.output_dir, '*GRAPH_*')):
+                os.remove(output_path)
+
+    # Auswertung des Skalierungsverhaltens der Prozessschritte
+    scaling_dict = calculate_scaling(run_list, args.threshold)
+    for step, step_dict in scaling_dict.items():
+        if step_dict['Super-linear']:
+            logging.warning('%s scales super-linearly with an exponent of %.2f: %s s', step, step_dict['Exponent'], ', '.join(str(wall_time) for wall_time in step_dict['Wall time [s]']))
+        else:
+            logging.info('%s scales with an exponent of %s', step, step_dict['Exponent'])
+
+    # Ablage der Laufzeit- und Speicherverläufe als Datei im JSON-Format
+    report_path = os.path.join(args.output_dir, 'BENCHMARK_%s.json' % datetime.datetime.now().strftime('%Y%m%d_%H%M%S'))
+    with open(report_path, 'w', encoding='utf8') as json_file:
+        json.dump({'Options': vars(args), 'Runs': run_list, 'Scaling': scaling_dict}, json_file, ensure_ascii=False, indent=4)
+    logging.info('Benchmark results were successfully saved to %s', report_path)
+
+    # Bei abgebrochenen Messungen ist der Verlauf unvollständig, der Benchmark wird daher als fehlgeschlagen beendet
+    failed_list = [run['Size'] for run in run_list if run['Failed']]
+    if failed_list:
+        logging.error('Benchmark failed for %d of %d model sizes: %s', len(failed_list), len(run_list), ', '.join(str(size) for size in failed_list))
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    # Konzeption des Command Line Interface
+    parser = argparse.ArgumentParser(description="""
+                                     Generate synthetic IFC4 models of technical systems with increasing size, run every process step of IFC2TSO with -profile
+                                     and report the runtime and memory curves and the scaling exponent of each process step.
+                                     """
+                                     )
+
+    # Verzeichnis für die synthetischen Modelle, die Ausgaben des IFC2TSO Prozesses und die Ergebnisse des Benchmarks
+    parser.add_argument("output_dir", type=str, help="Directory for the synthetic models, the outputs and the benchmark report")
+
+    # Kommagetrennte Anzahl der Elemente der synthetischen Modelle.
+    parser.add_argument("-sizes", type=split_sizes, default='1000,10000,100000,1000000', help="Comma separated numbers of distribution elements of the synthetic models")
+
+    # Anzahl der Elemente je Reihe eines Strangs.
+    parser.add_argument("-chain", type=int, default=50, help="Number of elements per row of a system")
+
+    # Anzahl der Elemente je System.
+    parser.add_argument("-system_size", type=int, default=500, help="Number of elements per system")
+
+    # Abstand der Formteile mit Abzweig zu einem Endgerät im Strang.
+    parser.add_argument("-fitting_interval", type=int, default=5, help="Every n-th element of a system is a fitting with a branch to a terminal")
+
+    # Zuordnung der Ports über IfcRelConnectsPortToElement anstelle von IfcRelNests.
+    parser.add_argument("-pte", action='store_true', help="Assign the ports using IfcRelConnectsPortToElement instead of IfcRelNests")
+
+    # Anteil der nicht verbundenen Ports zwischen zwei Elementen eines Strangs.
+    parser.add_argument("-open_ports", type=float, default=0.05, help="Rate of port connections that are left open")
+
+    # Verzicht auf Eigenschaftssätze an den Elementen.
+    parser.add_argument("-no_props", action='store_true', help="Do not assign property sets to the elements")
+
+    # Startwert des Zufallsgenerators für reproduzierbare Modelle.
+    parser.add_argument("-seed", type=int, default=0, help="Seed of the random generator")
+
+    # Optionen des IFC2TSO Prozesses, mit denen die Prozessschritte vermessen werden.
+    parser.add_argument("-options", type=str, default='-ce 100 -cr -data', help="Options passed to the IFC2TSO process in addition to -profile")
+
+    # Verzicht auf die Anreicherung der räumlichen Struktur, die sonst auf Basis des synthetischen Modells erfolgt.
+    parser.add_argument("-no_spatial", action='store_true', help="Do not pass the synthetic model to -add_spatial")
+
+    # Maximale Laufzeit des IFC2TSO Prozesses je Modellgröße in Sekunden.
+    parser.add_argument("-timeout", type=int, default=None, help="Timeout of the IFC2TSO process per model size in seconds")
+
+    # Schwellwert des Exponenten, ab dem ein Prozessschritt als superlinear skalierend ausgewiesen wird.
+    parser.add_argument("-threshold", type=float, default=1.2, help="Exponent above which a process step is reported as super-linear")
+
+    # Beibehaltung der synthetischen Modelle und der Ausgaben des IFC2TSO Prozesses nach der Vermessung.
+    parser.add_argument("-keep", action='store_true', help="Keep the synthetic models and the outputs of IFC2TSO after profiling")
+
+    # Ablage des Logs als Datei im Ausgabeverzeichnis.
+    parser.add_argument("-l", action='store_true', help="Save log to file at the output directory")
+
+    parse_args = parser.parse_args()
+
+    sys.exit(main(parse_args))
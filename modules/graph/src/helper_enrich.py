@@ -1,69 +1,182 @@
 import networkx as nx
+import json
 import re
 import uuid
+from collections import deque
+
+# Optionale Abhängigkeit für Namenskonventionen im YAML-Format
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+
+# Namespace zur Ableitung deterministischer Bezeichner der Systeme, ohne Namespace werden zufällige Bezeichner vergeben
+SYSTEM_ID_NAMESPACE = None
+
+
+def set_system_id_namespace(namespace):
+    # Festlegen des Namespaces zur Ableitung deterministischer Bezeichner der Systeme
+    global SYSTEM_ID_NAMESPACE
+    SYSTEM_ID_NAMESPACE = namespace
+
+
+def create_system_id(*keys):
+    # Vergabe eines Bezeichners, im deterministischen Modus als UUIDv5 aus dem Namespace, der Rolle und den GUIDs der Komponenten bzw. übergeordneten Systeme
+    if SYSTEM_ID_NAMESPACE is None:
+        return str(uuid.uuid4())
+    return str(uuid.uuid5(SYSTEM_ID_NAMESPACE, '|'.join(str(key) for key in keys)))
+
+
+# Namenskonventionen zur Erkennung von technischen Systemen der TSO anhand der Bezeichner der IFC-Systeme
+# FS: funktionale Systeme, TS: Systemteile je funktionalem System, die regulären Ausdrücke werden mit re.match auf die Bezeichner in Kleinbuchstaben angewendet
+SYSTEM_NAMING_CONVENTIONS = {
+    'FS': {
+        'Automation System': [],
+        'Data System': [],
+        'Electrical System': [],
+        'Safety System': [],
+        'Fluid System': [],
+        'Drainage System': [r'[\w\- ]*regenwasser[\w\- ]*', r'[\w\- ]*brauchwasser[\w\- ]*'],
+        'Sanitary System': [r'[\w\- ]*trinkwasser[\w\- ]*', r'[\w\- ]*pwc[\w\- ]*', r'[\w\- ]*pwh[\w\- ]*', r'[\w\- ]*abwasser[\w\- ]*', r'[\w\- ]*schmutzwasser[\w\- ]*'],
+        'Ventilation System': [r'v_[\w\- ]*', r'[\w\- ]*ods[\w\- ]*', r'[\w\- ]*eta[\w\- ]*', r'[\w\- ]*eoa[\w\- ]*', r'[\w\- ]*sea[\w\- ]*', r'[\w\- ]*eha[\w\- ]*',
+                               r'[\w\- ]*sup[\w\- ]*', r'[\w\- ]*zuluft[\w\- ]*', r'[\w\- ]*abluft[\w\- ]*', r'[\w\- ]*fortluft[\w\- ]*',
+                               r'[\w\- ]*aussenluft[\w\- ]*', r'[\w\- ]*außenluft[\w\- ]*'],
+        'Heating System': [r'h_[\w\- ]*', r'hrl[\w\- ]*', r'hvl[\w\- ]*', r'[\w\- ]*HRL[\w\- ]*', r'[\w\- ]*HVL[\w\- ]*'],
+        'Cooling System': [r'c_[\w\- ]*', r'k_[\w\- ]*']
+    },
+    'TS': {
+        'Heating System': {'Supply System': [r'[\w\- ]*vorlauf[\w\- ]*', r'[\w\- ]*vl[\w\- ]*'], 'Return System': [r'[\w\- ]*rücklauf[\w\- ]*', r'\w*rl\w*']},
+        'Cooling System': {'Supply System': [r'[\w\- ]*vorlauf[\w\- ]*', r'[\w\- ]*vl[\w\- ]*'], 'Return System': [r'[\w\- ]*rücklauf[\w\- ]*', r'\w*rl\w*']},
+        'Ventilation System': {'Supply System_1': [r'[\w\- ]*zuluft[\w\- ]*', r'[\w\- ]*sup[\w\- ]*'],
+                               'Return System_1': [r'[\w\- ]*abluft[\w\- ]*', r'[\w\- ]*eth[\w\- ]*', r'[\w\- ]*eta[\w\- ]*'],
+                               'Return System_2': [r'[\w\- ]*fortluft[\w\- ]*', r'[\w\- ]*ehh[\w\- ]*', r'[\w\- ]*eha[\w\- ]*'],
+                               'Supply System_2': [r'[\w\- ]*oda[\w\- ]*', r'[\w\- ]*aussenluft[\w\- ]*', r'[\w\- ]*außenluft[\w\- ]*'],
+                               'Distribution System': [r'[\w\- ]*sea[\w\- ]*']},
+        'Sanitary System': {'Return System': [r'[\w\- ]*abwasser[\w\- ]*', r'[\w\- ]*schmutzwasser[\w\- ]*'],
+                            'Supply System': [r'[\w\- ]*trinkwasser[\w\- ]*', r'[\w\- ]*pwc[\w\- ]*', r'[\w\- ]*pwh[\w\- ]*']},
+        'Drainage System': {'Distribution System': [r'[\w\- ]*regenwasser[\w\- ]*', r'[\w\- ]*brauchwasser[\w\- ]*', r'[\w\- ]*abwasser[\w\- ]*']}
+    }
+}
+
+# Kompilierte Namenskonventionen mit den zwischengespeicherten Ergebnissen je Systembezeichner, werden bei der ersten Klassifizierung angelegt
+SYSTEM_CLASSIFIER = None
+
+
+def merge_graphs(graph_list):
+    # Zusammenführung mehrerer Graphen in einem Durchlauf
+    # Knoten, die mit gleicher GUID und abweichenden Attributen in mehreren Graphen enthalten sind, werden erfasst
+    merged_graph = nx.DiGraph()
+    conflict_dict = dict()
+    for graph in graph_list:
+        merged_graph.graph.update(graph.graph)
+        merge_into_graph(merged_graph, graph.nodes(data=True), graph.edges(data=True), conflict_dict)
+
+    return merged_graph, conflict_dict
+
+
+def merge_into_graph(merged_graph, node_list, edge_list, conflict_dict):
+    # Zusammenführung der Knoten und Kanten eines Graphs mit dem bisher zusammengeführten Graph
+    # Die Knoten und Kanten können direkt aus der importierten Datei übergeben werden, sodass kein eigener Graph je Datei aufgebaut wird
+    for node, data in node_list:
+        if node in merged_graph:
+            node_data = merged_graph.nodes[node]
+            for key, value in data.items():
+                if key in node_data and node_data[key] != value:
+                    conflict_dict.setdefault(node, dict()).setdefault(key, [node_data[key]]).append(value)
+            node_data.update(data)
+        else:
+            merged_graph.add_node(node, **data)
+
+    merged_graph.add_edges_from(edge_list)
+
+
+def compile_system_patterns(pattern_list):
+    # Zusammenfassung der regulären Ausdrücke [(Schlüssel, Ausdruck)] in einem kompilierten Ausdruck
+    # Jeder Ausdruck wird als optionaler Lookahead an der ersten Position geprüft, sodass ein Aufruf von match alle zutreffenden Ausdrücke liefert
+    regex = re.compile(''.join('(?:(?=(?P<p%d>%s)))?' % (idx, pattern) for idx, (key, pattern) in enumerate(pattern_list)))
+    return {'Regex': regex, 'Keys': [key for key, pattern in pattern_list], 'Cache': dict()}
+
+
+def compile_system_classifier(naming_conventions):
+    # Kompilieren der Namenskonventionen in einen Ausdruck für die funktionalen Systeme und einen Ausdruck für die Systemteile je funktionalem System
+    classifier = dict()
+    classifier['Classes'] = list(naming_conventions['FS'].keys())
+    classifier['FS'] = compile_system_patterns([((fs, idx), pattern) for fs, patterns in naming_conventions['FS'].items() for idx, pattern in enumerate(patterns)])
+    classifier['TS'] = dict()
+    for fs, ts_conventions in naming_conventions['TS'].items():
+        classifier['TS'][fs] = compile_system_patterns([(ts, pattern) for ts, patterns in ts_conventions.items() for pattern in patterns])
+
+    return classifier
+
+
+def set_system_naming_conventions(naming_conventions):
+    # Festlegen der Namenskonventionen, die Hierarchieebenen der angegebenen Konventionen ersetzen die Standardkonventionen
+    global SYSTEM_CLASSIFIER
+    SYSTEM_CLASSIFIER = compile_system_classifier({'FS': naming_conventions.get('FS', SYSTEM_NAMING_CONVENTIONS['FS']),
+                                                   'TS': naming_conventions.get('TS', SYSTEM_NAMING_CONVENTIONS['TS'])})
+
+
+def load_system_naming_conventions(file_path):
+    # Import der Namenskonventionen aus einer Datei im JSON- oder YAML-Format mit den Hierarchieebenen FS und TS
+    with open(file_path, 'r', encoding='utf8') as conventions_file:
+        if file_path.lower().endswith(('.yml', '.yaml')):
+            try:
+                naming_conventions = yaml.safe_load(conventions_file)
+            except yaml.YAMLError as error:
+                raise ValueError(error)
+        else:
+            naming_conventions = json.load(conventions_file)
+
+    if not isinstance(naming_conventions, dict) or not set(naming_conventions) <= {'FS', 'TS'}:
+        raise ValueError('The naming conventions have to contain the hierarchy levels FS and/or TS')
+    pattern_lists = list(naming_conventions.get('FS', dict()).values())
+    for ts_conventions in naming_conventions.get('TS', dict()).values():
+        pattern_lists.extend(ts_conventions.values())
+    if not all(isinstance(patterns, list) and all(isinstance(pattern, str) for pattern in patterns) for patterns in pattern_lists):
+        raise ValueError('The regular expressions of the naming conventions have to be given as lists')
+
+    return naming_conventions
 
 
-def init_regex():
-    # Aufsetzen der regulären Ausdrücke für die Erkennung von technischen Systemen der TSO
-    system_naming_conventions_import = dict()
-    tsystem_naming_conections_import = dict()
+def get_system_classifier():
+    # Die Standardkonventionen werden bei der ersten Klassifizierung kompiliert
+    if SYSTEM_CLASSIFIER is None:
+        set_system_naming_conventions(SYSTEM_NAMING_CONVENTIONS)
+    return SYSTEM_CLASSIFIER
+
+
+def match_system_patterns(compiled_patterns, system_name):
+    # Schlüssel aller zutreffenden Ausdrücke in der Reihenfolge der Namenskonventionen, das Ergebnis wird je Systembezeichner zwischengespeichert
+    cache = compiled_patterns['Cache']
+    if system_name not in cache:
+        match = compiled_patterns['Regex'].match(system_name.lower())
+        cache[system_name] = [key for idx, key in enumerate(compiled_patterns['Keys']) if match.group('p%d' % idx) is not None]
+    return cache[system_name]
+
+
+def classify_functional_system(system_name):
+    # Funktionale Systeme, deren Namenskonventionen auf den Bezeichner zutreffen, jeweils mit dem Index des ersten zutreffenden Ausdrucks
     result_dict = dict()
-    results_dict_ts = dict()
-
-    # Funktionale Systeme
-    system_naming_conventions_import['Automation System'] = []
-    system_naming_conventions_import['Data System'] = []
-    system_naming_conventions_import['Electrical System'] = []
-    system_naming_conventions_import['Safety System'] = []
-    system_naming_conventions_import['Fluid System'] = []
-    system_naming_conventions_import['Drainage System'] = ['[\w\- ]*regenwasser[\w\- ]*', '[\w\- ]*brauchwasser[\w\- ]*']
-    system_naming_conventions_import['Sanitary System'] = ['[\w\- ]*trinkwasser[\w\- ]*', '[\w\- ]*pwc[\w\- ]*', '[\w\- ]*pwh[\w\- ]*', '[\w\- ]*abwasser[\w\- ]*', '[\w\- ]*schmutzwasser[\w\- ]*']
-    system_naming_conventions_import['Ventilation System'] = ['v_[\w\- ]*', '[\w\- ]*ods[\w\- ]*', '[\w\- ]*eta[\w\- ]*', '[\w\- ]*eoa[\w\- ]*', '[\w\- ]*sea[\w\- ]*', '[\w\- ]*eha[\w\- ]*',
-                                                              '[\w\- ]*sup[\w\- ]*', '[\w\- ]*zuluft[\w\- ]*', '[\w\- ]*abluft[\w\- ]*', '[\w\- ]*fortluft[\w\- ]*',
-                                                              '[\w\- ]*aussenluft[\w\- ]*', '[\w\- ]*außenluft[\w\- ]*']
-    system_naming_conventions_import['Heating System'] = ['h_[\w\- ]*', 'hrl[\w\- ]*', 'hvl[\w\- ]*', '[\w\- ]*HRL[\w\- ]*', '[\w\- ]*HVL[\w\- ]*']
-    system_naming_conventions_import['Cooling System'] = ['c_[\w\- ]*', 'k_[\w\- ]*']
-
-    # Systemteile
-    tsystem_naming_conections_import['Heating System'] = {"Supply System": ['[\w\- ]*vorlauf[\w\- ]*', '[\w\- ]*vl[\w\- ]*'], "Return System": ['[\w\- ]*rücklauf[\w\- ]*', '\w*rl\w*']}
-
-    tsystem_naming_conections_import['Cooling System'] = {"Supply System": ['[\w\- ]*vorlauf[\w\- ]*', '[\w\- ]*vl[\w\- ]*'], "Return System": ['[\w\- ]*rücklauf[\w\- ]*', '\w*rl\w*']}
-
-    tsystem_naming_conections_import['Ventilation System'] = {"Supply System_1": ['[\w\- ]*zuluft[\w\- ]*', '[\w\- ]*sup[\w\- ]*'],
-                                                              "Return System_1": ['[\w\- ]*abluft[\w\- ]*','[\w\- ]*eth[\w\- ]*', '[\w\- ]*eta[\w\- ]*'],
-                                                              "Return System_2": ['[\w\- ]*fortluft[\w\- ]*', '[\w\- ]*ehh[\w\- ]*', '[\w\- ]*eha[\w\- ]*'],
-                                                              "Supply System_2": ['[\w\- ]*oda[\w\- ]*','[\w\- ]*aussenluft[\w\- ]*', '[\w\- ]*außenluft[\w\- ]*'],
-                                                              "Distribution System": ['[\w\- ]*sea[\w\- ]*']}
-
-    tsystem_naming_conections_import['Sanitary System'] = {"Return System": ['[\w\- ]*abwasser[\w\- ]*', '[\w\- ]*schmutzwasser[\w\- ]*'],
-                                                           "Supply System": ['[\w\- ]*trinkwasser[\w\- ]*', '[\w\- ]*pwc[\w\- ]*', '[\w\- ]*pwh[\w\- ]*']}
-
-    tsystem_naming_conections_import['Drainage System'] = {"Distribution System": ['[\w\- ]*regenwasser[\w\- ]*', '[\w\- ]*brauchwasser[\w\- ]*', '[\w\- ]*abwasser[\w\- ]*']}
-
-    # Kompilieren der regulären Ausdrücke
-    for key, values in system_naming_conventions_import.items():
-        result_dict[key] = list()
-        for value in values:
-            value = re.compile(value)
-            result_dict[key].append(value)
-
-    for fs_key, values in tsystem_naming_conections_import.items():
-        results_dict_ts[fs_key] = dict()
-        for ts_key, value in values.items():
-            tmp_list = list()
-            for val in value:
-                val = re.compile(val)
-                tmp_list.append(val)
-            results_dict_ts[fs_key][ts_key] = tmp_list
-
-    return result_dict, results_dict_ts
+    for fs, idx in match_system_patterns(get_system_classifier()['FS'], system_name):
+        if fs not in result_dict:
+            result_dict[fs] = idx
+    return result_dict
+
+
+def classify_technical_system(fs_classification, system_name):
+    # Erster Systemteil des funktionalen Systems, dessen Namenskonventionen auf den Bezeichner zutreffen
+    ts_patterns = get_system_classifier()['TS'].get(fs_classification)
+    if ts_patterns is None:
+        return None
+    matches = match_system_patterns(ts_patterns, system_name)
+    if matches:
+        return matches[0]
+    return None
 
 
 def check_for_functional_systems(info_dict, hierarchie_dict):
     # Anreicherung von funktionalen Systemen basierend auf den schwachen Zusammenshangkomponenten und den gegebenen IFC-Systemen
-    # Initialisierung der regulären Ausdrücke
-    system_naming_conventions, tmp = init_regex()
-
     system_dict = dict()
     # Betrachtung aller schwach zusammenhängender Systeme
     for key, system in info_dict['Systems'].items():
@@ -71,47 +184,36 @@ def check_for_functional_systems(info_dict, hierarchie_dict):
             continue
         set_ifc_systems = set(system['IFC-Systems'])
         matches_dict = dict()
-        # Kontrolle der IFC-Systeme auf Basis der regulären Ausdrücke
-        for fs, fs_regex_list in system_naming_conventions.items():
-            if not fs_regex_list:
+        # Klassifizierung der IFC-Systeme auf Basis der Namenskonventionen, je Bezeichner ein Durchlauf
+        name_matches = dict()
+        for s in set_ifc_systems:
+            if s:
+                name_matches[s] = classify_functional_system(s)
+
+        # Übernahme der IFC-Systeme, auf die der erste zutreffende Ausdruck des funktionalen Systems zutrifft
+        for fs in get_system_classifier()['Classes']:
+            fs_indices = [fs_matches[fs] for fs_matches in name_matches.values() if fs in fs_matches]
+            if not fs_indices:
                 continue
-            k = 0
-            for fs_regex in fs_regex_list:
-                if k == 1:
-                    continue
-                for s in set_ifc_systems:
-                    if s:
-                        # Übernahme der Informationen der IFC-Systeme in anzureichernde technische Systeme
-                        if re.match(fs_regex, s.lower()):
-                            if fs not in matches_dict:
-                                matches_dict[fs] = dict()
-                                matches_dict[fs]['Total'] = 1
-                                matches_dict[fs]['Components'] = []
-                                matches_dict[fs]['IFC-Systems'] = []
-
-                                ifc_systems_list = list(info_dict['IFC-Systems'].keys())
-                                for ifc_system in ifc_systems_list:
-                                    if ifc_system:
-                                        if s == ifc_system[0]:
-                                            s = ifc_system
-                                matches_dict[fs]['Components'].extend(info_dict['IFC-Systems'][s]['Components'])
-                                matches_dict[fs]['IFC-Systems'].append(s[0])
-
-                            else:
-                                matches_dict[fs]['Total'] += 1
-                                ifc_systems_list = list(info_dict['IFC-Systems'].keys())
-                                for ifc_system in ifc_systems_list:
-                                    if ifc_system:
-                                        if s == ifc_system[0]:
-                                            s = ifc_system
-                                matches_dict[fs]['Components'].extend(info_dict['IFC-Systems'][s]['Components'])
-                                matches_dict[fs]['IFC-Systems'].append(s[0])
-                            k = 1
+            first_index = min(fs_indices)
+            for s in set_ifc_systems:
+                if s and name_matches[s].get(fs) == first_index:
+                    # Übernahme der Informationen der IFC-Systeme in anzureichernde technische Systeme
+                    if fs not in matches_dict:
+                        matches_dict[fs] = dict()
+                        matches_dict[fs]['Total'] = 0
+                        matches_dict[fs]['Components'] = []
+                        matches_dict[fs]['IFC-Systems'] = []
+
+                    matches_dict[fs]['Total'] += 1
+                    ifc_system = info_dict['IFC-System names'][s]
+                    matches_dict[fs]['Components'].extend(info_dict['IFC-Systems'][ifc_system]['Components'])
+                    matches_dict[fs]['IFC-Systems'].append(ifc_system[0])
 
         # Überführung der Informationen in die festgelegte Ausgabestruktur
         # Anlegen eines Systemverbundes und untergeordneter funktionaler Systeme
         if len(matches_dict) > 1:
-            system_id = str(uuid.uuid4())
+            system_id = create_system_id('IS', *sorted(system['Components']))
             hierarchie_dict['IS'][system_id] = dict()
             hierarchie_dict['IS'][system_id]['Classification'] = None
             hierarchie_dict['IS'][system_id]['Components'] = system['Components']
@@ -126,7 +228,7 @@ def check_for_functional_systems(info_dict, hierarchie_dict):
                 system_dict[comp]['IS'].append(system_id)
 
             for system_classification, system_value in matches_dict.items():
-                fs_system_id = str(uuid.uuid4())
+                fs_system_id = create_system_id('FS', system_id, system_classification)
                 hierarchie_dict['FS'][fs_system_id] = dict()
                 hierarchie_dict['FS'][fs_system_id]['Classification'] = system_classification
                 hierarchie_dict['FS'][fs_system_id]['Components'] = system_value['Components']
@@ -144,7 +246,7 @@ def check_for_functional_systems(info_dict, hierarchie_dict):
 
         # Anlegen eines funktionalen Systems
         elif len(matches_dict) == 1:
-            system_id = str(uuid.uuid4())
+            system_id = create_system_id('FS', *sorted(system['Components']))
             hierarchie_dict['FS'][system_id] = dict()
             hierarchie_dict['FS'][system_id]['Classification'] = list(matches_dict.keys())[0]
             hierarchie_dict['FS'][system_id]['Components'] = system['Components']
@@ -164,9 +266,6 @@ def check_for_functional_systems(info_dict, hierarchie_dict):
 
 def check_for_technical_systems(hierarchie_dict, import_graph, system_dict):
     # Anreicherung von technischen Systemen basierend auf den schwachen Zusammenshangkomponenten und den gegebenen IFC-Systemen
-    # Initialisierung der regulären Ausdrücke
-    tmp, technicalsystem_naming_conventions = init_regex()
-
     # Vorbereitung der Anreicherung
     lookup_dict_technical_sytems = import_graph.nodes.data('ifc_system')
 
@@ -184,31 +283,24 @@ def check_for_technical_systems(hierarchie_dict, import_graph, system_dict):
     for fs_id, fs_value in hierarchie_dict['FS'].items():
         matches_dict = dict()
 
-        # Analyse der IFC-Systeme auf potentielle Matches
+        # Analyse der IFC-Systeme auf potentielle Matches, jedes IFC-System wird dem ersten zutreffenden Systemteil zugeordnet
         for ifc_system in fs_value['IFC-Systems']:
-            k = 0
             if not ifc_system:
                 continue
-            for ts, ts_regex_list in technicalsystem_naming_conventions[fs_value['Classification']].items():
-                if not ts_regex_list:
-                    continue
-                if k == 1:
-                    break
-                for ts_regex in ts_regex_list:
-                    if re.match(ts_regex, ifc_system.lower()):
-                        if ts in matches_dict:
-                            matches_dict[ts].append(ifc_system)
-                        else:
-                            matches_dict[ts] = list()
-                            matches_dict[ts].append(ifc_system)
-                        k = 1
-                        break
+            ts = classify_technical_system(fs_value['Classification'], ifc_system)
+            if ts is None:
+                continue
+            if ts in matches_dict:
+                matches_dict[ts].append(ifc_system)
+            else:
+                matches_dict[ts] = list()
+                matches_dict[ts].append(ifc_system)
 
         # Auswertung der Matches basierend auf dem Zusammenhang
         for match_key, match_systems in matches_dict.items():
             # Anlegen eines Systemteils
             if len(match_systems) == 1:
-                ts_id = str(uuid.uuid4())
+                ts_id = create_system_id('TS', fs_id, match_key)
                 hierarchie_dict['FS'][fs_id]['TS'].append(ts_id)
                 hierarchie_dict['TS'][ts_id] = dict()
 
@@ -238,7 +330,7 @@ def check_for_technical_systems(hierarchie_dict, import_graph, system_dict):
                 tmp_subgraph_weaklyconnsystems_list = sorted(nx.weakly_connected_components(tmp_subgraph), key=len, reverse=True)
 
                 if len(tmp_subgraph_weaklyconnsystems_list) == 1:
-                    ts_id = str(uuid.uuid4())
+                    ts_id = create_system_id('TS', fs_id, match_key)
                     hierarchie_dict['FS'][fs_id]['TS'].append(ts_id)
                     hierarchie_dict['TS'][ts_id] = dict()
 
@@ -262,7 +354,7 @@ def check_for_technical_systems(hierarchie_dict, import_graph, system_dict):
                 else:
                     for technical_system in tmp_subgraph_weaklyconnsystems_list:
 
-                        ts_id = str(uuid.uuid4())
+                        ts_id = create_system_id('TS', fs_id, match_key, *sorted(technical_system))
                         hierarchie_dict['FS'][fs_id]['TS'].append(ts_id)
                         hierarchie_dict['TS'][ts_id] = dict()
 
@@ -293,16 +385,11 @@ def check_for_technical_systems(hierarchie_dict, import_graph, system_dict):
 
 
 def get_comp_by_ifc_system(system_list, info_dict):
-    # Abfragen der Komponenten basierend auf dem übergebenen IFC-System
+    # Abfragen der Komponenten basierend auf dem übergebenen IFC-System über den Index der Bezeichner
     result_set = set()
-    ifc_system_list = list(info_dict['IFC-Systems'].keys())
     for system in system_list:
-        for ifc_system in ifc_system_list:
-            if not ifc_system:
-                continue
-            if system == ifc_system[0]:
-                result_set.update(set(info_dict['IFC-Systems'][ifc_system]['Components']))
-                break
+        if system in info_dict['IFC-System components']:
+            result_set.update(info_dict['IFC-System components'][system])
 
     return list(result_set)
 
@@ -414,6 +501,7 @@ def convert_import_graph_in_export_graph(import_graph, system_dict):
 
 def check_system_connections(import_graph, hierarchie_dict, system_dict):
     # Analyse der Schnittstellen der technischen Systeme
+    # Die Systeme an beiden Enden einer Kante werden direkt über system_dict abgefragt
     tmp_list = list()
     for sys_hier, systems in hierarchie_dict.items():
         if len(systems) <= 1:
@@ -421,8 +509,10 @@ def check_system_connections(import_graph, hierarchie_dict, system_dict):
                 sys_value['Schnittstellen'] = []
         else:
             comp_dict = dict()
-            for sys_key, sys_value in systems.items():
+            rank_dict = dict()
+            for rank, (sys_key, sys_value) in enumerate(systems.items()):
                 comp_dict[sys_key] = set(sys_value['Components'])
+                rank_dict[sys_key] = rank
                 sys_value['Schnittstellen'] = []
 
             connected_edges = set()
@@ -433,113 +523,148 @@ def check_system_connections(import_graph, hierarchie_dict, system_dict):
                 if systems_0 == systems_1:
                     continue
 
-                for sys_key, sys_comp in comp_dict.items():
-                    if edge[0] in sys_comp:
-                        for sys_key_2, sys_comp_2 in comp_dict.items():
-                            if sys_key == sys_key_2:
-                                continue
-                            if edge[1] in sys_comp_2:
-                                if edge not in connected_edges and (edge[1], edge[0]) not in connected_edges:
-                                    systems[sys_key]['Schnittstellen'].append(sys_key_2)
-                                    systems[sys_key_2]['Schnittstellen'].append(sys_key)
-                                    connected_edges.add(edge)
-
-                                    tmp_dict = {
-                                        'Source_System': sys_key,
-                                        'Target_System': sys_key_2,
-                                        'Source_Component': edge[0],
-                                        'Target_Component': edge[1]
-                                    }
-                                    tmp_list.append(tmp_dict)
-                    if edge[1] in sys_comp:
-                        for sys_key_2, sys_comp_2 in comp_dict.items():
-                            if sys_key == sys_key_2:
-                                continue
-                            if edge[0] in sys_comp_2:
-                                if edge not in connected_edges and (edge[1], edge[0]) not in connected_edges:
-                                    systems[sys_key]['Schnittstellen'].append(sys_key_2)
-                                    systems[sys_key_2]['Schnittstellen'].append(sys_key)
-                                    connected_edges.add(edge)
-
-                                    tmp_dict = {
-                                        'Source_System': sys_key,
-                                        'Target_System': sys_key_2,
-                                        'Source_Component': edge[0],
-                                        'Target_Component': edge[1]
-                                    }
-                                    tmp_list.append(tmp_dict)
+                if (edge[1], edge[0]) in connected_edges:
+                    continue
+
+                # Systeme, denen die Komponenten zugeordnet sind, in der Reihenfolge der Systemhierarchie
+                systems_0 = sorted([sys_key for sys_key in systems_0 if sys_key in comp_dict and edge[0] in comp_dict[sys_key]], key=rank_dict.get)
+                systems_1 = sorted([sys_key for sys_key in systems_1 if sys_key in comp_dict and edge[1] in comp_dict[sys_key]], key=rank_dict.get)
+
+                # Auswahl des ersten Systempaars, in dem die Komponenten unterschiedlichen Systemen angehören
+                interface = None
+                for sys_key in sorted(set(systems_0) | set(systems_1), key=rank_dict.get):
+                    if sys_key in systems_0:
+                        for sys_key_2 in systems_1:
+                            if sys_key != sys_key_2:
+                                interface = (sys_key, sys_key_2)
+                                break
+                    if interface is None and sys_key in systems_1:
+                        for sys_key_2 in systems_0:
+                            if sys_key != sys_key_2:
+                                interface = (sys_key, sys_key_2)
+                                break
+                    if interface is not None:
+                        break
+
+                if interface is None:
+                    continue
+
+                systems[interface[0]]['Schnittstellen'].append(interface[1])
+                systems[interface[1]]['Schnittstellen'].append(interface[0])
+                connected_edges.add(edge)
+
+                tmp_dict = {
+                    'Source_System': interface[0],
+                    'Target_System': interface[1],
+                    'Source_Component': edge[0],
+                    'Target_Component': edge[1]
+                }
+                tmp_list.append(tmp_dict)
 
     hierarchie_dict['Schnittstellen'] = tmp_list
     return hierarchie_dict
 
 
+def update_aggregated_nodes(directed_graph, source, target, removed_nodes_set):
+    # Übernahme der bereits an einer Kante aggregierten Knoten
+    try:
+        removed_nodes_set.update(directed_graph.edges[source, target]['aggregated_nodes'])
+    except KeyError:
+        pass
+
+
+def is_chain_node(directed_graph, node, complete_set):
+    # Kontrolle, ob der Knoten Teil einer Kette mit genau einem Vorgänger und einem abweichenden Nachfolger ist
+    if directed_graph.nodes[node]['ifc_class'] not in complete_set:
+        return False
+    if directed_graph.in_degree(node) != 1 or directed_graph.out_degree(node) != 1:
+        return False
+
+    return next(iter(directed_graph.pred[node])) != next(iter(directed_graph.succ[node]))
+
+
 def aggregate_graph(directed_graph):
     # Aggregation des gerichteten Graphs
-    # Vorbereitung der Aggregation
-    aggregated_directed_graph = directed_graph.copy()
-    aggregated_directed_graph_nodes = list(aggregated_directed_graph.nodes(data=True))
+    # Die Aggregation erfolgt ohne Kopie auf dem übergebenen Graph, betroffene Nachbarn werden erneut geprüft, bis keine weitere Aggregation möglich ist
 
     # Festlegung von Elementklassifizierungen die aggregiert werden dürfen
     segment_set = {'IfcPipeSegment', 'IfcDuctSegment'}
     fitting_set = {'IfcPipeFitting', 'IfcDuctFitting'}
     complete_set = segment_set.union(fitting_set)
 
+    # Vorbereitung der Aggregation
+    queue = deque(directed_graph.nodes)
+    queued_set = set(queue)
+
     # Startpunkt der Aggragation
-    for node in aggregated_directed_graph_nodes:
+    while queue:
+        node = queue.popleft()
+        queued_set.discard(node)
+        if node not in directed_graph:
+            continue
+
         # Abrufen der Nachbarn des Knotens
-        pre_edges = list(aggregated_directed_graph.predecessors(node[0]))
-        suc_edges = list(aggregated_directed_graph.successors(node[0]))
+        pre_edges = list(directed_graph.predecessors(node))
+        suc_edges = list(directed_graph.successors(node))
         complete_edges = list(set(pre_edges) | set(suc_edges))
+        changed_nodes = []
 
         # Aggregation
-        if node[1]['ifc_class'] in complete_set:
-            if len(complete_edges) == 0:
-                aggregated_directed_graph.remove_node(node[0])
-            elif len(complete_edges) == 1:
-                aggregated_directed_graph.remove_node(node[0])
-            elif len(pre_edges) == 1 and len(suc_edges) == 1:
-                removed_nodes_set = set()
-                try:
-                    removed_nodes_set.update(aggregated_directed_graph.edges[pre_edges[0], node[0]]['aggregated_nodes'])
-                except KeyError:
-                    pass
+        if directed_graph.nodes[node]['ifc_class'] in complete_set:
+            if len(complete_edges) <= 1:
+                directed_graph.remove_node(node)
+                changed_nodes = complete_edges
 
-                try:
-                    removed_nodes_set.update(aggregated_directed_graph.edges[node[0], suc_edges[0]]['aggregated_nodes'])
-                except KeyError:
-                    pass
-
-                removed_nodes_set.add(node[0])
-                aggregated_directed_graph.remove_node(node[0])
-                aggregated_directed_graph.add_edge(pre_edges[0], suc_edges[0], aggregated_nodes=list(removed_nodes_set))
+            elif len(pre_edges) == 1 and len(suc_edges) == 1:
+                # Bestimmung der maximalen Kette aus Segmenten und Formteilen, die den Knoten enthält
+                chain = deque([node])
+                chain_set = {node}
+                start = pre_edges[0]
+                while start not in chain_set and is_chain_node(directed_graph, start, complete_set):
+                    chain.appendleft(start)
+                    chain_set.add(start)
+                    start = next(iter(directed_graph.pred[start]))
+
+                end = suc_edges[0]
+                while end not in chain_set and is_chain_node(directed_graph, end, complete_set):
+                    chain.append(end)
+                    chain_set.add(end)
+                    end = next(iter(directed_graph.succ[end]))
+
+                # Zusammenfassen der Kette zu einer einzelnen Kante
+                removed_nodes_set = set(chain)
+                update_aggregated_nodes(directed_graph, start, chain[0], removed_nodes_set)
+                for idx in range(len(chain) - 1):
+                    update_aggregated_nodes(directed_graph, chain[idx], chain[idx + 1], removed_nodes_set)
+                update_aggregated_nodes(directed_graph, chain[-1], end, removed_nodes_set)
+
+                directed_graph.remove_nodes_from(chain)
+
+                # Geschlossene Ketten und Ketten, die zum selben Knoten zurückführen, werden ohne Kante entfernt
+                if start not in chain_set:
+                    if start != end:
+                        directed_graph.add_edge(start, end, aggregated_nodes=list(removed_nodes_set))
+                    changed_nodes = [start, end]
 
             elif len(complete_edges) == 2:
                 removed_nodes_set = set()
-                try:
-                    removed_nodes_set.update(aggregated_directed_graph.edges[node[0], complete_edges[0]]['aggregated_nodes'])
-                except KeyError:
-                    pass
-
-                try:
-                    removed_nodes_set.update(aggregated_directed_graph.edges[complete_edges[0], node[0]]['aggregated_nodes'])
-                except KeyError:
-                    pass
-
-                try:
-                    removed_nodes_set.update(aggregated_directed_graph.edges[node[0], complete_edges[1]]['aggregated_nodes'])
-                except KeyError:
-                    pass
-
-                try:
-                    removed_nodes_set.update(aggregated_directed_graph.edges[complete_edges[1], node[0]]['aggregated_nodes'])
-                except KeyError:
-                    pass
-
-                removed_nodes_set.add(node[0])
-                aggregated_directed_graph.remove_node(node[0])
-                aggregated_directed_graph.add_edge(complete_edges[0], complete_edges[1], aggregated_nodes=list(removed_nodes_set))
+                update_aggregated_nodes(directed_graph, node, complete_edges[0], removed_nodes_set)
+                update_aggregated_nodes(directed_graph, complete_edges[0], node, removed_nodes_set)
+                update_aggregated_nodes(directed_graph, node, complete_edges[1], removed_nodes_set)
+                update_aggregated_nodes(directed_graph, complete_edges[1], node, removed_nodes_set)
+
+                removed_nodes_set.add(node)
+                directed_graph.remove_node(node)
+                directed_graph.add_edge(complete_edges[0], complete_edges[1], aggregated_nodes=list(removed_nodes_set))
+                changed_nodes = complete_edges
         else:
             if len(complete_edges) == 0:
-                aggregated_directed_graph.remove_node(node[0])
+                directed_graph.remove_node(node)
+
+        # Erneute Prüfung der Nachbarn, deren Verbindungen sich geändert haben
+        for changed_node in changed_nodes:
+            if changed_node not in queued_set:
+                queue.append(changed_node)
+                queued_set.add(changed_node)
 
-    return aggregated_directed_graph
+    return directed_graph
@@ -6,6 +6,16 @@ from helper_analyse import *
 from helper_enrich import *
 
 
+# Fester Ausgangswert des Namespaces der deterministischen Bezeichner, wenn kein Namespace angegeben ist
+# Der Inhalt der Eingabedateien fließt bewusst nicht ein, damit unveränderte Komponenten über Revisionen hinweg dieselben Bezeichner behalten
+ID_NAMESPACE_SEED = 'IFC2TSO'
+
+
+def get_id_namespace(args):
+    # Ableitung des Namespaces der deterministischen Bezeichner aus dem festen Ausgangswert, entsprechend dem Prozess ohne angegebenen Namespace
+    return uuid.uuid5(uuid.NAMESPACE_URL, ID_NAMESPACE_SEED)
+
+
 def main(args):
     # GRAPH Prozess
     # Konfiguration des Logs
@@ -18,6 +28,28 @@ def main(args):
 
     logging.info('Process started with options %r', args)
 
+    # Kontrolle der optionalen Abhängigkeit des binären Austauschformats
+    if args.bin and msgpack is None:
+        return logging.warning('The binary graph format requires the package msgpack')
+
+    if args.det_ids:
+        # Ableitung deterministischer Bezeichner, damit wiederholte Überführungen identische und vergleichbare Ausgaben erzeugen
+        id_namespace = get_id_namespace(args)
+        set_system_id_namespace(id_namespace)
+
+    if args.naming:
+        # Import der Namenskonventionen zur Erkennung der funktionalen Systeme und Systemteile
+        logging.info('Naming conventions are being imported')
+        if not args.naming.lower().endswith(('.json', '.yml', '.yaml')):
+            return logging.warning('The given naming conventions are not in the *.json or *.yaml Format')
+        if not args.naming.lower().endswith('.json') and yaml is None:
+            return logging.warning('Naming conventions in the YAML format require the package PyYAML')
+        try:
+            set_system_naming_conventions(load_system_naming_conventions(args.naming))
+        except (OSError, ValueError, KeyError, TypeError, AttributeError, re.error) as error:
+            return logging.warning('The given naming conventions could not be handled: %s', error)
+        logging.info('Naming conventions were successfully imported')
+
     #                           #
     #                           #
     #                           #
@@ -25,8 +57,26 @@ def main(args):
     #                           #
     #                           #
     #                           #
+    # Die importierten Graphen werden direkt zusammengeführt, sodass nicht alle Graphen gleichzeitig im Speicher vorgehalten werden
     import_graph = nx.DiGraph()
+    conflict_dict = dict()
     for input_file in args.input_file:
+        # Import eines binär abgelegten Graphs, dessen Syntax durch das Format vorgegeben ist
+        if input_file.lower().endswith('.msgpack'):
+            if msgpack is None:
+                return logging.warning('The binary graph format requires the package msgpack')
+
+            logging.info('Graph is getting imported from the binary format')
+            try:
+                graph, extra_dict = read_graph_binary(input_file)
+            except (ValueError, KeyError):
+                return logging.warning('The given input could not be handled as binary graph')
+
+            merge_into_graph(import_graph, graph.nodes(data=True), graph.edges(data=True), conflict_dict)
+            del graph
+            logging.info('Graph was successfully imported')
+            continue
+
         # Überprüfen ob es sich bei der zu importierenden Datei um eine Datei im JSON-Format handelt
         if not input_file.lower().endswith('.json'):
             return logging.warning('The given Input is not in the *.json Format')
@@ -57,16 +107,20 @@ def main(args):
 
         logging.info('Graph was parsed successfully')
 
-        # Überführung der Daten in einen gerichteten Graph
+        # Überführung der Daten in den gemeinsamen gerichteten Graph
         logging.info('Graph is getting imported using networkx')
         try:
-            import_graph.add_nodes_from(parse_nodes_list)
-            import_graph.add_edges_from(parse_edges_list)
+            merge_into_graph(import_graph, parse_nodes_list, parse_edges_list, conflict_dict)
         except ValueError:
             return logging.warning('The graph could not be imported using networkx')
+        del graph_json, parse_nodes_list, parse_edges_list
 
         logging.info('Graph was successfully imported')
 
+    # Meldung der Knoten, die mit abweichenden Attributen in mehreren Graphen enthalten sind
+    for node, conflicts in conflict_dict.items():
+        logging.warning('Node %s is contained in several graphs with conflicting attributes: %s', node, ', '.join(sorted(conflicts)))
+
     #                            #
     #                            #
     #                            #
@@ -166,7 +220,7 @@ def main(args):
     if args.bcf_sh:
         logging.info('Results of the enrichment are being exported as bcf files.')
         mapping = {'IS': 'FS', 'FS': 'TS', 'TS': 'TS'}
-        bcf_guids = []
+        bcf_list = []
         for hier_level, system_dict_2 in hierarchie_dict.items():
             for system_guid, system_value in system_dict_2.items():
                 transfer_dict = {'Selections': system_value['Components'],
@@ -174,8 +228,8 @@ def main(args):
                                  'Description': 'Ifc-Systems %s of components' % (system_value['IFC-Systems']),
                                  'Visibility': 'True',
                                  'Exceptions': []}
-                bcf_guids.append(create_bcf(transfer_dict, args, zipped=False))
-        zip_bcfs(bcf_guids, args, zipped=False)
+                bcf_list.append(transfer_dict)
+        create_bcf_collection(bcf_list, args)
         logging.info('Results of the enrichment were successfully exported as bcf files.')
 
     hierarchie_dict = check_system_connections(import_graph, hierarchie_dict, system_dict)
@@ -196,26 +250,24 @@ def main(args):
     # Komplexitätsreduktion des Graphs
     if args.cr:
         logging.info('Topological complexity of the graph is being reduced.')
-        len_nodes_before = 1
-        len_nodes_after = 0
-        while len_nodes_before != len_nodes_after:
-            len_nodes_before = len(export_graph.nodes)
-            export_graph = aggregate_graph(export_graph)
-            len_nodes_after = len(export_graph.nodes)
+        aggregate_graph(export_graph)
         logging.info('Topological complexity of the graph was successfully reduced.')
 
     # Export der Analyse- und Anreicherungsergebnisse im TXT-Format
-    name = str(uuid.uuid4())
+    name = create_system_id('ENRICHED_GRAPH')
     if args.i:
         logging.info('Information about the model is being saved')
         write_infos(info_dict, hierarchie_dict, args, name)
         logging.info('Information about the model was successfully saved')
 
-    # Export des Graphs in Knoten-/Kantenliste Darstellung und Ablage als JSON-Datei
-    data_drop = nx.node_link_data(export_graph)
-    data_drop['hierarchy'] = hierarchie_dict
-    with open(os.path.dirname(args.input_file[0]) + '/ENRICHED_GRAPH_' + name + '.json', 'w', encoding='utf8') as json_file:
-        json.dump(data_drop, json_file, ensure_ascii=False)
+    # Export des Graphs in Knoten-/Kantenliste Darstellung und Ablage als JSON-Datei oder binär
+    if args.bin:
+        write_graph_binary(export_graph, os.path.dirname(args.input_file[0]) + '/ENRICHED_GRAPH_' + name + '.msgpack', {'hierarchy': hierarchie_dict})
+    else:
+        data_drop = nx.node_link_data(export_graph)
+        data_drop['hierarchy'] = hierarchie_dict
+        with open(os.path.dirname(args.input_file[0]) + '/ENRICHED_GRAPH_' + name + '.json', 'w', encoding='utf8') as json_file:
+            json.dump(data_drop, json_file, ensure_ascii=False)
     logging.info('Graph was successfully saved')
 
 
@@ -224,7 +276,7 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description='Enrich the hierarchical information in the given graph, reduce the topological complexity and save to a directed graph')
 
     # Pfad zum Graph
-    parser.add_argument('input_file', nargs='+', type=str, help='Path to the input graph as a JSON-file')
+    parser.add_argument('input_file', nargs='+', type=str, help='Path to the input graph as a JSON-file or binary MessagePack-file')
 
     # Ablage der Analyseergebnisse der enthaltenen Informationen zu technischen Systemen als Datei im TXT-Format am Pfad des Graphs.
     parser.add_argument('-i', action='store_true', help='Saving information about the graph in as *.txt at the give input directory')
@@ -241,12 +293,21 @@ if __name__ == "__main__":
     # Hinzufügen zusätzlicher Systemhierarchie in den importierten Graph.
     parser.add_argument('-add_sh', type=str, default=None, help='Add system hierarchy based on the given json file')
 
+    # Namenskonventionen zur Erkennung der funktionalen Systeme und Systemteile anhand der Bezeichner der IFC-Systeme als Datei im JSON- oder YAML-Format.
+    parser.add_argument('-naming', type=str, default=None, help='Recognise functional and technical systems using the naming conventions in the given json or yaml file')
+
     # Ablage der Anreicherungsergebnisse zu [...] als BCF- Datei am Pfad des Graphs.
     parser.add_argument('-bcf_sh', action='store_true', help='Create bcf-files of the system hierarchy')
 
     # Durchführen der Prozesse im Bereich der Komplexitätsreduktion.
     parser.add_argument('-cr', action='store_true', help='Reduction of the complexity given the topological information in the graph')
 
+    # Vergabe deterministischer Bezeichner (UUIDv5) für Systeme, abgeleitet aus dem Inhalt der Eingabedateien und den GUIDs der Komponenten.
+    parser.add_argument('-det_ids', action='store_true', help='Derive reproducible identifiers from the input files and component GUIDs instead of random ones')
+
+    # Ablage des Graphs im binären MessagePack-Format mit spaltenweise abgelegten Knoten und Kanten anstelle des JSON-Formats.
+    parser.add_argument('-bin', action='store_true', help='Save the enriched graph in the binary MessagePack format (*.msgpack) instead of JSON')
+
     parse_args = parser.parse_args()
 
     # Aufruf des GRAPH Prozesses mit den notwendigen und optionalen Parametern zur Anpassung der Funktionalität
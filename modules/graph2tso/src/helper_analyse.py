@@ -1,13 +1,30 @@
 import os
+import io
 import networkx as nx
 
 from lxml import etree as ET
-import shutil
 from zipfile import ZipFile
 from datetime import datetime
 import uuid
 
 
+# Snapshot der BCF-Dateien, wird beim ersten Export eingelesen
+BCF_SNAPSHOT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'snapshot.png')
+BCF_SNAPSHOT = None
+
+
+# Optionale Abhängigkeit für den binären Austausch der Graphen zwischen den Prozessschritten
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+# Kennung, Version und Attribute mit häufig wiederkehrenden Werten des binären Austauschformats der Graphen
+GRAPH_BINARY_FORMAT = 'IFC2TSO-GRAPH'
+GRAPH_BINARY_VERSION = 1
+GRAPH_BINARY_INTERNED_ATTRIBUTES = {'ifc_class', 'ifc_type', 'ifc_system', 'ifc_description'}
+
+
 def check_import_graph_syntax(graph_json):
     # Analyse der Syntax des Inputs
     # Überprüfe ob graph_json die Bezeichner 'nodes' und 'links' hat
@@ -57,6 +74,104 @@ def check_import_graph_syntax(graph_json):
     return None
 
 
+def intern_value(value, value_list, value_index):
+    # Ablage eines Werts in der Werteliste, gleiche Werte werden nur einmal abgelegt und über ihren Index referenziert
+    if value is None:
+        return None
+    key = tuple(value) if isinstance(value, list) else value
+    if key not in value_index:
+        value_index[key] = len(value_list)
+        value_list.append(value)
+    return value_index[key]
+
+
+def get_attribute_columns(data_list, value_list, value_index):
+    # Spaltenweise Ablage der Attribute von Knoten oder Kanten, fehlende Attribute werden über ihren Zeilenindex vermerkt
+    column_dict = dict()
+    missing_dict = dict()
+    attr_names = dict.fromkeys(attr_name for data in data_list for attr_name in data)
+    for attr_name in attr_names:
+        interned = attr_name in GRAPH_BINARY_INTERNED_ATTRIBUTES
+        column = []
+        for idx, data in enumerate(data_list):
+            if attr_name not in data:
+                missing_dict.setdefault(attr_name, []).append(idx)
+                column.append(None)
+            elif interned:
+                column.append(intern_value(data[attr_name], value_list, value_index))
+            else:
+                column.append(data[attr_name])
+        column_dict[attr_name] = column
+
+    return column_dict, missing_dict
+
+
+def set_attribute_columns(data_list, column_dict, missing_dict, value_list):
+    # Wiederherstellung der Attribute von Knoten oder Kanten aus der spaltenweisen Ablage
+    for attr_name, column in column_dict.items():
+        missing_set = set(missing_dict.get(attr_name, []))
+        interned = attr_name in GRAPH_BINARY_INTERNED_ATTRIBUTES
+        for idx, value in enumerate(column):
+            if missing_set and idx in missing_set:
+                continue
+            if interned and value is not None:
+                value = value_list[value]
+            data_list[idx][attr_name] = value
+
+
+def write_graph_binary(graph, file_path, extra_dict=None):
+    # Export des Graphs im binären MessagePack-Format als Knoten- und Kantentabellen
+    # Häufig wiederkehrende Werte (Klassen, Typen, Systeme, Beschreibungen) werden nur einmal abgelegt
+    value_list = []
+    value_index = dict()
+    node_list = list(graph.nodes)
+    node_position = {node: idx for idx, node in enumerate(node_list)}
+    node_columns, node_missing = get_attribute_columns([data for node, data in graph.nodes(data=True)], value_list, value_index)
+
+    edge_list = []
+    edge_data_list = []
+    for source, target, data in graph.edges(data=True):
+        edge_list.append(node_position[source])
+        edge_list.append(node_position[target])
+        edge_data_list.append(data)
+    edge_columns, edge_missing = get_attribute_columns(edge_data_list, value_list, value_index)
+
+    graph_dict = {'format': GRAPH_BINARY_FORMAT, 'version': GRAPH_BINARY_VERSION, 'graph': graph.graph, 'values': value_list,
+                  'nodes': node_list, 'node_attributes': node_columns, 'node_missing': node_missing,
+                  'edges': edge_list, 'edge_attributes': edge_columns, 'edge_missing': edge_missing, 'extra': extra_dict or dict()}
+    with open(file_path, 'wb') as binary_file:
+        msgpack.pack(graph_dict, binary_file, use_bin_type=True)
+
+
+def read_graph_binary(file_path, graph=None):
+    # Import eines im binären MessagePack-Format abgelegten Graphs und der zusätzlich abgelegten Informationen, optional in einen bestehenden Graph
+    # Gemeinsam referenzierte Werte werden als Tupel wiederhergestellt, da sie von mehreren Knoten geteilt werden
+    with open(file_path, 'rb') as binary_file:
+        graph_dict = msgpack.unpack(binary_file, raw=False, strict_map_key=False)
+
+    if not isinstance(graph_dict, dict) or graph_dict.get('format') != GRAPH_BINARY_FORMAT:
+        raise ValueError('The given input is not a valid binary graph')
+    if graph_dict['version'] != GRAPH_BINARY_VERSION:
+        raise ValueError('The version of the binary graph is not supported')
+
+    value_list = [tuple(value) if isinstance(value, list) else value for value in graph_dict['values']]
+    node_list = graph_dict['nodes']
+    node_data_list = [dict() for node in node_list]
+    set_attribute_columns(node_data_list, graph_dict['node_attributes'], graph_dict['node_missing'], value_list)
+
+    edge_list = graph_dict['edges']
+    edge_data_list = [dict() for idx in range(len(edge_list) // 2)]
+    set_attribute_columns(edge_data_list, graph_dict['edge_attributes'], graph_dict['edge_missing'], value_list)
+
+    if graph is None:
+        graph = nx.DiGraph()
+    graph.graph.update(graph_dict['graph'])
+    graph.add_nodes_from(zip(node_list, node_data_list))
+    graph.add_edges_from((node_list[edge_list[2 * idx]], node_list[edge_list[2 * idx + 1]], data) for idx, data in enumerate(edge_data_list))
+
+    return graph, graph_dict['extra']
+
+
 def check_import_graph_info(import_graph):
     # Analyse der Informationen des Inputs
     info_dict = dict()
@@ -97,10 +212,18 @@ def write_infos(input_list, args):
 
 
 # Funktionen zum Anlagen von BCF-Datein
-def create_bcf(bcf_dict, args, zipped=True):
-    # Erstellung einer BCF_Datei der Version 2.1
-    # Strukur der BCF-Datei kann der Dokumentation von buildingSMART entnommen werden
+def get_bcf_snapshot():
+    # Einlesen des Snapshots der BCF-Dateien, dieser wird nur einmal gelesen und für alle Themen verwendet
+    global BCF_SNAPSHOT
+    if BCF_SNAPSHOT is None:
+        with open(BCF_SNAPSHOT_PATH, 'rb') as snapshot_file:
+            BCF_SNAPSHOT = snapshot_file.read()
+    return BCF_SNAPSHOT
+
 
+def write_bcf_topic(zips, bcf_dict):
+    # Erstellung eines Themas einer BCF-Datei der Version 2.1 im Arbeitsspeicher und direkte Ablage in der geöffneten ZIP-Datei
+    # Strukur der BCF-Datei kann der Dokumentation von buildingSMART entnommen werden
     input_dict = dict()
     input_dict['markup'] = dict()
     input_dict['markup']['guid'] = str(uuid.uuid4())
@@ -117,76 +240,39 @@ def create_bcf(bcf_dict, args, zipped=True):
     input_dict['viewpoint']['Selections'] = bcf_dict['Selections']
 
     main_guid = input_dict['markup']['guid']
+    zips.writestr(main_guid + '/', b'')
+    zips.writestr(main_guid + '/markup.bcf', create_bcf_markup(input_dict['markup']))
+    zips.writestr(main_guid + '/viewpoint.bcfv', create_bcf_viewpoint(input_dict['viewpoint']))
+    zips.writestr(main_guid + '/snapshot.png', get_bcf_snapshot())
 
-    filepath_1 = os.path.dirname(args.input_file[0]) + '/' + main_guid
-    filepath_2 = os.path.dirname(args.input_file[0]) + '/' + main_guid + '/' + main_guid
-
-    filepath_version = filepath_1 + '/bcf.version'
-    filepath_markup = filepath_2 + '/markup.bcf'
-    filepath_viewpoint = filepath_2 + '/viewpoint.bcfv'
-
-    os.mkdir(filepath_1)
-    os.mkdir(filepath_2)
-
-    create_bcf_version(filepath_version)
-    create_bcf_markup(input_dict['markup'], filepath_markup)
-    create_bcf_viewpoint(input_dict['viewpoint'], filepath_viewpoint)
-
-    shutil.copyfile('snapshot.png', os.path.dirname(args.input_file[0]) + '/' + main_guid + '/' + main_guid + '/snapshot.png')
-
-    if zipped:
-        zip_bcfs([main_guid], args, zipped)
-
-    else:
-        return main_guid
-
+    return main_guid
 
-def zip_bcfs(list_guid, args, zipped):
-    # Komprimierung der erstellten BCF-Dateien
 
-    # Erstellung einer komprimierten BCF-Datei mit mehreren untergeordneten Dateien
-    if not zipped:
-        now = datetime.now()
-        folder_name = str(uuid.uuid4())
-        os.mkdir(os.path.dirname(args.input_file[0]) + '/' + folder_name)
-        for main_guid in list_guid:
-            shutil.move(os.path.dirname(args.input_file[0]) + '/' + main_guid + '/' + main_guid, os.path.dirname(args.input_file[0]) + '/' + folder_name + '/' + main_guid)
-            shutil.move(os.path.dirname(args.input_file[0]) + '/' + main_guid + '/bcf.version', os.path.dirname(args.input_file[0]) + '/' + folder_name + '/bcf.version')
-            shutil.rmtree(os.path.dirname(args.input_file[0]) + '/' + main_guid, ignore_errors=True)
+def create_bcf(bcf_dict, args):
+    # Erstellung einer BCF-Datei mit einem Thema, als Bezeichner wird die GUID des Themas verwendet
+    zip_buffer = io.BytesIO()
+    with ZipFile(zip_buffer, 'w') as zips:
+        zips.writestr('bcf.version', create_bcf_version())
+        main_guid = write_bcf_topic(zips, bcf_dict)
+    with open(os.path.dirname(args.input_file[0]) + '/' + main_guid + '.bcf', 'wb') as bcf_file:
+        bcf_file.write(zip_buffer.getvalue())
 
-        os.chdir(os.path.dirname(args.input_file[0]) + '/' + folder_name)
-        with ZipFile(folder_name + '.bcf', 'w') as zips:
-            zips.write('bcf.version')
-            for main_guid in list_guid:
-                zips.write(main_guid)
-                zips.write(main_guid + '/markup.bcf')
-                zips.write(main_guid + '/viewpoint.bcfv')
-                zips.write(main_guid + '/snapshot.png')
+    return main_guid
 
-        os.chdir('..')
-        os.chdir('..')
-        shutil.move(os.path.dirname(args.input_file[0]) + '/' + folder_name + '/' + folder_name + '.bcf', os.path.dirname(args.input_file[0]) + '/' + folder_name + '.bcf')
-        shutil.rmtree(os.path.dirname(args.input_file[0]) + '/' + folder_name, ignore_errors=True)
 
-    # Erstellung einer komprimierten BCF-Datei für jede untergeordnete Datei
-    else:
-        for main_guid in list_guid:
-            os.chdir(os.path.dirname(args.input_file[0]) + '/' + main_guid)
-            with ZipFile(main_guid + '.bcf', 'w') as zips:
-                zips.write('bcf.version')
-                zips.write(main_guid)
-                zips.write(main_guid + '/markup.bcf')
-                zips.write(main_guid + '/viewpoint.bcfv')
-                zips.write(main_guid + '/snapshot.png')
+def create_bcf_collection(bcf_dict_list, args):
+    # Erstellung einer BCF-Datei mit mehreren Themen, die nacheinander in eine gemeinsame ZIP-Datei geschrieben werden
+    folder_name = str(uuid.uuid4())
+    with ZipFile(os.path.dirname(args.input_file[0]) + '/' + folder_name + '.bcf', 'w') as zips:
+        zips.writestr('bcf.version', create_bcf_version())
+        for bcf_dict in bcf_dict_list:
+            write_bcf_topic(zips, bcf_dict)
 
-            os.chdir("..")
-            shutil.move(main_guid + '/' + main_guid + '.bcf', main_guid + '.bcf')
-            shutil.rmtree(main_guid, ignore_errors=True)
-            os.chdir("..")
+    return folder_name
 
 
-def create_bcf_viewpoint(input_dict, link):
-    # Erstellung der viewpoint.bcfv als Teil einer BCF-Datei
+def create_bcf_viewpoint(input_dict):
+    # Erstellung der viewpoint.bcfv als Teil einer BCF-Datei im Arbeitsspeicher
 
     output = ET.ElementTree()
     visualizationinfo = ET.Element('VisualizationInfo', Guid=input_dict['guid'])
@@ -220,13 +306,12 @@ def create_bcf_viewpoint(input_dict, link):
     ET.SubElement(perspectivecamera, 'FieldOfView').text = '60'
 
     output._setroot(visualizationinfo)
-    output.write(link, encoding='utf-8', xml_declaration=True, pretty_print=True)
 
-    return -1
+    return ET.tostring(output, encoding='UTF-8', xml_declaration=True, pretty_print=True)
 
 
-def create_bcf_markup(input_dict, link):
-    # Erstellung der markup.bcf als Teil einer BCF-Datei
+def create_bcf_markup(input_dict):
+    # Erstellung der markup.bcf als Teil einer BCF-Datei im Arbeitsspeicher
 
     title_text = input_dict['title']
     description_text = input_dict['description']
@@ -257,12 +342,11 @@ def create_bcf_markup(input_dict, link):
     ET.SubElement(viewpoints, 'Snapshot').text = snapshot_text
 
     output._setroot(markup)
-    output.write(link, encoding='utf-8', xml_declaration=True, pretty_print=True)
 
-    return -1
+    return ET.tostring(output, encoding='UTF-8', xml_declaration=True, pretty_print=True)
 
 
-def create_bcf_version(link):
+def create_bcf_version():
     # Anlagen der Grundlagen einer BCF-Datei
 
     ns = 'http://www.w3.org/2001/XMLSchema-instance'
@@ -273,6 +357,5 @@ def create_bcf_version(link):
     ET.SubElement(version, 'DetailedVersion').text = "2.1"
 
     output._setroot(version)
-    output.write(link, encoding='utf-8', xml_declaration=True, pretty_print=True)
 
-    return -1
+    return ET.tostring(output, encoding='UTF-8', xml_declaration=True, pretty_print=True)
@@ -8,6 +8,16 @@ from helper_convert import *
 from helper_enrich import *
 
 
+# Fester Ausgangswert des Namespaces der deterministischen Bezeichner, wenn kein Namespace angegeben ist
+# Der Inhalt der Eingabedateien fließt bewusst nicht ein, damit unveränderte Komponenten über Revisionen hinweg dieselben Bezeichner behalten
+ID_NAMESPACE_SEED = 'IFC2TSO'
+
+
+def get_id_namespace(args):
+    # Ableitung des Namespaces der deterministischen Bezeichner aus dem angegebenen Namespace bzw. dem festen Ausgangswert
+    return uuid.uuid5(uuid.NAMESPACE_URL, args.use_ns or ID_NAMESPACE_SEED)
+
+
 def main(args):
     # Config logger
     if args.l:
@@ -17,6 +27,14 @@ def main(args):
     else:
         logging.basicConfig(level=logging.INFO, format='%(asctime)s | %(levelname)s | %(message)s')
 
+    if args.det_ids:
+        # Ableitung deterministischer Bezeichner, damit wiederholte Überführungen identische und vergleichbare Ausgaben erzeugen
+        id_namespace = get_id_namespace(args)
+        set_instance_id_namespace(id_namespace)
+
+    # Die URIRefs einer zuvor erfolgten Überführung werden verworfen
+    clear_uri_table()
+
     #                           #
     #                           #
     #                           #
@@ -28,6 +46,23 @@ def main(args):
     import_graph = nx.DiGraph()
     hierarchie_dict = dict()
     for input_file in args.input_file:
+        # Import eines binär abgelegten Graphs direkt in den gemeinsamen Graph, dessen Syntax durch das Format vorgegeben ist
+        if input_file.lower().endswith('.msgpack'):
+            if msgpack is None:
+                return logging.warning('The binary graph format requires the package msgpack')
+
+            logging.info('Graph is getting imported from the binary format')
+            try:
+                import_graph, extra_dict = read_graph_binary(input_file, import_graph)
+            except (ValueError, KeyError):
+                return logging.warning('The given input could not be handled as binary graph')
+
+            if 'hierarchy' not in extra_dict:
+                return logging.warning('The given input does not have the correct syntax. No system hierarchie is given.')
+            hierarchie_dict = extra_dict['hierarchy']
+            logging.info('Graph was successfully imported')
+            continue
+
         # Überprüfen ob es sich bei der zu importierenden Datei um eine Datei im JSON-Format handelt
         if not input_file.lower().endswith('.json'):
             return logging.warning('The given Input is not in the *.json Format')
@@ -154,7 +189,12 @@ def main(args):
             return logging.warning('The given input is not in the necessary IFC4 format.')
 
         logging.info('Model is getting analysed')
-        rep_dict = calculate_spatial_representation(main_model)
+        cache_path = None
+        if args.cache:
+            # Zwischenspeicher der Geometrie, der über den Inhalt des IFC-Modells identifiziert wird
+            os.makedirs(args.cache, exist_ok=True)
+            cache_path = os.path.join(args.cache, 'GEOM_' + calculate_file_hash(args.add_spatial) + '.npz')
+        rep_dict = calculate_spatial_representation(main_model, cache_path)
         spatial_dict = analyse_spatial_structure(main_model, rep_dict)
         logging.info('Model was successfully analysed')
 
@@ -168,13 +208,15 @@ def main(args):
     logging.info('Graph is getting transfered in linked data representation')
     # Überführung vom Graph in eine Wissensrepräsentation
     # Aufsetzen des Graphs und der Namespaces
-    g_ld = Graph()
+    if args.stream:
+        g_ld = TripleStreamWriter(os.path.dirname(args.input_file[0]) + '/LD-REP_' + os.path.splitext(os.path.basename(args.input_file[0]))[0] + '.' + args.stream, args.stream)
+    else:
+        g_ld = Graph()
 
     if args.use_ns:
         INST = Namespace(args.use_ns)
     else:
-
-        INST = Namespace('https://example.org/%s#' % (uuid.uuid4()))
+        INST = Namespace('https://example.org/%s#' % (create_instance_id('INST')))
 
     TSO = Namespace('https://w3id.org/tso#')
     RDF = Namespace('http://www.w3.org/1999/02/22-rdf-syntax-ns#')
@@ -182,6 +224,14 @@ def main(args):
     IFC = Namespace('https://standards.buildingsmart.org/IFC/DEV/IFC4/FINAL/OWL#')
     BOT = Namespace('https://w3id.org/bot#')
 
+    # Binden der Namespaces, bei der direkten Ausgabe als Turtle vor dem ersten Tripel
+    g_ld.bind('tso', TSO)
+    g_ld.bind('rdf', RDF)
+    g_ld.bind('rdfs', RDFS)
+    g_ld.bind('inst', INST)
+    g_ld.bind('ifc4', IFC)
+    g_ld.bind('bot', BOT)
+
     # Anlegen von Konzepten mit hierarchischen Aspekten
     logging.info('Hierarchical concepts are created')
     g_ld, state_dict = convert_hierarchicalconcepts_to_tso(g_ld, args, enriched_graph, hierarchie_dict, IFC, INST, TSO, RDF, RDFS)
@@ -204,14 +254,6 @@ def main(args):
 
     logging.info('Graph was successfully transfered in linked data representation')
 
-    # Binden der Namespaces
-    g_ld.bind('tso', TSO)
-    g_ld.bind('rdf', RDF)
-    g_ld.bind('rdfs', RDFS)
-    g_ld.bind('inst', INST)
-    g_ld.bind('ifc4', IFC)
-    g_ld.bind('bot', BOT)
-
     # Export der Analyse- und Anreicherungsergebnisse im TXT-Format
     if args.i:
         logging.info('Information about the model is being saved')
@@ -220,7 +262,10 @@ def main(args):
 
     # Ablage der Wissensrepräsentation am Pfad
     logging.info('Linked data representation is getting serialized')
-    g_ld.serialize(destination=os.path.dirname(args.input_file[0]) + '/LD-REP_' + os.path.basename(args.input_file[0])[:-5] + '.ttl', format='turtle')
+    if args.stream:
+        g_ld.close()
+    else:
+        g_ld.serialize(destination=os.path.dirname(args.input_file[0]) + '/LD-REP_' + os.path.splitext(os.path.basename(args.input_file[0]))[0] + '.ttl', format='turtle')
     logging.info('Linked data representation was successfully serialized and saved')
 
 
@@ -229,7 +274,7 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description='Enrich the functional information in the given graph and save to a turtle serialisation of TSO')
 
     # Pfad zum Graph
-    parser.add_argument('input_file', nargs='+', type=str, help='Path to the input graph as a JSON-file')
+    parser.add_argument('input_file', nargs='+', type=str, help='Path to the input graph as a JSON-file or binary MessagePack-file')
 
     # Ablage der Analyseergebnisse der enthaltenen Informationen zu technischen Systemen als Datei im TXT-Format am Pfad des Graphs.
     parser.add_argument('-i', action='store_true', help='Saving information about the graph in as *.txt at the give input directory')
@@ -252,6 +297,15 @@ if __name__ == "__main__":
     # Ablage der Anreicherungsergebnisse zu [...] als BCF- Datei am Pfad des Graphs.
     parser.add_argument('-bcf_fd', action='store_true', help='Create bcf-files of the functional information')
 
+    # Verzeichnis zur Zwischenspeicherung von Ergebnissen, die bei erneuten Aufrufen mit unveränderten Eingaben wiederverwendet werden.
+    parser.add_argument('-cache', type=str, default=None, help='Directory to cache intermediate results, e.g. the tessellated spatial elements')
+
+    # Direkte Ausgabe der Tripel als N-Triples oder Turtle während der Überführung, ohne die Wissensrepräsentation im Arbeitsspeicher aufzubauen.
+    parser.add_argument('-stream', type=str, default=None, choices=['nt', 'ttl'], help='Stream the triples to an N-Triples (nt) or Turtle (ttl) file instead of building the graph in memory')
+
+    # Vergabe deterministischer Bezeichner (UUIDv5) für Systeme, Zustände, Verbindungspunkte und Verbindungen, abgeleitet aus dem Inhalt der Eingabedateien und dem Namespace.
+    parser.add_argument('-det_ids', action='store_true', help='Derive reproducible identifiers from the input files and component GUIDs instead of random ones')
+
     # Nutzung des angegebenen Namespaces zur eindeutigen Identifizierung der Instanzen.
     parser.add_argument('-use_ns', type=str, default=None, help='Identify instances using the given namespace')
 
@@ -1,7 +1,8 @@
 import os
+import io
+import logging
 
 import uuid
-import shutil
 from zipfile import ZipFile
 from lxml import etree as ET
 from datetime import datetime
@@ -10,6 +11,11 @@ from rtree import index
 import numpy as np
 
 
+# Snapshot der BCF-Dateien, wird beim ersten Export eingelesen
+BCF_SNAPSHOT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'snapshot.png')
+BCF_SNAPSHOT = None
+
+
 # Funktionen zum Analysieren der enthaltenen Informationen zu technischen Systemen in einem IFC-Modell
 def check_header(model, link):
     # Analyse der Headerinformationen zu Autor, exportierendem System, IFC-Version und MVD
@@ -25,69 +31,6 @@ def check_header(model, link):
     return result_dict
 
 
-def check_for_relationships(model):
-    # Analyse der verwendeten Beziehungsklasse zur Zuordnung von Ports
-    global NESTS
-
-    result_dict = dict()
-    ifcrelconnectsporttoelement = 0
-    ifcrelnests = 0
-    ports = model.by_type('IfcDistributionPort')
-    for port in ports:
-        try:
-            if port.ContainedIn:
-                ifcrelconnectsporttoelement += 1
-        except AttributeError:
-            pass
-
-        try:
-            if port.Nests:
-                ifcrelnests += 1
-        except AttributeError:
-            pass
-
-    if ifcrelnests > ifcrelconnectsporttoelement:
-        rel = 'IfcRelNests'
-        NESTS = True
-    else:
-        rel = 'IfcRelConnectsPortToElement'
-        NESTS = False
-
-    result_dict['IfcRelNests'] = ifcrelnests
-    result_dict['IfcRelConnectesPortToElement'] = ifcrelconnectsporttoelement
-    result_dict['RelPortToElement'] = rel
-
-    return result_dict, NESTS
-
-
-def check_classes(model):
-    # Analyse, Gruppierung und Ablage der Elementklassifizierungen im IFC-Modell für nachgelagerte Prozesse
-
-    main_classes = ['IfcSpatialElement', 'IfcBuildingElement', 'IfcDistributionElement', 'IfcDistributionPort']
-
-    result_dict = dict()
-    for ifc_class in main_classes:
-        list_entities = model.by_type(ifc_class)
-        for ifc_entity in list_entities:
-            classification = ifc_entity.is_a()
-            if classification not in result_dict:
-                result_dict[classification] = {}
-
-            try:
-                entity_type = ifc_entity.PredefinedType
-                if not entity_type:
-                    entity_type = 'NOTDEFINED'
-            except AttributeError:
-                entity_type = 'NOTDEFINED'
-
-            if entity_type in result_dict[classification]:
-                result_dict[classification][entity_type] += 1
-            else:
-                result_dict[classification][entity_type] = 1
-
-    return result_dict
-
-
 def check_systems(model):
     # Analyse der Systemzuordnungen im IFC-Modell für nachgelagerte Prozesse
     result_dict = dict()
@@ -109,81 +52,104 @@ def check_systems(model):
     return result_dict
 
 
-def check_classes_for_ports(model):
-    # Check if there are distribution elements without an assigned port
+def get_entity_type(ifc_entity):
+    # Abfrage des vordefinierten Typs einer Entität
+    try:
+        entity_type = ifc_entity.PredefinedType
+        if not entity_type:
+            entity_type = 'NOTDEFINED'
+    except AttributeError:
+        entity_type = 'NOTDEFINED'
+
+    return entity_type
 
-    main_classes = ['IfcDistributionElement', 'IfcBuildingElementProxy']
 
+def check_model(model, port_tables):
+    # Analyse aller Informationen zu technischen Systemen in einem Durchlauf über Ports, Elemente und Systeme
+    # Die Beziehungsklasse, die Zuordnung und die Verbindungen der Ports werden aus den vorab aufgestellten Tabellen abgefragt
     result_dict = dict()
     result_dict['Without_ports'] = dict()
     result_dict['With_unassigned_ports'] = dict()
     result_dict['Elements_without_ports'] = dict()
     result_dict['Elements_without_ports']['GlobalIds'] = []
-    for ifc_class in main_classes:
-        list_entities = model.by_type(ifc_class)
-        for ifc_entity in list_entities:
-            classification = ifc_entity.is_a()
-            try:
-                entity_type = ifc_entity.PredefinedType
-                if not entity_type:
-                    entity_type = 'NOTDEFINED'
-            except AttributeError:
-                entity_type = 'NOTDEFINED'
-            classification = classification + '.' + entity_type
-
-            if NESTS:
-                if not ifc_entity.IsNestedBy:
-                    if classification in result_dict['Without_ports']:
-                        result_dict['Without_ports'][classification].append(ifc_entity.GlobalId)
-                        result_dict['Elements_without_ports']['GlobalIds'].append(ifc_entity.GlobalId)
-                    else:
-                        result_dict['Without_ports'][classification] = []
-                        result_dict['Without_ports'][classification].append(ifc_entity.GlobalId)
-                        result_dict['Elements_without_ports']['GlobalIds'].append(ifc_entity.GlobalId)
-                else:
-                    tmp_list = []
-                    for port in ifc_entity.IsNestedBy[0].RelatedObjects:
-                        if (len(port.ConnectedTo) + len(port.ConnectedFrom)) == 0:
-                            tmp_list.append(port)
-
-                    if len(tmp_list) > 0:
-                        if classification in result_dict['With_unassigned_ports']:
-                            result_dict['With_unassigned_ports'][classification].append(ifc_entity.GlobalId)
-                        else:
-                            result_dict['With_unassigned_ports'][classification] = []
-                            result_dict['With_unassigned_ports'][classification].append(ifc_entity.GlobalId)
+    port_classes_dict = dict()
+    unassigned_ports_dict = dict()
+
+    # Analyse der Ports (Klassifizierung und fehlende Verbindungen)
+    for port in model.by_type('IfcDistributionPort'):
+        classification = port.is_a()
+        entity_type = port_tables['Type'][port.GlobalId][0]
+        if classification not in port_classes_dict:
+            port_classes_dict[classification] = {}
+        if entity_type in port_classes_dict[classification]:
+            port_classes_dict[classification][entity_type] += 1
+        else:
+            port_classes_dict[classification][entity_type] = 1
 
-    return result_dict
+        if not port_tables['ConnectedTo'][port.GlobalId] and not port_tables['ConnectedFrom'][port.GlobalId]:
+            if classification in unassigned_ports_dict:
+                unassigned_ports_dict[classification].append(port.GlobalId)
+            else:
+                unassigned_ports_dict[classification] = []
 
+    result_dict['port_relationship'] = port_tables['Relationship']
 
-def check_ports_for_unassigned(model):
-    # Check if there are distribution ports which are not connected to another port
+    # Analyse der Elementklassifizierungen der räumlichen Elemente, Bauteile und Elemente technischer Systeme
+    classes_dict = dict()
+    proxy_list = []
+    for ifc_class in ['IfcSpatialElement', 'IfcBuildingElement', 'IfcDistributionElement']:
+        for ifc_entity in model.by_type(ifc_class):
+            classification = ifc_entity.is_a()
+            entity_type = get_entity_type(ifc_entity)
+            if classification not in classes_dict:
+                classes_dict[classification] = {}
+            if entity_type in classes_dict[classification]:
+                classes_dict[classification][entity_type] += 1
+            else:
+                classes_dict[classification][entity_type] = 1
 
-    main_classes = ['IfcDistributionPort']
+            if ifc_class == 'IfcBuildingElement':
+                if classification == 'IfcBuildingElementProxy':
+                    proxy_list.append((ifc_entity, classification + '.' + entity_type))
+                continue
+            if ifc_class == 'IfcSpatialElement':
+                continue
 
-    result_dict = dict()
-    for ifc_class in main_classes:
-        list_entities = model.by_type(ifc_class)
-        for ifc_entity in list_entities:
-            classification = ifc_entity.is_a()
+            # Analyse der Portzuordnungen der Elemente technischer Systeme
+            check_element_for_ports(ifc_entity, classification + '.' + entity_type, port_tables, result_dict)
 
-            if ifc_entity.ConnectedTo:
-                connections = True
-            else:
-                if ifc_entity.ConnectedFrom:
-                    connections = True
-                else:
-                    connections = False
+    # Analyse der Portzuordnungen der IfcBuildingElementProxy im Anschluss an die Elemente technischer Systeme
+    for ifc_entity, classification in proxy_list:
+        check_element_for_ports(ifc_entity, classification, port_tables, result_dict)
 
-            if not connections:
-                if classification in result_dict:
-                    result_dict[classification].append(ifc_entity.GlobalId)
-                else:
-                    result_dict[classification] = []
+    classes_dict.update(port_classes_dict)
+    result_dict['Investigated Classes'] = classes_dict
+    result_dict['Investigated Systems'] = check_systems(model)
+    result_dict['Ports without assignment'] = unassigned_ports_dict
 
     return result_dict
 
 
+def check_element_for_ports(ifc_entity, classification, port_tables, result_dict):
+    # Kontrolle eines Elements auf fehlende oder offene Ports anhand der Tabellen der Ports
+    if not NESTS:
+        return
+
+    ports = port_tables['Ports'].get(ifc_entity.GlobalId)
+    if not ports:
+        if classification not in result_dict['Without_ports']:
+            result_dict['Without_ports'][classification] = []
+        result_dict['Without_ports'][classification].append(ifc_entity.GlobalId)
+        result_dict['Elements_without_ports']['GlobalIds'].append(ifc_entity.GlobalId)
+    else:
+        for port in ports:
+            if not port_tables['ConnectedTo'][port] and not port_tables['ConnectedFrom'][port]:
+                if classification not in result_dict['With_unassigned_ports']:
+                    result_dict['With_unassigned_ports'][classification] = []
+                result_dict['With_unassigned_ports'][classification].append(ifc_entity.GlobalId)
+                break
+
+
 def write_infos(input_dict, args):
     # Konsolidierung und Ausgabe der Analyseergebnisse in einer Datei im TXT-Format
 
@@ -212,10 +178,18 @@ def write_infos(input_dict, args):
 
 
 # Funktionen zum Anlagen von BCF-Datein
-def create_bcf(bcf_dict, args, zipped=True):
-    # Erstellung einer BCF_Datei der Version 2.1
-    # Strukur der BCF-Datei kann der Dokumentation von buildingSMART entnommen werden
+def get_bcf_snapshot():
+    # Einlesen des Snapshots der BCF-Dateien, dieser wird nur einmal gelesen und für alle Themen verwendet
+    global BCF_SNAPSHOT
+    if BCF_SNAPSHOT is None:
+        with open(BCF_SNAPSHOT_PATH, 'rb') as snapshot_file:
+            BCF_SNAPSHOT = snapshot_file.read()
+    return BCF_SNAPSHOT
 
+
+def write_bcf_topic(zips, bcf_dict):
+    # Erstellung eines Themas einer BCF-Datei der Version 2.1 im Arbeitsspeicher und direkte Ablage in der geöffneten ZIP-Datei
+    # Strukur der BCF-Datei kann der Dokumentation von buildingSMART entnommen werden
     input_dict = dict()
     input_dict['markup'] = dict()
     input_dict['markup']['guid'] = str(uuid.uuid4())
@@ -232,77 +206,39 @@ def create_bcf(bcf_dict, args, zipped=True):
     input_dict['viewpoint']['Selections'] = bcf_dict['Selections']
 
     main_guid = input_dict['markup']['guid']
+    zips.writestr(main_guid + '/', b'')
+    zips.writestr(main_guid + '/markup.bcf', create_bcf_markup(input_dict['markup']))
+    zips.writestr(main_guid + '/viewpoint.bcfv', create_bcf_viewpoint(input_dict['viewpoint']))
+    zips.writestr(main_guid + '/snapshot.png', get_bcf_snapshot())
 
-    filepath_1 = os.path.dirname(args.input_file) + '/' + main_guid
-    filepath_2 = os.path.dirname(args.input_file) + '/' + main_guid + '/' + main_guid
+    return main_guid
 
-    filepath_version = filepath_1 + '/bcf.version'
-    filepath_markup = filepath_2 + '/markup.bcf'
-    filepath_viewpoint = filepath_2 + '/viewpoint.bcfv'
 
-    os.mkdir(filepath_1)
-    os.mkdir(filepath_2)
+def create_bcf(bcf_dict, args):
+    # Erstellung einer BCF-Datei mit einem Thema, als Bezeichner wird die GUID des Themas verwendet
+    zip_buffer = io.BytesIO()
+    with ZipFile(zip_buffer, 'w') as zips:
+        zips.writestr('bcf.version', create_bcf_version())
+        main_guid = write_bcf_topic(zips, bcf_dict)
+    with open(os.path.dirname(args.input_file) + '/' + main_guid + '.bcf', 'wb') as bcf_file:
+        bcf_file.write(zip_buffer.getvalue())
 
-    create_bcf_version(filepath_version)
-    create_bcf_markup(input_dict['markup'], filepath_markup)
-    create_bcf_viewpoint(input_dict['viewpoint'], filepath_viewpoint)
+    return main_guid
 
-    shutil.copyfile('snapshot.png', os.path.dirname(args.input_file) + '/' + main_guid + '/' + main_guid + '/snapshot.png')
 
-    if zipped:
-        zip_bcfs([main_guid], args, zipped)
-
-    else:
-        return main_guid
-
-
-def zip_bcfs(list_guid, args, zipped):
-    # Komprimierung der erstellten BCF-Dateien
-
-    # Erstellung einer komprimierten BCF-Datei mit mehreren untergeordneten Dateien
-    if not zipped:
-        now = datetime.now()
-        dt_string = now.strftime("%Y-%m-%dT%H-%M-%S")
-        folder_name = str(uuid.uuid4())
-        os.mkdir(os.path.dirname(args.input_file) + '/' + folder_name)
-        for main_guid in list_guid:
-            shutil.move(os.path.dirname(args.input_file) + '/' + main_guid + '/' + main_guid, os.path.dirname(args.input_file) + '/' + folder_name + '/' + main_guid)
-            shutil.move(os.path.dirname(args.input_file) + '/' + main_guid + '/bcf.version', os.path.dirname(args.input_file) + '/' + folder_name + '/bcf.version')
-            shutil.rmtree(os.path.dirname(args.input_file) + '/' + main_guid, ignore_errors=True)
-
-        os.chdir(os.path.dirname(args.input_file) + '/' + folder_name)
-        with ZipFile(folder_name + '.bcf', 'w') as zips:
-            zips.write('bcf.version')
-            for main_guid in list_guid:
-                zips.write(main_guid)
-                zips.write(main_guid + '/markup.bcf')
-                zips.write(main_guid + '/viewpoint.bcfv')
-                zips.write(main_guid + '/snapshot.png')
-
-        os.chdir('..')
-        os.chdir('..')
-        shutil.move(os.path.dirname(args.input_file) + '/' + folder_name + '/' + folder_name + '.bcf', os.path.dirname(args.input_file) + '/' + folder_name + '.bcf')
-        shutil.rmtree(os.path.dirname(args.input_file) + '/' + folder_name, ignore_errors=True)
-
-    # Erstellung einer komprimierten BCF-Datei für jede untergeordnete Datei
-    else:
-        for main_guid in list_guid:
-            os.chdir(os.path.dirname(args.input_file) + '/' + main_guid)
-            with ZipFile(main_guid + '.bcf', 'w') as zips:
-                zips.write('bcf.version')
-                zips.write(main_guid)
-                zips.write(main_guid + '/markup.bcf')
-                zips.write(main_guid + '/viewpoint.bcfv')
-                zips.write(main_guid + '/snapshot.png')
+def create_bcf_collection(bcf_dict_list, args):
+    # Erstellung einer BCF-Datei mit mehreren Themen, die nacheinander in eine gemeinsame ZIP-Datei geschrieben werden
+    folder_name = str(uuid.uuid4())
+    with ZipFile(os.path.dirname(args.input_file) + '/' + folder_name + '.bcf', 'w') as zips:
+        zips.writestr('bcf.version', create_bcf_version())
+        for bcf_dict in bcf_dict_list:
+            write_bcf_topic(zips, bcf_dict)
 
-            os.chdir("..")
-            shutil.move(main_guid + '/' + main_guid + '.bcf', main_guid + '.bcf')
-            shutil.rmtree(main_guid, ignore_errors=True)
-            os.chdir("..")
+    return folder_name
 
 
-def create_bcf_viewpoint(input_dict, link):
-    # Erstellung der viewpoint.bcfv als Teil einer BCF-Datei
+def create_bcf_viewpoint(input_dict):
+    # Erstellung der viewpoint.bcfv als Teil einer BCF-Datei im Arbeitsspeicher
 
     output = ET.ElementTree()
     visualizationinfo = ET.Element('VisualizationInfo', Guid=input_dict['guid'])
@@ -336,13 +272,12 @@ def create_bcf_viewpoint(input_dict, link):
     ET.SubElement(perspectivecamera, 'FieldOfView').text = '60'
 
     output._setroot(visualizationinfo)
-    output.write(link, encoding='utf-8', xml_declaration=True, pretty_print=True)
 
-    return -1
+    return ET.tostring(output, encoding='UTF-8', xml_declaration=True, pretty_print=True)
 
 
-def create_bcf_markup(input_dict, link):
-    # Erstellung der markup.bcf als Teil einer BCF-Datei
+def create_bcf_markup(input_dict):
+    # Erstellung der markup.bcf als Teil einer BCF-Datei im Arbeitsspeicher
 
     title_text = input_dict['title']
     description_text = input_dict['description']
@@ -373,12 +308,11 @@ def create_bcf_markup(input_dict, link):
     ET.SubElement(viewpoints, 'Snapshot').text = snapshot_text
 
     output._setroot(markup)
-    output.write(link, encoding='utf-8', xml_declaration=True, pretty_print=True)
 
-    return -1
+    return ET.tostring(output, encoding='UTF-8', xml_declaration=True, pretty_print=True)
 
 
-def create_bcf_version(link):
+def create_bcf_version():
     # Anlagen der Grundlagen einer BCF-Datei
 
     ns = 'http://www.w3.org/2001/XMLSchema-instance'
@@ -389,23 +323,26 @@ def create_bcf_version(link):
     ET.SubElement(version, 'DetailedVersion').text = "2.1"
 
     output._setroot(version)
-    output.write(link, encoding='utf-8', xml_declaration=True, pretty_print=True)
 
-    return -1
+    return ET.tostring(output, encoding='UTF-8', xml_declaration=True, pretty_print=True)
 
 
 # Funktionen zum Anlegen und Arbeiten mit R-Bäumen
-def calculate_absolute_position(entity_plc):
-    # Berechnung der absoluten Position der Entität im dreidimensionalen Raum
+def calculate_absolute_position(entity_plc, placement_cache):
+    # Berechnung der absoluten Transformationsmatrix eines IfcLocalPlacement, bereits berechnete Platzierungen werden über ihre Id zwischengespeichert
 
     if not entity_plc:
         return np.eye(4)
 
+    plc_id = entity_plc.id()
+    if plc_id in placement_cache:
+        return placement_cache[plc_id]
+
     if not entity_plc.PlacementRelTo:
         parent = np.eye(4)
 
     else:
-        parent = calculate_absolute_position(entity_plc.PlacementRelTo)
+        parent = calculate_absolute_position(entity_plc.PlacementRelTo, placement_cache)
 
     try:
         x_direction = np.array(entity_plc.RelativePlacement.RefDirection.DirectionRatios)
@@ -422,62 +359,116 @@ def calculate_absolute_position(entity_plc):
     r[:-1, :-1] = x_direction, y_direction, z_direction
     r[-1, :-1] = entity_plc.RelativePlacement.Location.Coordinates
 
-    return np.dot(parent, r.T)
+    placement_cache[plc_id] = np.dot(parent, r.T)
+
+    return placement_cache[plc_id]
 
 
 def calculate_all_absolute_positions(model):
-    # Berechnung der absoluten Position
+    # Berechnung der absoluten Position aller räumlichen Elemente, Elemente technischer Systeme und Ports
+    # Die Positionen werden in einem (N, 3) Array abgelegt, die Zuordnung erfolgt über die GlobalId
     result_dict = dict()
-    result_dict['Total'] = dict()
-    result_dict['IfcSpatialElements'] = dict()
-    result_dict['IfcElement'] = dict()
-    result_dict['IfcDistributionPort'] = dict()
-
-    # Berechnung der absoluten Position von Elementen der räumlichen Struktur
-    spatial_elements = model.by_type('IfcSpatialElement')
-    for spatial_elem in spatial_elements:
-        spatial_elem_id = spatial_elem.GlobalId
-        spatial_elem_pos = calculate_absolute_position(spatial_elem.ObjectPlacement)
-        result_dict['IfcSpatialElements'][spatial_elem_id] = spatial_elem_pos.T[-1, :-1]
-        result_dict['Total'][spatial_elem_id] = spatial_elem_pos.T[-1, :-1]
-
-    # Berechnung der absoluten Position von Elementen technischer Systeme
-    distribution_elements = model.by_type('IfcDistributionElement') + model.by_type('IfcBuildingElementProxy')
-    for distribution_elem in distribution_elements:
-        distribution_elem_id = distribution_elem.GlobalId
-        distribution_elem_pos = calculate_absolute_position(distribution_elem.ObjectPlacement)
-        result_dict['IfcElement'][distribution_elem_id] = distribution_elem_pos.T[-1, :-1]
-        result_dict['Total'][distribution_elem_id] = distribution_elem_pos.T[-1, :-1]
-
-    # Berechnung der absoluten Position von Ports
-    port_elements = model.by_type('IfcDistributionPort')
-    for port_elem in port_elements:
-        port_elem_id = port_elem.GlobalId
-        port_elem_pos = calculate_absolute_position(port_elem.ObjectPlacement)
-        result_dict['IfcDistributionPort'][port_elem_id] = port_elem_pos.T[-1, :-1]
-        result_dict['Total'][port_elem_id] = port_elem_pos.T[-1, :-1]
+    result_dict['Index'] = dict()
+    result_dict['Ranges'] = dict()
+
+    entity_groups = [('IfcSpatialElements', model.by_type('IfcSpatialElement')),
+                     ('IfcElement', model.by_type('IfcDistributionElement') + model.by_type('IfcBuildingElementProxy')),
+                     ('IfcDistributionPort', model.by_type('IfcDistributionPort'))]
+
+    placement_cache = dict()
+    parent_rows = dict()
+    parent_matrices = [np.eye(4)]
+    list_parent_idx = []
+    list_x_directions = []
+    list_z_directions = []
+    list_locations = []
+    list_guids = []
+
+    # Auflösen der übergeordneten Platzierungen, jede Platzierung wird dabei nur einmal berechnet
+    for group, entities in entity_groups:
+        start = len(list_guids)
+        for entity in entities:
+            entity_plc = entity.ObjectPlacement
+            list_guids.append(entity.GlobalId)
+            if not entity_plc:
+                list_parent_idx.append(0)
+                list_x_directions.append((1.0, 0.0, 0.0))
+                list_z_directions.append((0.0, 0.0, 1.0))
+                list_locations.append((0.0, 0.0, 0.0))
+                continue
+
+            parent_plc = entity_plc.PlacementRelTo
+            if not parent_plc:
+                list_parent_idx.append(0)
+            else:
+                parent_id = parent_plc.id()
+                if parent_id not in parent_rows:
+                    parent_rows[parent_id] = len(parent_matrices)
+                    parent_matrices.append(calculate_absolute_position(parent_plc, placement_cache))
+                list_parent_idx.append(parent_rows[parent_id])
+
+            try:
+                x_direction = entity_plc.RelativePlacement.RefDirection.DirectionRatios
+                z_direction = entity_plc.RelativePlacement.Axis.DirectionRatios
+            except AttributeError:
+                x_direction = (1.0, 0.0, 0.0)
+                z_direction = (0.0, 0.0, 1.0)
+
+            list_x_directions.append(x_direction)
+            list_z_directions.append(z_direction)
+            list_locations.append(entity_plc.RelativePlacement.Location.Coordinates)
+
+        result_dict['Ranges'][group] = (start, len(list_guids))
+
+    # Berechnung der Transformationsmatrizen der Entitäten als Batch über alle Entitäten
+    parents = np.array(parent_matrices)[np.array(list_parent_idx, dtype=int)].reshape(-1, 4, 4)
+    x_directions = np.array(list_x_directions, dtype=float).reshape(-1, 3)
+    z_directions = np.array(list_z_directions, dtype=float).reshape(-1, 3)
+    r = np.tile(np.eye(4), (len(list_guids), 1, 1))
+    r[:, :-1, 0] = x_directions
+    r[:, :-1, 1] = np.cross(z_directions, x_directions)
+    r[:, :-1, 2] = z_directions
+    r[:, :-1, 3] = np.array(list_locations, dtype=float).reshape(-1, 3)
+    coordinates = np.matmul(parents, r)[:, :-1, 3]
+
+    result_dict['Coordinates'] = np.ascontiguousarray(coordinates)
+    result_dict['GlobalIds'] = list_guids
+    for row, guid in enumerate(list_guids):
+        result_dict['Index'][guid] = row
 
     return result_dict
 
 
-def build_spatial_index(input_dict):
+def get_absolute_position(position_dict, globalid):
+    # Abfrage der absoluten Position einer Entität über die GlobalId
+    return position_dict['Coordinates'][position_dict['Index'][globalid]]
+
+
+def build_spatial_index(position_dict):
     # Anlegen des R-Baums mit den Positionen der Ports im dreidimensionalen Raum
+    # Der R-Baum wird im Arbeitsspeicher über den Stream-Loader von rtree aus dem Positions-Array aufgebaut
 
     result_dict = dict()
     result_mapping = dict()
     p = index.Property()
     p.dimension = 3
-    p.dat_extension = 'data'
-    p.idx_extension = 'index'
-    idx3d = index.Index('3d_index', properties=p)
-    i = 1
 
-    for guid, position in input_dict.items():
-        idx3d.insert(i, (float(position[0]), float(position[1]), float(position[2])))
+    start, stop = position_dict['Ranges']['IfcDistributionPort']
+    port_coordinates = position_dict['Coordinates'][start:stop]
+    port_guids = position_dict['GlobalIds'][start:stop]
+    stream = []
+    for i, guid in enumerate(port_guids, 1):
+        position = port_coordinates[i - 1]
+        coordinates = (float(position[0]), float(position[1]), float(position[2]))
+        stream.append((i, coordinates + coordinates, None))
 
         result_mapping[guid] = i
         result_mapping[i] = guid
-        i += 1
+
+    if stream:
+        idx3d = index.Index(stream, properties=p)
+    else:
+        idx3d = index.Index(properties=p)
 
     result_dict['Spatialindex'] = idx3d
     result_dict['Mapping'] = result_mapping
@@ -489,7 +480,7 @@ def k_nearest_neighbors(index_dict, position_dict, globalid, num_results):
     # Abfrage des R-Baums über eine kNN Abfrage
     result_dict = dict()
     try:
-        position = position_dict['Total'][globalid]
+        position = get_absolute_position(position_dict, globalid)
     except KeyError:
         print('No position for port ' + globalid)
         result_dict['nearest_element_guid'] = []
@@ -508,76 +499,173 @@ def k_nearest_neighbors(index_dict, position_dict, globalid, num_results):
     return result_dict
 
 
-def intersection_neighbors(index_dict, position_dict, globalid, spatial_boundary):
-    # Abfrage der topologischen Nachbarn eines Ports mit einer gegebenen GUID
+def intersection_neighbors_batch(position_dict, list_globalids, spatial_boundary, chunk_size=4096, query_globalids=None):
+    # Abfrage der topologischen Nachbarn mehrerer Ports in einer gemeinsamen Abfrage
+    # Es werden alle Paare der übergebenen Ports bestimmt, deren Abstand je Achse höchstens der räumlichen Grenze entspricht
+    # Bei Angabe von query_globalids werden nur die Nachbarn dieser Ports unter allen übergebenen Ports bestimmt
     result_dict = dict()
-    try:
-        position = position_dict['Total'][globalid]
-    except KeyError:
-        print('No position for port ' + globalid)
-        result_dict['nearest_element_guid'] = []
+    list_guids = []
+    list_rows = []
+    for globalid in list_globalids:
+        if globalid in result_dict:
+            continue
+        result_dict[globalid] = []
+        try:
+            list_rows.append(position_dict['Index'][globalid])
+            list_guids.append(globalid)
+        except KeyError:
+            logging.warning('No position for port %s', globalid)
+
+    if not list_rows:
         return result_dict
 
-    coordinates = (float(position[0] - spatial_boundary), float(position[1] - spatial_boundary),
-                   float(position[2] - spatial_boundary), float(position[0] + spatial_boundary),
-                   float(position[1] + spatial_boundary), float(position[2] + spatial_boundary))
+    coordinates = position_dict['Coordinates'][np.array(list_rows, dtype=int)]
+    if query_globalids is None:
+        query_rows = np.arange(len(list_rows))
+    else:
+        guid_index = {globalid: i for i, globalid in enumerate(list_guids)}
+        query_rows = np.array(sorted(set(guid_index[globalid] for globalid in query_globalids if globalid in guid_index)), dtype=int)
+    lower = coordinates[query_rows] - spatial_boundary
+    upper = coordinates[query_rows] + spatial_boundary
+
+    # Sortierung entlang der Achse mit der größten Ausdehnung, sodass je Port nur ein Fenster an Kandidaten geprüft wird
+    axis = int(np.argmax(coordinates.max(axis=0) - coordinates.min(axis=0)))
+    order = np.argsort(coordinates[:, axis], kind='stable')
+    sorted_axis = coordinates[order, axis]
+    left = np.searchsorted(sorted_axis, lower[:, axis], side='left')
+    right = np.searchsorted(sorted_axis, upper[:, axis], side='right')
+    counts = right - left
+
+    for chunk_start in range(0, len(query_rows), chunk_size):
+        chunk_counts = counts[chunk_start:chunk_start + chunk_size]
+        total = int(chunk_counts.sum())
+        if total == 0:
+            continue
+
+        # Aufstellen aller Kandidatenpaare des Abschnitts und Prüfung der Begrenzungsbox
+        source = np.repeat(np.arange(chunk_start, chunk_start + len(chunk_counts)), chunk_counts)
+        offsets = np.arange(total) - np.repeat(np.cumsum(chunk_counts) - chunk_counts, chunk_counts)
+        sink = order[np.repeat(left[chunk_start:chunk_start + chunk_size], chunk_counts) + offsets]
+        mask = np.all((coordinates[sink] >= lower[source]) & (coordinates[sink] <= upper[source]), axis=1)
+        source = source[mask]
+        sink = sink[mask]
+
+        source = query_rows[source]
+        pairs = np.lexsort((sink, source))
+        for i, j in zip(source[pairs].tolist(), sink[pairs].tolist()):
+            result_dict[list_guids[i]].append(list_guids[j])
 
-    nearest_element = index_dict['Spatialindex'].intersection(coordinates, objects=False)
-    nearest_elements_idx = list(nearest_element)
+    return result_dict
 
-    result_dict['nearest_element_guid'] = []
-    for nearest_elment_idx in nearest_elements_idx:
-        nearest_element_guid = index_dict['Mapping'][nearest_elment_idx]
-        result_dict['nearest_element_guid'].append(nearest_element_guid)
 
-    return result_dict
+def get_port_tables(model):
+    # Aufstellen von Tabellen aller Ports in einem Durchlauf über die Beziehungsklassen, ohne Abfrage der inversen Attribute je Port
+    # Element: Port -> zugehörige Elemente, Ports: Element -> zugeordnete Ports, Type: Port -> (vordefinierter Typ, Flussrichtung)
+    # ConnectedTo/ConnectedFrom: Port -> verbundene Ports als RelatingPort bzw. RelatedPort der IfcRelConnectsPorts
+    # Relationship: Anzahl der über IfcRelNests bzw. IfcRelConnectsPortToElement zugeordneten Ports und die verwendete Beziehungsklasse
+    global NESTS
+
+    port_tables = {'Element': {}, 'Ports': {}, 'Type': {}, 'ConnectedTo': {}, 'ConnectedFrom': {}}
+    for port in model.by_type('IfcDistributionPort'):
+        port_tables['Type'][port.GlobalId] = (get_entity_type(port), port.FlowDirection)
+        port_tables['ConnectedTo'][port.GlobalId] = []
+        port_tables['ConnectedFrom'][port.GlobalId] = []
+
+    # Analyse der verwendeten Beziehungsklasse zur Zuordnung von Ports
+    nests_list = []
+    nests_set = set()
+    for rel in model.by_type('IfcRelNests'):
+        ports = [obj.GlobalId for obj in rel.RelatedObjects if obj.GlobalId in port_tables['Type']]
+        if ports:
+            nests_list.append((rel.RelatingObject.GlobalId, ports))
+            nests_set.update(ports)
+
+    contained_list = []
+    contained_set = set()
+    for rel in model.by_type('IfcRelConnectsPortToElement'):
+        contained_list.append((rel.RelatedElement.GlobalId, rel.RelatingPort.GlobalId))
+        if rel.RelatingPort.GlobalId in port_tables['Type']:
+            contained_set.add(rel.RelatingPort.GlobalId)
+
+    if len(nests_set) > len(contained_set):
+        rel = 'IfcRelNests'
+        NESTS = True
+    else:
+        rel = 'IfcRelConnectsPortToElement'
+        NESTS = False
+
+    port_tables['Relationship'] = dict()
+    port_tables['Relationship']['IfcRelNests'] = len(nests_set)
+    port_tables['Relationship']['IfcRelConnectesPortToElement'] = len(contained_set)
+    port_tables['Relationship']['RelPortToElement'] = rel
+
+    # Zuordnung der Ports zu den Elementen entsprechend der verwendeten Beziehungsklasse
+    if NESTS:
+        for element_idx, ports in nests_list:
+            port_tables['Ports'][element_idx] = ports
+            for port in ports:
+                port_tables['Element'].setdefault(port, []).append(element_idx)
+    else:
+        for element_idx, port in contained_list:
+            port_tables['Ports'][element_idx] = [port]
+            port_tables['Element'].setdefault(port, []).append(element_idx)
+
+    # Topologische Verbindungen der Ports
+    for rel in model.by_type('IfcRelConnectsPorts'):
+        relating_port = rel.RelatingPort.GlobalId
+        related_port = rel.RelatedPort.GlobalId
+        port_tables['ConnectedTo'].setdefault(relating_port, []).append(related_port)
+        port_tables['ConnectedFrom'].setdefault(related_port, []).append(relating_port)
 
+    return port_tables
 
-def check_ports(model, info_dict, index_dict, position_dict, spatial_boundary):
+
+def get_port_element(port_tables, port):
+    # Abfrage des Elements, dem ein Port zugeordnet ist
+    element_list = port_tables['Element'].get(port)
+    if element_list:
+        return element_list[0]
+    return None
+
+
+def check_ports(port_tables, info_dict, index_dict, position_dict, spatial_boundary, query_ports=None):
     # Anreicherung der topologischen Informationen durch Kontrolle von Elementen mit offenen Ports
+    # Bei Angabe von query_ports werden nur diese offenen Ports kontrolliert, als Nachbarn kommen weiterhin alle offenen Ports in Frage
     result_dict = dict()
     result_dict['Possible_connected_elements'] = []
     result_dict['No_free_port_nearby'] = []
     if 'IfcDistributionPort' in info_dict['Ports without assignment']:
         list_ports = info_dict['Ports without assignment']['IfcDistributionPort']
         set_ports = set(list_ports)
+        set_connections = set()
+        neighbors_dict = intersection_neighbors_batch(position_dict, list_ports, spatial_boundary, query_globalids=query_ports)
         for port in list_ports:
-            source_port = model.by_guid(port)
-            source_port_type = source_port.PredefinedType
-            if not source_port_type:
-                source_port_type = 'NOTDEFINED'
-            if NESTS:
-                source_element_idx = source_port.Nests[0].RelatingObject.GlobalId
-            else:
-                source_element_idx = source_port.ContainedIn[0].RelatedElement.GlobalId
+            if query_ports is not None and port not in query_ports:
+                continue
+
+            source_element_idx = get_port_element(port_tables, port)
+            source_port_type = port_tables['Type'][port][0]
+            if source_element_idx is None:
+                continue
 
-            list_port_idx = intersection_neighbors(index_dict, position_dict, port, spatial_boundary)
             possible_connection = []
             port_idx = None
-            for idx in list_port_idx['nearest_element_guid']:
+            for idx in neighbors_dict[port]:
 
                 # Abfangen des abgefragten Ports in den Ergebnisse der Intersection Abfrage
                 if idx == port:
                     continue
 
                 # Kontrolle, dass das Ergebnis der Intersection Abfrage nicht zu selben Element gehört
-                port_element = model.by_guid(idx)
-                if NESTS:
-                    element_idx = port_element.Nests[0].RelatingObject.GlobalId
-                else:
-                    element_idx = port_element.ContainedIn[0].RelatedElement.GlobalId
-
-                if element_idx == source_element_idx:
+                element_idx = get_port_element(port_tables, idx)
+                port_element_type = port_tables['Type'][idx][0]
+                if element_idx is None or element_idx == source_element_idx:
                     continue
 
                 # Kontrolle, dass der ausgegebene Port ebenfalls keinen topologischen Nachbarn hat
                 if idx in set_ports:
 
                     # Kontrolle, dass die Typen der Ports zueinander passen
-                    port_element_type = port_element.PredefinedType
-                    if not port_element_type:
-                        port_element_type = 'NOTDEFINED'
-
                     if port_element_type == 'NOTDEFINED' or port_element_type == source_port_type:
                         if element_idx not in possible_connection:
                             possible_connection.append(element_idx)
@@ -587,34 +675,62 @@ def check_ports(model, info_dict, index_dict, position_dict, spatial_boundary):
                 # Wenn mehrere Ports möglich sind, wähle den nächstliegenden
                 if len(possible_connection) > 1:
                     list_port_idx = k_nearest_neighbors(index_dict, position_dict, port, 10)
-                    list_elem_idx = []
                     nearest_connection = (None, None)
                     for i in list_port_idx['nearest_element_guid']:
-                        port_element = model.by_guid(i)
-                        if NESTS:
-                            element_idx = port_element.Nests[0].RelatingObject.GlobalId
-                        else:
-                            element_idx = port_element.ContainedIn[0].RelatedElement.GlobalId
-
-                        list_elem_idx.append(element_idx)
+                        element_idx = get_port_element(port_tables, i)
                         if element_idx in possible_connection:
                             nearest_connection = (i, element_idx)
                             break
 
                     if nearest_connection == (None, None):
                         continue
-                    tmp_dict = {'source_elem_id': source_element_idx, 'source_port_id': port, 'sink_elem_id': nearest_connection[1], 'sink_port_id': nearest_connection[0]}
-                    tmp_dict_reverse = {'source_elem_id': nearest_connection[1], 'source_port_id': nearest_connection[0], 'sink_elem_id': source_element_idx, 'sink_port_id': port}
-                    if tmp_dict not in result_dict['Possible_connected_elements'] and tmp_dict_reverse not in result_dict['Possible_connected_elements']:
-                        result_dict['Possible_connected_elements'].append(tmp_dict)
+                    sink_element_idx, sink_port_idx = nearest_connection[1], nearest_connection[0]
 
                 else:
-                    tmp_dict = {'source_elem_id': source_element_idx, 'source_port_id': port, 'sink_elem_id': possible_connection[0], 'sink_port_id': port_idx}
-                    tmp_dict_reverse = {'source_elem_id': possible_connection[0], 'source_port_id': port_idx, 'sink_elem_id': source_element_idx, 'sink_port_id': port}
-                    if tmp_dict not in result_dict['Possible_connected_elements'] and tmp_dict_reverse not in result_dict['Possible_connected_elements']:
-                        result_dict['Possible_connected_elements'].append(tmp_dict)
+                    sink_element_idx, sink_port_idx = possible_connection[0], port_idx
+
+                # Kontrolle über ungeordnete Paare von Ports, ob die Verbindung bereits in umgekehrter Richtung erfasst wurde
+                connection = (port, sink_port_idx) if port < sink_port_idx else (sink_port_idx, port)
+                if connection not in set_connections:
+                    set_connections.add(connection)
+                    tmp_dict = {'source_elem_id': source_element_idx, 'source_port_id': port, 'sink_elem_id': sink_element_idx, 'sink_port_id': sink_port_idx}
+                    result_dict['Possible_connected_elements'].append(tmp_dict)
 
             else:
                 result_dict['No_free_port_nearby'].append(source_element_idx)
 
     return result_dict
+
+
+def check_ports_of_changed_elements(port_tables, info_dict, index_dict, position_dict, spatial_boundary, changed_set, removed_set, previous_matches):
+    # Inkrementelle Anreicherung, nur die offenen Ports im Umfeld der geänderten Elemente werden erneut kontrolliert
+    # Kontrolliert werden die offenen Ports der geänderten Elemente, die offenen Ports innerhalb der räumlichen Grenze um diese
+    # und die Ports der bisherigen möglichen Verbindungen mit geänderten oder entfernten Elementen
+    # Die übrigen möglichen Verbindungen der vorherigen Revision werden übernommen, die vorherige Position verschobener Ports wird nicht berücksichtigt
+    list_ports = info_dict['Ports without assignment'].get('IfcDistributionPort', [])
+    set_ports = set(list_ports)
+    changed_ports = [port for port in list_ports if get_port_element(port_tables, port) in changed_set]
+    query_set = set(changed_ports)
+    for neighbor_list in intersection_neighbors_batch(position_dict, list_ports, spatial_boundary, query_globalids=changed_ports).values():
+        query_set.update(neighbor_list)
+
+    invalid_set = changed_set | removed_set
+    for possible_match in previous_matches:
+        if possible_match['source_elem_id'] in invalid_set or possible_match['sink_elem_id'] in invalid_set:
+            query_set.add(possible_match['source_port_id'])
+            query_set.add(possible_match['sink_port_id'])
+    query_set &= set_ports
+
+    # Übernahme der bisherigen möglichen Verbindungen ohne erneut kontrollierte Ports
+    kept_list = []
+    for possible_match in previous_matches:
+        if possible_match['source_port_id'] in query_set or possible_match['sink_port_id'] in query_set:
+            continue
+        if possible_match['source_port_id'] in set_ports and possible_match['sink_port_id'] in set_ports:
+            kept_list.append(possible_match)
+
+    result_dict = check_ports(port_tables, info_dict, index_dict, position_dict, spatial_boundary, query_set)
+    result_dict['Possible_connected_elements'] = kept_list + result_dict['Possible_connected_elements']
+    result_dict['Checked_ports'] = len(query_set)
+
+    return result_dict
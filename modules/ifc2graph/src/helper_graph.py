@@ -1,48 +1,25 @@
 import networkx as nx
-import random
+import logging
+import re
+import hashlib
 
 
-def check_for_relationships(model):
-    # Analyse der verwendeten Beziehungsklasse zur Zuordnung von Ports
-    global NESTS
+# Optionale Abhängigkeit für den binären Austausch der Graphen zwischen den Prozessschritten
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
 
-    result_dict = dict()
-    ifcrelconnectsporttoelement = 0
-    ifcrelnests = 0
-    ports = model.by_type('IfcDistributionPort')
-    for port in ports:
-        try:
-            if port.ContainedIn:
-                ifcrelconnectsporttoelement += 1
-        except AttributeError:
-            pass
-
-        try:
-            if port.Nests:
-                ifcrelnests += 1
-        except AttributeError:
-            pass
-
-    if ifcrelnests > ifcrelconnectsporttoelement:
-        rel = 'IfcRelNests'
-        NESTS = True
-    else:
-        rel = 'IfcRelConnectsPortToElement'
-        NESTS = False
-
-    result_dict['IfcRelNests'] = ifcrelnests
-    result_dict['IfcRelConnectesPortToElement'] = ifcrelconnectsporttoelement
-    result_dict['RelPortToElement'] = rel
+# Kennung, Version und Attribute mit häufig wiederkehrenden Werten des binären Austauschformats der Graphen
+GRAPH_BINARY_FORMAT = 'IFC2TSO-GRAPH'
+GRAPH_BINARY_VERSION = 1
+GRAPH_BINARY_INTERNED_ATTRIBUTES = {'ifc_class', 'ifc_type', 'ifc_system', 'ifc_description'}
 
-    return result_dict, NESTS
+# Zwischenspeicher der Eigenschaftssätze (ID der Entität -> Bezeichner-Wert Dictionary)
+PROPERTY_SET_CACHE = dict()
 
 
-def get_topo_info(model, args, info_dict, position_dict):
-    # Vorbereiten der Informationen für die Überführung in einen Graph
-    # Kontrolle der verwendeten Beziehungsklasse
-    global NESTS
-    tmp_dict, NESTS = check_for_relationships(model)
-
+def get_distribution_elements(model, info_dict):
     # Entitäten der Klassen vom Typ DistributionElement und BEP mit mindestens einem Port
     important_classes = ['IfcDistributionElement', 'IfcBuildingElementProxy']
     elem_dict = {}
@@ -53,106 +30,189 @@ def get_topo_info(model, args, info_dict, position_dict):
             if i.GlobalId not in classes_without_ports_set:
                 elem_dict[i.GlobalId] = i
 
-    # Interation über alle wichtigen Elemente
+    return elem_dict
+
+
+def get_connected_element_guids(port_tables, connected_ports):
+    # Abfrage der Elemente, denen die verbundenen Ports zugeordnet sind
+    tmp_list = []
+    for connected_port in connected_ports:
+        tmp_list.extend(port_tables['Element'].get(connected_port, []))
+
+    return tmp_list
+
+
+def calculate_entity_hashes(model, args, elem_dict, position_dict, port_tables):
+    # Hashwerte der Elemente über alle Informationen, die in den Graph übernommen werden
+    # Verweise auf andere Entitäten (#ID) werden entfernt, da sich diese beim erneuten Export eines Modells ändern
+    ref_pattern = re.compile(r'#\d+')
+    hash_dict = dict()
+    for element_key, element_value in elem_dict.items():
+        content_list = [ref_pattern.sub('#', str(element_value)), repr(get_system(element_value))]
+        if element_key in position_dict['Index']:
+            content_list.append(repr(position_dict['Coordinates'][position_dict['Index'][element_key]].tolist()))
+
+        if args.rds:
+            content_list.append(repr(get_property_value_by_name(args.rds, element_value)))
+        if args.data:
+            content_list.append(repr(sorted(get_all_properties_of_entity(element_value, args.data_props).items())))
+
+        # Ports mit deren Position und den über die Ports verbundenen Elementen
+        for port in port_tables['Ports'].get(element_key, []):
+            content_list.append(ref_pattern.sub('#', str(model.by_guid(port))))
+            if port in position_dict['Index']:
+                content_list.append(repr(position_dict['Coordinates'][position_dict['Index'][port]].tolist()))
+            content_list.extend(get_connected_element_guids(port_tables, port_tables['ConnectedFrom'][port] + port_tables['ConnectedTo'][port]))
+
+        hash_dict[element_key] = hashlib.sha1('\n'.join(content_list).encode('utf8')).hexdigest()
+
+    return hash_dict
+
+
+def get_affected_elements(previous_graph, changed_set, removed_set, possible_matches):
+    # Bestimmung der Elemente, die bei der inkrementellen Überführung erneut aufbereitet werden
+    # Betroffen sind die geänderten Elemente, deren Nachbarn im Graph der vorherigen Revision und die Elemente der bisherigen räumlichen Anreicherung
     result_dict = dict()
-    additional_data_dict = dict()
+    affected_set = set(changed_set)
+    for guid in changed_set | removed_set:
+        if guid in previous_graph:
+            affected_set.update(previous_graph.predecessors(guid))
+            affected_set.update(previous_graph.successors(guid))
+    for possible_match in possible_matches:
+        affected_set.add(possible_match['source_elem_id'])
+        affected_set.add(possible_match['sink_elem_id'])
+    affected_set -= removed_set
+
+    # Die Kanten der betroffenen Elemente können auch aus den Datensätzen von deren Nachbarn stammen, z. B. bei Ports ohne Flussrichtung
+    # Die Nachbarn werden daher ebenfalls neu aufbereitet, deren Knoten und übrige Kanten bleiben im Graph erhalten
+    neighbour_set = set()
+    for guid in affected_set:
+        if guid in previous_graph:
+            neighbour_set.update(previous_graph.predecessors(guid))
+            neighbour_set.update(previous_graph.successors(guid))
+    neighbour_set -= affected_set | removed_set
+
+    result_dict['Affected'] = affected_set
+    result_dict['Neighbours'] = neighbour_set
+
+    return result_dict
+
+
+def get_topo_info(model, args, info_dict, position_dict, port_tables, elem_guids=None):
+    # Vorbereiten der Informationen für die Überführung in einen Graph
+    # Die Elemente werden einzeln als kompakte Datensätze übergeben, sodass keine Kopie des Graphs im Speicher vorgehalten wird
+    # Die Zuordnung der Ports und die topologischen Verbindungen werden aus den vorab aufgestellten Tabellen abgefragt
+    # Entitäten der Klassen vom Typ DistributionElement und BEP mit mindestens einem Port, bei Angabe der GUIDs nur diese
+    elem_dict = get_distribution_elements(model, info_dict)
+    skipped_set = set()
+
+    # Interation über alle wichtigen Elemente
     for element_key, element_value in elem_dict.items():  # IfcElement
-        result_dict[(element_key, element_value)] = {}
-        result_dict[(element_key, element_value)]['OUT'] = []
-        result_dict[(element_key, element_value)]['IN'] = []
-        result_dict[(element_key, element_value)]['Position'] = [None, None, None]
+        if elem_guids is not None and element_key not in elem_guids:
+            continue
 
         # Metadaten der Elemente analysieren (Name, Klasse, Typ, System, Beschreibung, RDS)
-        system = get_system(element_value)
-        result_dict[(element_key, element_value)]['System'] = system
-        result_dict[(element_key, element_value)]['Name'] = element_value.Name
-        result_dict[(element_key, element_value)]['Class'] = element_value.is_a()
         try:
-            result_dict[(element_key, element_value)]['Subtype'] = element_value.PredefinedType
+            subtype = element_value.PredefinedType
         except AttributeError:
-            result_dict[(element_key, element_value)]['Subtype'] = 'NOTDEFINED'
-        result_dict[(element_key, element_value)]['Description'] = element_value.Description
+            subtype = 'NOTDEFINED'
+
+        record = {'GlobalId': element_key, 'Class': element_value.is_a(), 'Subtype': subtype, 'Name': element_value.Name,
+                  'Description': element_value.Description, 'System': get_system(element_value), 'Position': [None, None, None],
+                  'AKS': None, 'Data': None, 'OUT': [], 'IN': []}
 
         # Ablage des RDS, wenn ein entsprechender Bezeichner gegeben ist
         if args.rds:
-            property_name = args.rds
-            property_value = get_property_value_by_name(property_name, element_value)
-            result_dict[(element_key, element_value)]['AKS'] = property_value
-        else:
-            result_dict[(element_key, element_value)]['AKS'] = None
+            record['AKS'] = get_property_value_by_name(args.rds, element_value)
 
         # Ablage aller inversen Attribute wenn der optionale Parameter gesetzt ist
         if args.data:
-            additional_data_dict[element_key] = get_all_properties_of_entity(element_value)
+            record['Data'] = get_all_properties_of_entity(element_value, args.data_props)
 
         # Zugeordnete Ports der Elemente auslesen
-        ports = None
-        if NESTS:
-            test = element_value.IsNestedBy
-            if test:
-                for i in test:
-                    ports = i.RelatedObjects
-        else:
-            try:
-                test = element_value.HasPorts
-                if test:
-                    for i in test:
-                        port = i.RelatingPort
-                        ports = [port]
-            except AttributeError:
-                pass
+        ports = port_tables['Ports'].get(element_key)
 
         if ports:
-            # Position des Elements anhand der Ports bestimmen
-            certain_port = random.choice(ports)
+            # Position des Elements anhand des Ports mit der kleinsten GUID bestimmen, damit die Position bei jeder Überführung gleich ist
+            certain_port = min(ports)
             try:
-                position = list(position_dict['IfcDistributionPort'][certain_port.GlobalId])
-                position = [str(x) for x in position]
+                position = list(position_dict['Coordinates'][position_dict['Index'][certain_port]])
+                record['Position'] = [str(x) for x in position]
             except KeyError:
-                position = [None, None, None]
-
-            result_dict[(element_key, element_value)]['Position'] = position
+                pass
 
-            # Topologisch verbundene Elemente entsprechend der Flussrichtung der Ports zuordnen
+            # Topologisch verbundene Elemente entsprechend der Flussrichtung der Ports zuordnen, es werden nur die GUIDs abgelegt
             for j in ports:
-                if j.FlowDirection == 'SOURCE':
-                    tmp = j.ConnectedFrom
-                    tmp_list = get_connected_elements(j, tmp)
-                    result_dict[(element_value.GlobalId, element_value)]['OUT'].extend(tmp_list)
-                if j.FlowDirection == 'SINK':
-                    tmp = j.ConnectedTo
-                    tmp_list = get_connected_elements(j, tmp)
-                    result_dict[(element_value.GlobalId, element_value)]['IN'].extend(tmp_list)
-                if j.FlowDirection == 'SOURCEANDSINK':
-                    tmp_from = j.ConnectedFrom
-                    tmp_list_from = get_connected_elements(j, tmp_from)
-                    tmp_to = j.ConnectedTo
-                    tmp_list_to = get_connected_elements(j, tmp_to)
-                    tmp = tmp_list_to + tmp_list_from
-                    result_dict[(element_value.GlobalId, element_value)]['OUT'].extend(tmp)
-                    result_dict[(element_value.GlobalId, element_value)]['IN'].extend(tmp)
-
-    return result_dict, additional_data_dict
-
-
-def get_all_properties_of_entity(entity):
-    # Analyse aller inversen Eigenschaften und Rückgabe dieser
-    result_dict = {}
+                flow_direction = port_tables['Type'][j][1]
+                if flow_direction == 'SOURCE':
+                    record['OUT'].extend(get_connected_element_guids(port_tables, port_tables['ConnectedFrom'][j]))
+                if flow_direction == 'SINK':
+                    record['IN'].extend(get_connected_element_guids(port_tables, port_tables['ConnectedTo'][j]))
+                if flow_direction == 'SOURCEANDSINK':
+                    tmp = get_connected_element_guids(port_tables, port_tables['ConnectedTo'][j] + port_tables['ConnectedFrom'][j])
+                    record['OUT'].extend(tmp)
+                    record['IN'].extend(tmp)
+
+            # Verbundene Elemente ohne eigenen Datensatz werden übersprungen, da deren Knoten keine Metadaten erhalten würden
+            for direction in ['OUT', 'IN']:
+                connected_list = []
+                for guid in record[direction]:
+                    if guid in elem_dict:
+                        connected_list.append(guid)
+                    elif guid not in skipped_set:
+                        skipped_set.add(guid)
+                        logging.warning('Connected element %s is not a distribution element with ports and is skipped', guid)
+                record[direction] = connected_list
+
+        yield record
+
+
+def clear_property_cache():
+    # Zurücksetzen des Zwischenspeichers der Eigenschaftssätze, die IDs der Entitäten sind nur innerhalb eines Modells eindeutig
+    PROPERTY_SET_CACHE.clear()
+
+
+def get_property_sets(entity):
+    # Abfrage der Eigenschaften aller Eigenschaftssätze eines Elements als Bezeichner-Wert Dictionaries
+    # Eigenschaftssätze, die mehreren Elementen zugeordnet sind, werden anhand der ID der Entität nur einmal ausgelesen
+    result_list = []
     for relDefinesByProperties in entity.IsDefinedBy:
-        for prop in relDefinesByProperties.RelatingPropertyDefinition.HasProperties:
+        property_set = relDefinesByProperties.RelatingPropertyDefinition
+        property_set_id = property_set.id()
+        if property_set_id not in PROPERTY_SET_CACHE:
+            property_dict = {}
             try:
-                result_dict[prop.Name] = prop.NominalValue.wrappedValue
+                properties = property_set.HasProperties
             except AttributeError:
-                continue
+                properties = []
+            for prop in properties:
+                try:
+                    property_dict[prop.Name] = prop.NominalValue.wrappedValue
+                except AttributeError:
+                    continue
+            PROPERTY_SET_CACHE[property_set_id] = property_dict
+        result_list.append(PROPERTY_SET_CACHE[property_set_id])
+
+    return result_list
+
+
+def get_all_properties_of_entity(entity, property_names=None):
+    # Analyse aller inversen Eigenschaften und Rückgabe dieser, bei Angabe von Bezeichnern nur die entsprechenden Eigenschaften
+    result_dict = {}
+    for property_dict in get_property_sets(entity):
+        if property_names:
+            result_dict.update((name, value) for name, value in property_dict.items() if name in property_names)
+        else:
+            result_dict.update(property_dict)
     return result_dict
 
 
 def get_property_value_by_name(search_name, entity):
     # Suche nach einem bestimmen Eigenschaftsbezeichern und Rückgabe des Werts
-    for relDefinesByProperties in entity.IsDefinedBy:
-        for prop in relDefinesByProperties.RelatingPropertyDefinition.HasProperties:
-            if prop.Name == search_name.strip():
-                return prop.NominalValue.wrappedValue
+    search_name = search_name.strip()
+    for property_dict in get_property_sets(entity):
+        if search_name in property_dict:
+            return property_dict[search_name]
     return None
 
 
@@ -174,85 +234,64 @@ def get_system(element):
     return None
 
 
-def get_connected_elements(origin_port, rel_ports):
-    # Analsyse der topologischen Verbindung und Rückgabe der angebundenen Elemente
-    tmp_list = []
-    if rel_ports:
-        for rel_port in rel_ports:
-            tmp_port = rel_port.RelatingPort
-            if tmp_port.GlobalId == origin_port.GlobalId:
-                tmp_port = rel_port.RelatedPort
-            if tmp_port:
-                if NESTS:
-                    connected_elements_nests = tmp_port.Nests
-                    if connected_elements_nests:
-                        for l in connected_elements_nests:
-                            conn_elements = l.RelatingObject
-                            tmp_list.append((conn_elements.GlobalId, conn_elements))
-                else:
-                    connected_elements_nests = tmp_port.ContainedIn
-                    if connected_elements_nests:
-                        for l in connected_elements_nests:
-                            conn_elements = l.RelatedElement
-                            tmp_list.append((conn_elements.GlobalId, conn_elements))
-
-    return tmp_list
-
-
-def create_directed_graph(input_dict, additional_data_dict, args):
+def create_directed_graph(topo_records, args):
     # Konzeption eines gerichteten Graphs und Integation der aufbereiteten topologischen Informationen des IFC-Modells
     # Konzeptions des Graphs
     directed_graph = nx.DiGraph()
 
-    # Integration der Knoten und Kanten
-    for entity in input_dict:
-        if args.data:
-            data_entity = additional_data_dict[entity[0]]
-        else:
-            data_entity = None
-
-        # Wenn Knoten nicht im Graph vorhanden ist wird dieser mit entsprehenden Metadaten hinzugefügt
-        if entity[0] not in directed_graph:
-            directed_graph.add_node(entity[0], ifc_id=entity[0], ifc_class=input_dict[entity]['Class'], ifc_type=input_dict[entity]['Subtype'],
-                                    ifc_name=input_dict[entity]['Name'], ifc_description=input_dict[entity]['Description'],
-                                    ifc_system=input_dict[entity]['System'], ifc_position=input_dict[entity]['Position'], elem_rds=input_dict[entity]['AKS'],
-                                    additional_data=data_entity)
-
-        # Für alle nachfolgenden Elemente wird ein Knoten angelegt und eine Kante wird hinzugefügt
-        for element in input_dict[entity]['OUT']:
-            if args.data:
-                data_elem = additional_data_dict[element[0]]
-            else:
-                data_elem = None
+    return add_topo_info_to_graph(directed_graph, topo_records, args)
 
-            if not directed_graph.has_node(element[0]):
-                directed_graph.add_node(element[0], ifc_id=element[0], ifc_class=input_dict[element]['Class'], ifc_type=input_dict[element]['Subtype'],
-                                        ifc_name=input_dict[element]['Name'], ifc_description=input_dict[element]['Description'],
-                                        ifc_system=input_dict[element]['System'], ifc_position=input_dict[element]['Position'], elem_rds=input_dict[element]['AKS'],
-                                        additional_data=data_elem)
 
-            if not directed_graph.has_edge(entity[0], element[0]):
-                directed_graph.add_edge(entity[0], element[0])
+def update_directed_graph(directed_graph, topo_records, removed_set, args):
+    # Aktualisierung des Graphs einer vorherigen Revision, die Knoten der entfernten und der betroffenen Elemente werden vorab entfernt
+    # Die Datensätze enthalten neben den betroffenen Elementen auch deren Nachbarn, sodass alle Kanten der entfernten Knoten erneut eingefügt werden
+    directed_graph.remove_nodes_from(removed_set)
 
-        # Für alle zuvorkommenden Elemente wird ein Knoten angelegt und eine Kante wird hinzugefügt
-        for element in input_dict[entity]['IN']:
-            if args.data:
-                data_elem = additional_data_dict[element[0]]
-            else:
-                data_elem = None
+    return add_topo_info_to_graph(directed_graph, topo_records, args)
+
+
+def add_topo_info_to_graph(directed_graph, topo_records, args, batch_size=50000):
+    # Integration der Knoten und Kanten aus den Datensätzen der Elemente
+    # Knoten und Kanten werden je Block dedupliziert gesammelt und gemeinsam eingefügt, die Reihenfolge der Knoten bleibt erhalten
+    node_order_dict = dict()
+    node_list = []
+    edge_dict = dict()
+    for record in topo_records:
+        guid = record['GlobalId']
+        node_order_dict[guid] = None
+        node_list.append((guid, {'ifc_id': guid, 'ifc_class': record['Class'], 'ifc_type': record['Subtype'],
+                                 'ifc_name': record['Name'], 'ifc_description': record['Description'],
+                                 'ifc_system': record['System'], 'ifc_position': record['Position'], 'elem_rds': record['AKS'],
+                                 'additional_data': record['Data']}))
+
+        # Kanten zu allen nachfolgenden Elementen, deren Metadaten folgen mit dem Datensatz des jeweiligen Elements
+        for element in record['OUT']:
+            node_order_dict[element] = None
+            edge_dict[(guid, element)] = None
+
+        # Kanten von allen zuvorkommenden Elementen
+        for element in record['IN']:
+            node_order_dict[element] = None
+            edge_dict[(element, guid)] = None
 
-            if not directed_graph.has_node(element[0]):
-                directed_graph.add_node(element[0], ifc_id=element[0], ifc_class=input_dict[element]['Class'], ifc_type=input_dict[element]['Subtype'],
-                                        ifc_name=input_dict[element]['Name'], ifc_description=input_dict[element]['Description'],
-                                        ifc_system=input_dict[element]['System'], ifc_position=input_dict[element]['Position'], elem_rds=input_dict[element]['AKS'],
-                                        additional_data=data_elem)
+        if len(node_list) >= batch_size:
+            insert_into_graph(directed_graph, node_order_dict, node_list, edge_dict)
+            node_order_dict = dict()
+            node_list = []
+            edge_dict = dict()
 
-            if not directed_graph.has_edge(element[0], entity[0]):
-                directed_graph.add_edge(element[0], entity[0])
+    insert_into_graph(directed_graph, node_order_dict, node_list, edge_dict)
 
     return directed_graph
 
 
+def insert_into_graph(directed_graph, node_order_dict, node_list, edge_dict):
+    # Gemeinsames Einfügen der Knoten in der Reihenfolge ihres ersten Auftretens, der Metadaten und der Kanten
+    directed_graph.add_nodes_from(node_order_dict)
+    directed_graph.add_nodes_from(node_list)
+    directed_graph.add_edges_from(edge_dict)
+
+
 def add_edges_based_on_spatial_tree(directed_graph, pm_list, model, args):
     # Erweiterung der topologischen Verbindungen auf Basis der Prozesse der Anreicherung
     for possible_match in pm_list:
@@ -275,7 +314,7 @@ def add_edges_based_on_spatial_tree(directed_graph, pm_list, model, args):
 
                 # Ablage aller inversen Attribute wenn der optionale Parameter gesetzt ist
                 if args.data:
-                    data_entity = get_all_properties_of_entity(element_value)
+                    data_entity = get_all_properties_of_entity(element_value, args.data_props)
                 else:
                     data_entity = None
 
@@ -302,3 +341,101 @@ def add_edges_based_on_spatial_tree(directed_graph, pm_list, model, args):
                 directed_graph.add_edge(possible_match_elements[1], possible_match_elements[0])
 
     return directed_graph
+
+
+def intern_value(value, value_list, value_index):
+    # Ablage eines Werts in der Werteliste, gleiche Werte werden nur einmal abgelegt und über ihren Index referenziert
+    if value is None:
+        return None
+    key = tuple(value) if isinstance(value, list) else value
+    if key not in value_index:
+        value_index[key] = len(value_list)
+        value_list.append(value)
+    return value_index[key]
+
+
+def get_attribute_columns(data_list, value_list, value_index):
+    # Spaltenweise Ablage der Attribute von Knoten oder Kanten, fehlende Attribute werden über ihren Zeilenindex vermerkt
+    column_dict = dict()
+    missing_dict = dict()
+    attr_names = dict.fromkeys(attr_name for data in data_list for attr_name in data)
+    for attr_name in attr_names:
+        interned = attr_name in GRAPH_BINARY_INTERNED_ATTRIBUTES
+        column = []
+        for idx, data in enumerate(data_list):
+            if attr_name not in data:
+                missing_dict.setdefault(attr_name, []).append(idx)
+                column.append(None)
+            elif interned:
+                column.append(intern_value(data[attr_name], value_list, value_index))
+            else:
+                column.append(data[attr_name])
+        column_dict[attr_name] = column
+
+    return column_dict, missing_dict
+
+
+def set_attribute_columns(data_list, column_dict, missing_dict, value_list):
+    # Wiederherstellung der Attribute von Knoten oder Kanten aus der spaltenweisen Ablage
+    for attr_name, column in column_dict.items():
+        missing_set = set(missing_dict.get(attr_name, []))
+        interned = attr_name in GRAPH_BINARY_INTERNED_ATTRIBUTES
+        for idx, value in enumerate(column):
+            if missing_set and idx in missing_set:
+                continue
+            if interned and value is not None:
+                value = value_list[value]
+            data_list[idx][attr_name] = value
+
+
+def write_graph_binary(graph, file_path, extra_dict=None):
+    # Export des Graphs im binären MessagePack-Format als Knoten- und Kantentabellen
+    # Häufig wiederkehrende Werte (Klassen, Typen, Systeme, Beschreibungen) werden nur einmal abgelegt
+    value_list = []
+    value_index = dict()
+    node_list = list(graph.nodes)
+    node_position = {node: idx for idx, node in enumerate(node_list)}
+    node_columns, node_missing = get_attribute_columns([data for node, data in graph.nodes(data=True)], value_list, value_index)
+
+    edge_list = []
+    edge_data_list = []
+    for source, target, data in graph.edges(data=True):
+        edge_list.append(node_position[source])
+        edge_list.append(node_position[target])
+        edge_data_list.append(data)
+    edge_columns, edge_missing = get_attribute_columns(edge_data_list, value_list, value_index)
+
+    graph_dict = {'format': GRAPH_BINARY_FORMAT, 'version': GRAPH_BINARY_VERSION, 'graph': graph.graph, 'values': value_list,
+                  'nodes': node_list, 'node_attributes': node_columns, 'node_missing': node_missing,
+                  'edges': edge_list, 'edge_attributes': edge_columns, 'edge_missing': edge_missing, 'extra': extra_dict or dict()}
+    with open(file_path, 'wb') as binary_file:
+        msgpack.pack(graph_dict, binary_file, use_bin_type=True)
+
+
+def read_graph_binary(file_path, graph=None):
+    # Import eines im binären MessagePack-Format abgelegten Graphs und der zusätzlich abgelegten Informationen, optional in einen bestehenden Graph
+    # Gemeinsam referenzierte Werte werden als Tupel wiederhergestellt, da sie von mehreren Knoten geteilt werden
+    with open(file_path, 'rb') as binary_file:
+        graph_dict = msgpack.unpack(binary_file, raw=False, strict_map_key=False)
+
+    if not isinstance(graph_dict, dict) or graph_dict.get('format') != GRAPH_BINARY_FORMAT:
+        raise ValueError('The given input is not a valid binary graph')
+    if graph_dict['version'] != GRAPH_BINARY_VERSION:
+        raise ValueError('The version of the binary graph is not supported')
+
+    value_list = [tuple(value) if isinstance(value, list) else value for value in graph_dict['values']]
+    node_list = graph_dict['nodes']
+    node_data_list = [dict() for node in node_list]
+    set_attribute_columns(node_data_list, graph_dict['node_attributes'], graph_dict['node_missing'], value_list)
+
+    edge_list = graph_dict['edges']
+    edge_data_list = [dict() for idx in range(len(edge_list) // 2)]
+    set_attribute_columns(edge_data_list, graph_dict['edge_attributes'], graph_dict['edge_missing'], value_list)
+
+    if graph is None:
+        graph = nx.DiGraph()
+    graph.graph.update(graph_dict['graph'])
+    graph.add_nodes_from(zip(node_list, node_data_list))
+    graph.add_edges_from((node_list[edge_list[2 * idx]], node_list[edge_list[2 * idx + 1]], data) for idx, data in enumerate(edge_data_list))
+
+    return graph, graph_dict['extra']
@@ -7,7 +7,7 @@ from helper_graph import *
 from helper_check import *
 
 
-def check_ifc_file(model, file_name):
+def check_ifc_file(model, file_name, port_tables):
     # Analyse des IFC-Modells und der darin enthaltenen Informationen zu technischen Systemen
     # Aufsetzen eines Dictionaries zur Ablage der Ergebnisse der Analyse
     result_dict = dict()
@@ -15,43 +15,122 @@ def check_ifc_file(model, file_name):
     # Analyse der Informationen im Header
     result_dict['header_info'] = check_header(model, file_name)
 
+    # Analyse der Ports, Elemente und Systeme in einem gemeinsamen Durchlauf anhand der Tabellen der Ports
+    tmp_dict = check_model(model, port_tables)
+
     # Analyse der verwendeten Beziehung zur Zuordnung von Ports zu Elementen
-    result_dict['port_relationship'], tmp = check_for_relationships(model)
+    result_dict['port_relationship'] = tmp_dict['port_relationship']
 
     # Analyse der Elemente und deren Klassifizierungen
-    result_dict['Investigated Classes'] = check_classes(model)
+    result_dict['Investigated Classes'] = tmp_dict['Investigated Classes']
 
     # Analyse der Systemzuordnungen
-    result_dict['Investigated Systems'] = check_systems(model)
+    result_dict['Investigated Systems'] = tmp_dict['Investigated Systems']
 
     # Analyse der Portzuordnungen und topologischer Verbindungen
-    tmp_dict = check_classes_for_ports(model)
     result_dict['Classes without ports'] = tmp_dict['Without_ports']
     result_dict['Elements without ports'] = tmp_dict['Elements_without_ports']
     result_dict['Classes with open ports'] = tmp_dict['With_unassigned_ports']
-    result_dict['Ports without assignment'] = check_ports_for_unassigned(model)
+    result_dict['Ports without assignment'] = tmp_dict['Ports without assignment']
 
     return result_dict
 
 
-def convert_ifc_to_graph(model, args, pm_list, info_dict, position_dict):
+def compare_revisions(model, args, info_dict, position_dict, port_tables, previous_graph):
+    # Abgleich der Elemente über die GlobalId und den Hashwert mit dem Graph der vorherigen Revision
+    # Optionen, bei deren Änderung der Graph der vorherigen Revision nicht weiterverwendet werden kann
+    revision_dict = dict()
+    revision_dict['Options'] = {'data': args.data, 'data_props': args.data_props, 'rds': args.rds, 'ce': args.ce, 'rel': info_dict['port_relationship']['RelPortToElement']}
+    revision_dict['Previous graph'] = None
+
+    logging.info('Elements are being hashed')
+    revision_dict['Hashes'] = calculate_entity_hashes(model, args, get_distribution_elements(model, info_dict), position_dict, port_tables)
+    logging.info('Elements were successfully hashed')
+
+    if previous_graph is not None and previous_graph.graph.get('revision', {}).get('options') == revision_dict['Options']:
+        previous_revision = previous_graph.graph.pop('revision')
+        revision_dict['Previous graph'] = previous_graph
+        revision_dict['Possible matches'] = previous_revision['possible_matches']
+        revision_dict['Changed'] = set(guid for guid, entity_hash in revision_dict['Hashes'].items() if previous_revision['hashes'].get(guid) != entity_hash)
+        revision_dict['Removed'] = set(previous_graph.nodes) - set(revision_dict['Hashes'])
+
+    return revision_dict
+
+
+def convert_ifc_to_graph(model, args, pm_list, info_dict, position_dict, port_tables, revision_dict=None):
     # Überführung der topologischen Informationen aus dem IFC-Modell in einen Graph
-    # Vorbereitung der topologischen Informationen zur Überführung in den Graph
-    logging.info('Topological information is being extracted')
-    result_dict, additional_data_dict = get_topo_info(model, args, info_dict, position_dict)
+    if revision_dict is not None and revision_dict['Previous graph'] is not None:
+        # Die Nachbarn der geänderten Elemente und die Elemente der bisherigen räumlichen Anreicherung werden ebenfalls neu aufbereitet
+        previous_graph = revision_dict['Previous graph']
+        changed_set = revision_dict['Changed']
+        removed_set = revision_dict['Removed']
+        affected_dict = get_affected_elements(previous_graph, changed_set, removed_set, revision_dict['Possible matches'])
+        affected_set = affected_dict['Affected']
+        neighbour_set = affected_dict['Neighbours']
+
+        logging.info('Topological information of %d changed, %d affected and %d neighbouring elements is being extracted, %d elements were removed',
+                     len(changed_set), len(affected_set) - len(changed_set & affected_set), len(neighbour_set), len(removed_set))
+        topo_records = get_topo_info(model, args, info_dict, position_dict, port_tables, affected_set | neighbour_set)
+
+        # Aktualisierung des Graphs der vorherigen Revision, die erneut aufbereiteten Elemente werden vorab entfernt
+        logging.info('Graph of the previous revision is being updated')
+        directed_graph = update_directed_graph(previous_graph, topo_records, removed_set | (affected_set & set(revision_dict['Hashes'])), args)
 
-    # Konzeption des Graphs und Integration der Daten
-    logging.info('Graph is being built')
-    directed_graph = create_directed_graph(result_dict, additional_data_dict, args)
+    else:
+        # Konzeption des Graphs, die topologischen Informationen werden elementweise aufbereitet und direkt integriert
+        logging.info('Topological information is being extracted and the graph is being built')
+        topo_records = get_topo_info(model, args, info_dict, position_dict, port_tables)
+        directed_graph = create_directed_graph(topo_records, args)
 
     # Ergänzung von gerichteten Kanten basierend auf den Ergebnissen der Anreicherungsprozesse
     if args.ce:
         logging.info('Additional edges are being added to the graph')
         directed_graph = add_edges_based_on_spatial_tree(directed_graph, pm_list, model, args)
 
+    # Ablage der Hashwerte für die inkrementelle Überführung der nächsten Revision
+    if revision_dict is not None:
+        directed_graph.graph['revision'] = {'options': revision_dict['Options'], 'hashes': revision_dict['Hashes'], 'possible_matches': pm_list}
+
     return directed_graph
 
 
+def load_previous_graph(graph_path):
+    # Import des Graphs der vorherigen Revision aus der Knoten-/Kantenliste Darstellung im JSON-Format
+    if not os.path.isfile(graph_path):
+        return None
+
+    logging.info('Graph of the previous revision is being imported')
+    try:
+        if graph_path.endswith('.msgpack'):
+            previous_graph, extra_dict = read_graph_binary(graph_path)
+        else:
+            with open(graph_path, 'r', encoding='utf8') as json_file:
+                previous_graph = nx.node_link_graph(json.load(json_file))
+    except (ValueError, KeyError):
+        logging.warning('Graph of the previous revision could not be imported, the graph is built completely')
+        return None
+
+    # Wiederherstellung der Tupel, die im JSON-Format als Listen abgelegt werden
+    for node in previous_graph.nodes(data=True):
+        if node[1].get('ifc_system'):
+            node[1]['ifc_system'] = tuple(node[1]['ifc_system'])
+    logging.info('Graph of the previous revision was successfully imported')
+
+    return previous_graph
+
+
+def split_property_names(value):
+    # Aufteilung der mit -data_props kommagetrennt angegebenen Bezeichner der Eigenschaften
+    return [name.strip() for name in value.split(',') if name.strip()]
+
+
+def get_graph_extension(args):
+    # Dateiendung des exportierten Graphs entsprechend des gewählten Austauschformats
+    if args.bin:
+        return '.msgpack'
+    return '.json'
+
+
 def main(args):
     # IFC2GRAPH Prozess
     # Konfiguration des Logs
@@ -64,6 +143,15 @@ def main(args):
 
     logging.info('Process started with options %r', args)
 
+    # Kontrolle der optionalen Abhängigkeit des binären Austauschformats
+    if args.bin and msgpack is None:
+        return logging.warning('The binary graph format requires the package msgpack')
+
+    # Die Beschränkung der Eigenschaften wirkt nur in Verbindung mit -data
+    if args.data_props and not args.data:
+        logging.warning('The option -data_props is ignored without -data')
+        args.data_props = None
+
     # Überprüfen ob es sich bei der zu importierenden Datei um ein IFC-Modell handelt
     if not args.input_file.lower().endswith('.ifc'):
         return logging.warning('The given Input is not in the *.ifc Format')
@@ -80,9 +168,17 @@ def main(args):
     if main_model.wrapped_data.schema != 'IFC4':
         return logging.warning('The given input is not in the necessary IFC4 format.')
 
+    # Die zwischengespeicherten Eigenschaftssätze eines zuvor überführten Modells werden verworfen
+    clear_property_cache()
+
+    # Aufstellen der Tabellen zur Zuordnung und zu den topologischen Verbindungen der Ports, die Grundlage der Analyse sind
+    logging.info('Port tables are being created')
+    port_tables = get_port_tables(main_model)
+    logging.info('Port tables were successfully created')
+
     # Aufruf der Prozesse der Analyse der enthaltenen topologischen Informationen
     logging.info('Model is getting checked')
-    info_dict = check_ifc_file(main_model, os.path.basename(args.input_file)[:-4])
+    info_dict = check_ifc_file(main_model, os.path.basename(args.input_file)[:-4], port_tables)
     logging.info('Model was successfully checked')
 
     # Export einer BCF-Datei zu Elementen mit offenen Ports
@@ -104,12 +200,18 @@ def main(args):
     position_dict = calculate_all_absolute_positions(main_model)
     logging.info('Calculate absolute position of elements and corresponding ports was successful')
 
+    # Abgleich mit dem Graph der vorherigen Revision vor der Anreicherung, sodass nur die offenen Ports im Umfeld der geänderten Elemente kontrolliert werden
+    revision_dict = None
+    if args.inc:
+        previous_graph = load_previous_graph(os.path.dirname(args.input_file) + '/GRAPH_' + os.path.basename(args.input_file)[:-4] + get_graph_extension(args))
+        revision_dict = compare_revisions(main_model, args, info_dict, position_dict, port_tables, previous_graph)
+
     # Konzeption eines R-Baum der Ports basierend auf der Position im dreidimensionalen Raum
     if args.ce or args.bcf_pm:
         logging.info('Spatial Tree is being created')
 
         # Konzeption eines R-Baums
-        index_dict = build_spatial_index(position_dict['IfcDistributionPort'])
+        index_dict = build_spatial_index(position_dict)
         logging.info('Spatial Tree was successfully created')
 
         # Abfrage des R-Baums um potentielle topologische Verbindungen zu identifizieren
@@ -119,14 +221,20 @@ def main(args):
         else:
             spatial_bound = 50
 
-        result_check_port_dict = check_ports(main_model, info_dict, index_dict, position_dict, spatial_bound)
+        # Bei der inkrementellen Überführung werden nur die offenen Ports im Umfeld der geänderten Elemente kontrolliert, die BCF-Datei umfasst dagegen alle möglichen Verbindungen
+        if not args.bcf_pm and revision_dict is not None and revision_dict['Previous graph'] is not None:
+            result_check_port_dict = check_ports_of_changed_elements(port_tables, info_dict, index_dict, position_dict, spatial_bound,
+                                                                     revision_dict['Changed'], revision_dict['Removed'], revision_dict['Possible matches'])
+            logging.info('%d open ports around the changed elements were checked', result_check_port_dict['Checked_ports'])
+        else:
+            result_check_port_dict = check_ports(port_tables, info_dict, index_dict, position_dict, spatial_bound)
         info_dict['Possible Matches'] = result_check_port_dict['Possible_connected_elements']
         logging.info('Possible matches were successfully checked')
 
         # Export einer gezippten BCF-Datei zu Elementen mit offenen Ports und deren möglichen Verbindungen in untergeordneten BCF-Dateien
         if args.bcf_pm:
             logging.info('BCF about elements with unassigned ports and their possible matches is being created')
-            bcf_guids = []
+            bcf_list = []
             if len(result_check_port_dict['Possible_connected_elements']) > 0:
                 for x in result_check_port_dict['Possible_connected_elements']:
                     transfer_dict = {'Selections': [x['source_elem_id']],
@@ -134,8 +242,8 @@ def main(args):
                                      'Description': 'Elements with open ports and their possible matches',
                                      'Visibility': 'False',
                                      'Exceptions': [x['sink_elem_id']]}
-                    bcf_guids.append(create_bcf(transfer_dict, args, zipped=False))
-                zip_bcfs(bcf_guids, args, zipped=False)
+                    bcf_list.append(transfer_dict)
+                create_bcf_collection(bcf_list, args)
                 logging.info('BCF about elements with unassigned ports and their possible matches was successfully created')
             else:
                 logging.warning('BCF about elements with unassigned ports and their possible matches could not be created. There are no possible matches.')
@@ -152,25 +260,19 @@ def main(args):
     if args.ce:
         pm_list = result_check_port_dict['Possible_connected_elements']
 
-    output_graph = convert_ifc_to_graph(main_model, args, pm_list, info_dict, position_dict)
+    output_graph = convert_ifc_to_graph(main_model, args, pm_list, info_dict, position_dict, port_tables, revision_dict)
     logging.info('Model was successfully converted into graph')
 
-    # Export des Graphs in Knoten-/Kantenliste Darstellung und Ablage als JSON-Datei
-    data_drop = nx.node_link_data(output_graph)
-    with open(os.path.dirname(args.input_file) + '/GRAPH_' + os.path.basename(args.input_file)[:-4] + '.json', 'w', encoding='utf8') as json_file:
-        json.dump(data_drop, json_file, ensure_ascii=False)
+    # Export des Graphs in Knoten-/Kantenliste Darstellung und Ablage als JSON-Datei oder binär
+    graph_path = os.path.dirname(args.input_file) + '/GRAPH_' + os.path.basename(args.input_file)[:-4] + get_graph_extension(args)
+    if args.bin:
+        write_graph_binary(output_graph, graph_path)
+    else:
+        data_drop = nx.node_link_data(output_graph)
+        with open(graph_path, 'w', encoding='utf8') as json_file:
+            json.dump(data_drop, json_file, ensure_ascii=False)
     logging.info('Graph was successfully saved')
 
-    # Entfernen der temporären Dateien
-    logging.info('Temporary files are being removed')
-    try:
-        os.remove('3d_index.data')
-        os.remove('3d_index.index')
-    except FileNotFoundError:
-        pass
-
-    logging.info('Temporary files were successfully removed')
-
 
 if __name__ == "__main__":
     # Konzeption des Command Line Interface
@@ -205,6 +307,15 @@ if __name__ == "__main__":
     # Analyse des IFC-Modells anhand des angegebenen Attributsbezeichners und Zuordnung der Werte als standardisierte Eigenschaft elem_rds an die Konten des Graphs.
     parser.add_argument("-rds", type=str, default=None, help='Give property name of the reference designation key to store in graph')
 
+    # Inkrementelle Überführung einer neuen Revision auf Basis des Graphs der vorherigen Revision (GRAPH_*.json am Pfad des IFC-Modells), nur geänderte Elemente und deren Nachbarn werden neu aufbereitet.
+    parser.add_argument("-inc", action='store_true', help="Update the graph of the previous revision instead of converting the whole model")
+
+    # Beschränkung der mit -data an den Knoten abgelegten Eigenschaften auf die kommagetrennt angegebenen Bezeichner.
+    parser.add_argument("-data_props", type=split_property_names, default=None, help="Store only the properties with the given comma separated names when using -data, e.g. Manufacturer,ModelReference")
+
+    # Ablage des Graphs im binären MessagePack-Format mit spaltenweise abgelegten Knoten und Kanten anstelle des JSON-Formats.
+    parser.add_argument("-bin", action='store_true', help="Save the graph in the binary MessagePack format (*.msgpack) instead of JSON")
+
     parse_args = parser.parse_args()
 
     # Aufruf des IFC2GRAPH Prozesses mit den notwendigen und optionalen Parametern zur Anpassung der Funktionalität
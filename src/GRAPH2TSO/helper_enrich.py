@@ -1,3 +1,7 @@
+import os
+import hashlib
+import logging
+import multiprocessing
 import networkx as nx
 from ifcopenshell import geom
 import numpy as np
@@ -127,21 +131,90 @@ def create_enriched_directed_graph(direction_list, import_graph):
     return enriched_graph
 
 
-def calculate_spatial_representation(model):
-    # Berechnung des Meshes der räumlichen Elemente
-    rep_dict = dict()
-    spatial_elements_list = model.by_type('IfcSpatialElement')
+# Zwischengespeicherte Hashwerte der Dateien je Pfad, Änderungszeitpunkt und Größe, damit jede Datei je Aufruf nur einmal gelesen wird
+FILE_HASH_CACHE = dict()
+
+
+def calculate_file_hash(path):
+    # Berechnung des Hashwerts über den Inhalt einer Datei
+    file_stat = os.stat(path)
+    cache_key = (os.path.abspath(path), file_stat.st_mtime_ns, file_stat.st_size)
+    if cache_key in FILE_HASH_CACHE:
+        return FILE_HASH_CACHE[cache_key]
+
+    file_hash = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            file_hash.update(chunk)
 
+    FILE_HASH_CACHE[cache_key] = file_hash.hexdigest()
+    return FILE_HASH_CACHE[cache_key]
+
+
+def tessellate_spatial_elements(model, spatial_elements_list):
+    # Tessellierung der räumlichen Elemente mit dem Geometrie-Iterator von ifcopenshell auf allen verfügbaren Kernen
+    geometry_dict = dict()
     settings = geom.settings()
     settings.set(settings.USE_WORLD_COORDS, True)
 
+    try:
+        iterator = geom.iterator(settings, model, multiprocessing.cpu_count(), include=spatial_elements_list)
+        if iterator.initialize():
+            while True:
+                shape = iterator.get()
+                vertices = np.array(shape.geometry.verts).reshape(-1, 3)
+                faces = np.array(shape.geometry.faces).reshape(-1, 3)
+                geometry_dict[shape.guid] = (vertices, faces)
+                if not iterator.next():
+                    break
+        else:
+            logging.warning('Geometry iterator could not be initialized, the spatial elements are tessellated one by one')
+    except (RuntimeError, TypeError, ValueError) as error:
+        logging.warning('Geometry iterator failed, the remaining spatial elements are tessellated one by one: %r', error)
+
+    # Elemente, die nicht durch den Iterator tesselliert wurden, werden einzeln berechnet
     for spatial_elem in spatial_elements_list:
-        rep_dict[spatial_elem.GlobalId] = None
-        if spatial_elem.Representation:
-
+        if spatial_elem.GlobalId not in geometry_dict:
             shape = geom.create_shape(settings, spatial_elem)
             vertices = np.array(shape.geometry.verts).reshape(-1, 3)
             faces = np.array(shape.geometry.faces).reshape(-1, 3)
+            geometry_dict[spatial_elem.GlobalId] = (vertices, faces)
+
+    return geometry_dict
+
+
+def calculate_spatial_representation(model, cache_path=None):
+    # Berechnung des Meshes der räumlichen Elemente
+    # Optional werden die Vertices und Faces je GlobalId in einer komprimierten *.npz Datei zwischengespeichert und bei erneuten Aufrufen geladen
+    rep_dict = dict()
+    geometry_dict = dict()
+    spatial_elements_list = model.by_type('IfcSpatialElement')
+
+    if cache_path and os.path.isfile(cache_path):
+        with np.load(cache_path) as cache:
+            for key in cache.files:
+                if key.endswith('_verts'):
+                    guid = key[:-len('_verts')]
+                    geometry_dict[guid] = (cache[key], cache[guid + '_faces'])
+
+    missing_list = []
+    for spatial_elem in spatial_elements_list:
+        if spatial_elem.Representation and spatial_elem.GlobalId not in geometry_dict:
+            missing_list.append(spatial_elem)
+
+    if missing_list:
+        geometry_dict.update(tessellate_spatial_elements(model, missing_list))
+        if cache_path:
+            cache_dict = dict()
+            for guid, (vertices, faces) in geometry_dict.items():
+                cache_dict[guid + '_verts'] = vertices
+                cache_dict[guid + '_faces'] = faces
+            np.savez_compressed(cache_path, **cache_dict)
+
+    for spatial_elem in spatial_elements_list:
+        rep_dict[spatial_elem.GlobalId] = None
+        if spatial_elem.Representation:
+            vertices, faces = geometry_dict[spatial_elem.GlobalId]
             mesh = trimesh.Trimesh(vertices=vertices, faces=faces)
             rep_dict[spatial_elem.GlobalId] = mesh
 
@@ -2,6 +2,12 @@ import ifcopenshell
 import logging
 import argparse
 import json
+import pickle
+import hashlib
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 
 from IFC2GRAPH.helper_graph import *
 from IFC2GRAPH.helper_check import *
@@ -10,8 +16,21 @@ from GRAPH.helper_enrich import *
 
 from GRAPH2TSO.helper_convert import *
 
+# Optionale Abhängigkeit zur Abfrage des maximalen Arbeitsspeichers, unter Windows nicht verfügbar
+try:
+    import resource
+except ImportError:
+    resource = None
 
-def check_ifc_file(model, file_name):
+# Messwerte der Prozessschritte bei aktiviertem Profiling, ohne Profiling wird nichts aufgezeichnet
+PROFILE_LIST = None
+
+# Fester Ausgangswert des Namespaces der deterministischen Bezeichner, wenn kein Namespace angegeben ist
+# Der Inhalt der Eingabedateien fließt bewusst nicht ein, damit unveränderte Komponenten über Revisionen hinweg dieselben Bezeichner behalten
+ID_NAMESPACE_SEED = 'IFC2TSO'
+
+
+def check_ifc_file(model, file_name, port_tables):
     # Analyse des IFC-Modells und der darin enthaltenen Informationen zu technischen Systemen
     # Aufsetzen eines Dictionaries zur Ablage der Ergebnisse der Analyse
     result_dict = dict()
@@ -19,43 +38,122 @@ def check_ifc_file(model, file_name):
     # Analyse der Informationen im Header
     result_dict['header_info'] = check_header(model, file_name)
 
+    # Analyse der Ports, Elemente und Systeme in einem gemeinsamen Durchlauf anhand der Tabellen der Ports
+    tmp_dict = check_model(model, port_tables)
+
     # Analyse der verwendeten Beziehung zur Zuordnung von Ports zu Elementen
-    result_dict['port_relationship'], tmp = check_for_relationships(model)
+    result_dict['port_relationship'] = tmp_dict['port_relationship']
 
     # Analyse der Elemente und deren Klassifizierungen
-    result_dict['Investigated Classes'] = check_classes(model)
+    result_dict['Investigated Classes'] = tmp_dict['Investigated Classes']
 
     # Analyse der Systemzuordnungen
-    result_dict['Investigated Systems'] = check_systems(model)
+    result_dict['Investigated Systems'] = tmp_dict['Investigated Systems']
 
     # Analyse der Portzuordnungen und topologischer Verbindungen
-    tmp_dict = check_classes_for_ports(model)
     result_dict['Classes without ports'] = tmp_dict['Without_ports']
     result_dict['Elements without ports'] = tmp_dict['Elements_without_ports']
     result_dict['Classes with open ports'] = tmp_dict['With_unassigned_ports']
-    result_dict['Ports without assignment'] = check_ports_for_unassigned(model)
+    result_dict['Ports without assignment'] = tmp_dict['Ports without assignment']
 
     return result_dict
 
 
-def convert_ifc_to_graph(model, args, pm_list, info_dict, position_dict):
+def compare_revisions(model, args, info_dict, position_dict, port_tables, previous_graph):
+    # Abgleich der Elemente über die GlobalId und den Hashwert mit dem Graph der vorherigen Revision
+    # Optionen, bei deren Änderung der Graph der vorherigen Revision nicht weiterverwendet werden kann
+    revision_dict = dict()
+    revision_dict['Options'] = {'data': args.data, 'data_props': args.data_props, 'rds': args.rds, 'ce': args.ce, 'rel': info_dict['port_relationship']['RelPortToElement']}
+    revision_dict['Previous graph'] = None
+
+    logging.info('Elements are being hashed')
+    revision_dict['Hashes'] = calculate_entity_hashes(model, args, get_distribution_elements(model, info_dict), position_dict, port_tables)
+    logging.info('Elements were successfully hashed')
+
+    if previous_graph is not None and previous_graph.graph.get('revision', {}).get('options') == revision_dict['Options']:
+        previous_revision = previous_graph.graph.pop('revision')
+        revision_dict['Previous graph'] = previous_graph
+        revision_dict['Possible matches'] = previous_revision['possible_matches']
+        revision_dict['Changed'] = set(guid for guid, entity_hash in revision_dict['Hashes'].items() if previous_revision['hashes'].get(guid) != entity_hash)
+        revision_dict['Removed'] = set(previous_graph.nodes) - set(revision_dict['Hashes'])
+
+    return revision_dict
+
+
+def convert_ifc_to_graph(model, args, pm_list, info_dict, position_dict, port_tables, revision_dict=None):
     # Überführung der topologischen Informationen aus dem IFC-Modell in einen Graph
-    # Vorbereitung der topologischen Informationen zur Überführung in den Graph
-    logging.info('Topological information is being extracted')
-    result_dict, additional_data_dict = get_topo_info(model, args, info_dict, position_dict)
+    if revision_dict is not None and revision_dict['Previous graph'] is not None:
+        # Die Nachbarn der geänderten Elemente und die Elemente der bisherigen räumlichen Anreicherung werden ebenfalls neu aufbereitet
+        previous_graph = revision_dict['Previous graph']
+        changed_set = revision_dict['Changed']
+        removed_set = revision_dict['Removed']
+        affected_dict = get_affected_elements(previous_graph, changed_set, removed_set, revision_dict['Possible matches'])
+        affected_set = affected_dict['Affected']
+        neighbour_set = affected_dict['Neighbours']
+
+        logging.info('Topological information of %d changed, %d affected and %d neighbouring elements is being extracted, %d elements were removed',
+                     len(changed_set), len(affected_set) - len(changed_set & affected_set), len(neighbour_set), len(removed_set))
+        topo_records = get_topo_info(model, args, info_dict, position_dict, port_tables, affected_set | neighbour_set)
+
+        # Aktualisierung des Graphs der vorherigen Revision, die erneut aufbereiteten Elemente werden vorab entfernt
+        logging.info('Graph of the previous revision is being updated')
+        directed_graph = update_directed_graph(previous_graph, topo_records, removed_set | (affected_set & set(revision_dict['Hashes'])), args)
 
-    # Konzeption des Graphs und Integration der Daten
-    logging.info('Graph is being built')
-    directed_graph = create_directed_graph(result_dict, additional_data_dict, args)
+    else:
+        # Konzeption des Graphs, die topologischen Informationen werden elementweise aufbereitet und direkt integriert
+        logging.info('Topological information is being extracted and the graph is being built')
+        topo_records = get_topo_info(model, args, info_dict, position_dict, port_tables)
+        directed_graph = create_directed_graph(topo_records, args)
 
     # Ergänzung von gerichteten Kanten basierend auf den Ergebnissen der Anreicherungsprozesse
     if args.ce:
         logging.info('Additional edges are being added to the graph')
         directed_graph = add_edges_based_on_spatial_tree(directed_graph, pm_list, model, args)
 
+    # Ablage der Hashwerte für die inkrementelle Überführung der nächsten Revision
+    if revision_dict is not None:
+        directed_graph.graph['revision'] = {'options': revision_dict['Options'], 'hashes': revision_dict['Hashes'], 'possible_matches': pm_list}
+
     return directed_graph
 
 
+def load_previous_graph(graph_path):
+    # Import des Graphs der vorherigen Revision aus der Knoten-/Kantenliste Darstellung im JSON-Format
+    if not os.path.isfile(graph_path):
+        return None
+
+    logging.info('Graph of the previous revision is being imported')
+    try:
+        if graph_path.endswith('.msgpack'):
+            previous_graph, extra_dict = read_graph_binary(graph_path)
+        else:
+            with open(graph_path, 'r', encoding='utf8') as json_file:
+                previous_graph = nx.node_link_graph(json.load(json_file))
+    except (ValueError, KeyError):
+        logging.warning('Graph of the previous revision could not be imported, the graph is built completely')
+        return None
+
+    # Wiederherstellung der Tupel, die im JSON-Format als Listen abgelegt werden
+    for node in previous_graph.nodes(data=True):
+        if node[1].get('ifc_system'):
+            node[1]['ifc_system'] = tuple(node[1]['ifc_system'])
+    logging.info('Graph of the previous revision was successfully imported')
+
+    return previous_graph
+
+
+def split_property_names(value):
+    # Aufteilung der mit -data_props kommagetrennt angegebenen Bezeichner der Eigenschaften
+    return [name.strip() for name in value.split(',') if name.strip()]
+
+
+def get_graph_extension(args):
+    # Dateiendung der exportierten Graphen entsprechend des gewählten Austauschformats
+    if args.bin:
+        return '.msgpack'
+    return '.json'
+
+
 def main_ifc2graph(args, import_ifc):
     # IFC2GRAPH Prozess
     # Überprüfen ob es sich bei der zu importierenden Datei um ein IFC-Modell handelt
@@ -65,8 +163,17 @@ def main_ifc2graph(args, import_ifc):
     if not import_ifc.lower().endswith('.ifc'):
         return logging.warning('The given Input is not in the *.ifc Format')
 
+    # Abfrage des Zwischenspeichers, BCF-Dateien werden nur bei der Überführung erzeugt
+    stage_key = None
+    if args.cache and not args.bcf_p and not args.bcf_pm:
+        stage_key = get_stage_key(args, 'IFC2GRAPH', import_ifc)
+        cached_result = load_stage_cache(args, 'IFC2GRAPH', stage_key)
+        if cached_result is not None:
+            return cached_result
+
     # Parsen des Modells mit ifcopenshell
     logging.info('Model is getting imported')
+    profile_start = start_profile_step()
     try:
         main_model = ifcopenshell.open(import_ifc)
         logging.info('Model was successfully imported')
@@ -77,9 +184,25 @@ def main_ifc2graph(args, import_ifc):
     if main_model.wrapped_data.schema != 'IFC4':
         return logging.warning('The given input is not in the necessary IFC4 format.')
 
+    # Die Abfrage aller Entitäten zur Zählung erfolgt nur bei aktiviertem Profiling
+    if profile_start:
+        record_profile_step('IFC2GRAPH import', profile_start, import_ifc, entities=len(main_model.by_type('IfcRoot')))
+
+    # Die zwischengespeicherten Eigenschaftssätze eines zuvor überführten Modells werden verworfen
+    clear_property_cache()
+
+    # Aufstellen der Tabellen zur Zuordnung und zu den topologischen Verbindungen der Ports, die Grundlage der Analyse sind
+    logging.info('Port tables are being created')
+    profile_start = start_profile_step()
+    port_tables = get_port_tables(main_model)
+    record_profile_step('IFC2GRAPH port tables', profile_start, import_ifc, ports=len(port_tables['Type']))
+    logging.info('Port tables were successfully created')
+
     # Aufruf der Prozesse der Analyse der enthaltenen topologischen Informationen
     logging.info('Model is getting checked')
-    info_dict = check_ifc_file(main_model, os.path.basename(import_ifc)[:-4])
+    profile_start = start_profile_step()
+    info_dict = check_ifc_file(main_model, os.path.basename(import_ifc)[:-4], port_tables)
+    record_profile_step('IFC2GRAPH check', profile_start, import_ifc, classes=len(info_dict['Investigated Classes']), systems=len(info_dict['Investigated Systems']))
     logging.info('Model was successfully checked')
 
     # Export einer BCF-Datei zu Elementen mit offenen Ports
@@ -98,15 +221,27 @@ def main_ifc2graph(args, import_ifc):
 
     # Analyse der absoluten Position der Ports im dreidimensionalen Raum
     logging.info('Calculate absolute position of elements and corresponding ports')
+    profile_start = start_profile_step()
     position_dict = calculate_all_absolute_positions(main_model)
+    record_profile_step('IFC2GRAPH positions', profile_start, import_ifc, positions=len(position_dict['Index']))
     logging.info('Calculate absolute position of elements and corresponding ports was successful')
 
+    # Abgleich mit dem Graph der vorherigen Revision vor der Anreicherung, sodass nur die offenen Ports im Umfeld der geänderten Elemente kontrolliert werden
+    revision_dict = None
+    if args.inc:
+        previous_graph = load_previous_graph(os.path.dirname(import_ifc) + '/GRAPH_' + os.path.basename(import_ifc)[:-4] + get_graph_extension(args))
+        profile_start = start_profile_step()
+        revision_dict = compare_revisions(main_model, args, info_dict, position_dict, port_tables, previous_graph)
+        record_profile_step('IFC2GRAPH revision comparison', profile_start, import_ifc, elements=len(revision_dict['Hashes']))
+
     # Konzeption eines R-Baum der Ports basierend auf der Position im dreidimensionalen Raum
     if args.ce or args.bcf_pm:
         logging.info('Spatial Tree is being created')
 
         # Konzeption eines R-Baums
-        index_dict = build_spatial_index(position_dict['IfcDistributionPort'])
+        profile_start = start_profile_step()
+        index_dict = build_spatial_index(position_dict)
+        record_profile_step('IFC2GRAPH R-tree', profile_start, import_ifc, ports=len(index_dict['Mapping']) // 2)
         logging.info('Spatial Tree was successfully created')
 
         # Abfrage des R-Baums um potentielle topologische Verbindungen zu identifizieren
@@ -116,14 +251,22 @@ def main_ifc2graph(args, import_ifc):
         else:
             spatial_bound = 50
 
-        result_check_port_dict = check_ports(main_model, info_dict, index_dict, position_dict, spatial_bound)
+        profile_start = start_profile_step()
+        # Bei der inkrementellen Überführung werden nur die offenen Ports im Umfeld der geänderten Elemente kontrolliert, die BCF-Datei umfasst dagegen alle möglichen Verbindungen
+        if not args.bcf_pm and revision_dict is not None and revision_dict['Previous graph'] is not None:
+            result_check_port_dict = check_ports_of_changed_elements(port_tables, info_dict, index_dict, position_dict, spatial_bound,
+                                                                     revision_dict['Changed'], revision_dict['Removed'], revision_dict['Possible matches'])
+            logging.info('%d open ports around the changed elements were checked', result_check_port_dict['Checked_ports'])
+        else:
+            result_check_port_dict = check_ports(port_tables, info_dict, index_dict, position_dict, spatial_bound)
         info_dict['Possible Matches'] = result_check_port_dict['Possible_connected_elements']
+        record_profile_step('IFC2GRAPH port matching', profile_start, import_ifc, possible_matches=len(info_dict['Possible Matches']))
         logging.info('Possible matches were successfully checked')
 
         # Export einer gezippten BCF-Datei zu Elementen mit offenen Ports und deren möglichen Verbindungen in untergeordneten BCF-Dateien
         if args.bcf_pm:
             logging.info('BCF about elements with unassigned ports and their possible matches is being created')
-            bcf_guids = []
+            bcf_list = []
             if len(result_check_port_dict['Possible_connected_elements']) > 0:
                 for x in result_check_port_dict['Possible_connected_elements']:
                     transfer_dict = {'Selections': [x['source_elem_id']],
@@ -131,8 +274,8 @@ def main_ifc2graph(args, import_ifc):
                                      'Description': 'Elements with open ports and their possible matches',
                                      'Visibility': 'False',
                                      'Exceptions': [x['sink_elem_id']]}
-                    bcf_guids.append(create_bcf(transfer_dict, args, zipped=False))
-                zip_bcfs(bcf_guids, args, zipped=False)
+                    bcf_list.append(transfer_dict)
+                create_bcf_collection(bcf_list, args)
                 logging.info('BCF about elements with unassigned ports and their possible matches was successfully created')
             else:
                 logging.warning('BCF about elements with unassigned ports and their possible matches could not be created. There are no possible matches.')
@@ -143,18 +286,13 @@ def main_ifc2graph(args, import_ifc):
     if args.ce:
         pm_list = result_check_port_dict['Possible_connected_elements']
 
-    output_graph = convert_ifc_to_graph(main_model, args, pm_list, info_dict, position_dict)
+    profile_start = start_profile_step()
+    output_graph = convert_ifc_to_graph(main_model, args, pm_list, info_dict, position_dict, port_tables, revision_dict)
+    record_profile_step('IFC2GRAPH graph build', profile_start, import_ifc, nodes=output_graph.number_of_nodes(), edges=output_graph.number_of_edges())
     logging.info('Model was successfully converted into graph')
 
-    # Entfernen der temporären Dateien
-    logging.info('Temporary files are being removed')
-    try:
-        os.remove('3d_index.data')
-        os.remove('3d_index.index')
-    except FileNotFoundError:
-        pass
-
-    logging.info('Temporary files were successfully removed')
+    if stage_key:
+        save_stage_cache(args, 'IFC2GRAPH', stage_key, (output_graph, info_dict))
 
     return output_graph, info_dict
 
@@ -169,17 +307,17 @@ def main_graph(args, graph_list):
     #                           #
     #                           #
     #                           #
-    import_graph = nx.DiGraph()
-    for ifc2graph_graph_info in graph_list:
-
-        # Überführung der Daten in einen gerichteten Graph
-        logging.info('Graph is getting merged using networkx')
-        try:
-            import_graph = nx.compose(import_graph, ifc2graph_graph_info[0])
-        except ValueError:
-            return logging.warning('The graph could not be merged using networkx')
-
-        logging.info('Graph was successfully imported')
+    # Überführung der Daten in einen gerichteten Graph
+    logging.info('Graphs are getting merged')
+    profile_start = start_profile_step()
+    import_graph, conflict_dict = merge_graphs([ifc2graph_graph_info[0] for ifc2graph_graph_info in graph_list])
+    record_profile_step('GRAPH merge', profile_start, graphs=len(graph_list), nodes=import_graph.number_of_nodes(), edges=import_graph.number_of_edges())
+    # Die Hashwerte der inkrementellen Überführung werden nur im Graph des jeweiligen IFC-Modells benötigt
+    import_graph.graph.pop('revision', None)
+    for node, conflicts in conflict_dict.items():
+        logging.warning('Node %s is contained in several graphs with conflicting attributes: %s', node, ', '.join(sorted(conflicts)))
+
+    logging.info('Graphs were successfully merged')
 
     #                            #
     #                            #
@@ -212,7 +350,9 @@ def main_graph(args, graph_list):
 
     # Analyse der Informationen im Graph
     logging.info('Data is being analysed')
+    profile_start = start_profile_step()
     info_dict = check_import_graph_info_graph(import_graph)
+    record_profile_step('GRAPH analysis', profile_start, systems=info_dict['Systems']['Total'])
     logging.info('Data was successfully analysed')
 
     # Löschen von schwach verbundenen Systemem mit der Größe <= R
@@ -234,6 +374,7 @@ def main_graph(args, graph_list):
 
     # Anreicherung der Systemhierarchie
     logging.info('Hierarchical structure of the systems is being enriched.')
+    profile_start = start_profile_step()
     hierarchie_dict = dict()
     hierarchie_dict['IS'] = dict()
     hierarchie_dict['FS'] = dict()
@@ -275,12 +416,13 @@ def main_graph(args, graph_list):
             system_dict[node[0]]['IS'] = []
             system_dict[node[0]]['FS'] = []
             system_dict[node[0]]['TS'] = []
+    record_profile_step('GRAPH hierarchy', profile_start, IS=len(hierarchie_dict['IS']), FS=len(hierarchie_dict['FS']), TS=len(hierarchie_dict['TS']))
 
     # Export der Anreicherungsergebnisse im BCF-Format
     if args.bcf_sh:
         logging.info('Results of the enrichment are being exported as bcf files.')
         mapping = {'IS': 'FS', 'FS': 'TS', 'TS': 'TS'}
-        bcf_guids = []
+        bcf_list = []
         for hier_level, system_dict_2 in hierarchie_dict.items():
             for system_guid, system_value in system_dict_2.items():
                 transfer_dict = {'Selections': system_value['Components'],
@@ -288,15 +430,19 @@ def main_graph(args, graph_list):
                                  'Description': 'Ifc-Systems %s of components' % (system_value['IFC-Systems']),
                                  'Visibility': 'True',
                                  'Exceptions': []}
-                bcf_guids.append(create_bcf(transfer_dict, args, zipped=False))
-        zip_bcfs(bcf_guids, args, zipped=False)
+                bcf_list.append(transfer_dict)
+        create_bcf_collection(bcf_list, args)
         logging.info('Results of the enrichment were successfully exported as bcf files.')
 
+    profile_start = start_profile_step()
     hierarchie_dict = check_system_connections(import_graph, hierarchie_dict, system_dict)
+    record_profile_step('GRAPH interfaces', profile_start, interfaces=len(hierarchie_dict['Schnittstellen']))
 
     # Aufsetzen eines neuen Graphs mit den zusätzlichen Ergebnissen der Anreicherung
     logging.info('Resulting graph is converted and additional information is added.')
+    profile_start = start_profile_step()
     export_graph = convert_import_graph_in_export_graph(import_graph, system_dict)
+    record_profile_step('GRAPH conversion', profile_start, nodes=export_graph.number_of_nodes(), edges=export_graph.number_of_edges())
     logging.info('Resulting graph was successfully converted and additional information was added.')
 
     #                                       #
@@ -310,12 +456,9 @@ def main_graph(args, graph_list):
     # Komplexitätsreduktion des Graphs
     if args.cr:
         logging.info('Topological complexity of the graph is being reduced.')
-        len_nodes_before = 1
-        len_nodes_after = 0
-        while len_nodes_before != len_nodes_after:
-            len_nodes_before = len(export_graph.nodes)
-            export_graph = aggregate_graph(export_graph)
-            len_nodes_after = len(export_graph.nodes)
+        profile_start = start_profile_step()
+        aggregate_graph(export_graph)
+        record_profile_step('GRAPH aggregation', profile_start, nodes=export_graph.number_of_nodes(), edges=export_graph.number_of_edges())
         logging.info('Topological complexity of the graph was successfully reduced.')
 
     return export_graph, info_dict, hierarchie_dict
@@ -323,7 +466,12 @@ def main_graph(args, graph_list):
 
 def main_graph2tso(args, import_graph, hierarchie_dict):
     logging.info('Processstep GRAPH2TSO started')
+
+    # Die URIRefs einer zuvor erfolgten Überführung werden verworfen
+    clear_uri_table()
+
     # Analyse der importierten Graphen auf birektionalen Austausch zwischen Komponenten
+    profile_start = start_profile_step()
     result_set = set()
     for node in import_graph.nodes(data=True):
         suc_iter = import_graph.successors(node[0])
@@ -332,6 +480,7 @@ def main_graph2tso(args, import_graph, hierarchie_dict):
             if node[0] in node_2_iter:
                 result_set.add(node[0])
                 result_set.add(suc)
+    record_profile_step('GRAPH2TSO flow direction', profile_start, bidirectional=len(result_set))
 
     # Export der Analyse der Fließrichtung als BCF
     if args.bcf_fd:
@@ -353,8 +502,10 @@ def main_graph2tso(args, import_graph, hierarchie_dict):
     #                            #
 
     # Konzeption eines neuen Graphs mit korrekten gerichteten Kanten
+    profile_start = start_profile_step()
     directions_list = list()
     enriched_graph = create_enriched_directed_graph(directions_list, import_graph)
+    record_profile_step('GRAPH2TSO directed graph', profile_start, nodes=enriched_graph.number_of_nodes(), edges=enriched_graph.number_of_edges())
 
     # Anreicherung von inneren Verbindungen
     ic_json = dict()
@@ -396,21 +547,41 @@ def main_graph2tso(args, import_graph, hierarchie_dict):
         if not args.add_spatial.lower().endswith('.ifc'):
             return logging.warning('The given Input is not in the *.ifc Format')
 
-        logging.info('Model is getting imported')
-        try:
-            main_model = ifcopenshell.open(args.add_spatial)
-            logging.info('Model was successfully imported')
-        except OSError:
-            return logging.warning('The given input could not be imported using ifcopenshell')
-
-        # Kontrolle der Version der IFC
-        if main_model.wrapped_data.schema != 'IFC4':
-            return logging.warning('The given input is not in the necessary IFC4 format.')
+        # Abfrage der räumlichen Analyse im Zwischenspeicher, die über den Inhalt des IFC-Modells identifiziert wird
+        spatial_key = None
+        cached_result = None
+        if args.cache:
+            spatial_key = get_stage_key(args, 'SPATIAL')
+            cached_result = load_stage_cache(args, 'SPATIAL', spatial_key)
 
-        logging.info('Model is getting analysed')
-        rep_dict = calculate_spatial_representation(main_model)
-        spatial_dict = analyse_spatial_structure(main_model, rep_dict)
-        logging.info('Model was successfully analysed')
+        if cached_result is not None:
+            spatial_dict = cached_result
+        else:
+            logging.info('Model is getting imported')
+            try:
+                main_model = ifcopenshell.open(args.add_spatial)
+                logging.info('Model was successfully imported')
+            except OSError:
+                return logging.warning('The given input could not be imported using ifcopenshell')
+
+            # Kontrolle der Version der IFC
+            if main_model.wrapped_data.schema != 'IFC4':
+                return logging.warning('The given input is not in the necessary IFC4 format.')
+
+            logging.info('Model is getting analysed')
+            cache_path = None
+            if args.cache:
+                # Zwischenspeicher der Geometrie, der über den Inhalt des IFC-Modells identifiziert wird
+                os.makedirs(args.cache, exist_ok=True)
+                cache_path = os.path.join(args.cache, 'GEOM_' + calculate_file_hash(args.add_spatial) + '.npz')
+            profile_start = start_profile_step()
+            rep_dict = calculate_spatial_representation(main_model, cache_path)
+            spatial_dict = analyse_spatial_structure(main_model, rep_dict)
+            record_profile_step('GRAPH2TSO spatial analysis', profile_start, args.add_spatial, spatial_elements=len(rep_dict))
+            logging.info('Model was successfully analysed')
+
+            if spatial_key:
+                save_stage_cache(args, 'SPATIAL', spatial_key, spatial_dict)
 
     #                            #
     #                            #
@@ -422,8 +593,11 @@ def main_graph2tso(args, import_graph, hierarchie_dict):
     logging.info('Graph is getting transfered in linked data representation')
     # Überführung vom Graph in eine Wissensrepräsentation
     # Aufsetzen des Graphs und der Namespaces
-    g_ld = Graph()
-    name = str(uuid.uuid4())
+    name = create_instance_id('LD-REP')
+    if args.stream:
+        g_ld = TripleStreamWriter(os.path.dirname(args.input_files[0]) + '/LD-REP_' + name + '.' + args.stream, args.stream)
+    else:
+        g_ld = Graph()
 
     if args.use_ns:
         INST = Namespace(args.use_ns)
@@ -436,40 +610,155 @@ def main_graph2tso(args, import_graph, hierarchie_dict):
     IFC = Namespace('https://standards.buildingsmart.org/IFC/DEV/IFC4/FINAL/OWL#')
     BOT = Namespace('https://w3id.org/bot#')
 
+    # Binden der Namespaces, bei der direkten Ausgabe als Turtle vor dem ersten Tripel
+    g_ld.bind('tso', TSO)
+    g_ld.bind('rdf', RDF)
+    g_ld.bind('rdfs', RDFS)
+    g_ld.bind('inst', INST)
+    g_ld.bind('ifc4', IFC)
+    g_ld.bind('bot', BOT)
+
     # Anlegen von Konzepten mit hierarchischen Aspekten
     logging.info('Hierarchical concepts are created')
+    profile_start = start_profile_step()
     g_ld, state_dict = convert_hierarchicalconcepts_to_tso(g_ld, args, enriched_graph, hierarchie_dict, IFC, INST, TSO, RDF, RDFS)
+    record_profile_step('GRAPH2TSO convert_hierarchicalconcepts_to_tso', profile_start, triples=len(g_ld))
     logging.info('Hierarchical concepts were created successfully')
 
     # Anlegen von Konzepten mit topologischen Aspekten
     logging.info('Topological concepts are created')
+    profile_start = start_profile_step()
     g_ld, outer_edge_dict, inner_edge_dict = convert_topologicalconcepts_to_tso(g_ld, enriched_graph, hierarchie_dict, ic_json, INST, TSO, RDF)
+    record_profile_step('GRAPH2TSO convert_topologicalconcepts_to_tso', profile_start, triples=len(g_ld))
     logging.info('Topological concepts were created successfully')
 
     # Anlegen von Konzepten mit Aspekten der räumlichen Strukturierung
     logging.info('Spatial concepts are created')
+    profile_start = start_profile_step()
     g_ld, serves_dict = convert_spatialconcepts_to_tso(g_ld, args, enriched_graph, spatial_dict, INST, TSO, RDF, BOT)
+    record_profile_step('GRAPH2TSO convert_spatialconcepts_to_tso', profile_start, triples=len(g_ld))
     logging.info('Spatial concepts were created successfully')
 
     # Anlegen von Konzepten mit funktionalen Aspekten
     logging.info('Functional concepts are created')
+    profile_start = start_profile_step()
     g_ld = convert_functionalconcepts_to_tso(g_ld, args, enriched_graph, fc_json, state_dict, outer_edge_dict, inner_edge_dict, hierarchie_dict, serves_dict, INST, TSO, RDF, RDFS)
+    record_profile_step('GRAPH2TSO convert_functionalconcepts_to_tso', profile_start, triples=len(g_ld))
     logging.info('Functional concepts were created successfully')
 
     logging.info('Graph was successfully transfered in linked data representation')
 
-    # Binden der Namespaces
-    g_ld.bind('tso', TSO)
-    g_ld.bind('rdf', RDF)
-    g_ld.bind('rdfs', RDFS)
-    g_ld.bind('inst', INST)
-    g_ld.bind('ifc4', IFC)
-    g_ld.bind('bot', BOT)
-
     return g_ld, result_set, name
 
 
-def main(args):
+def get_id_namespace(args):
+    # Ableitung des Namespaces der deterministischen Bezeichner aus dem angegebenen Namespace bzw. dem festen Ausgangswert
+    return uuid.uuid5(uuid.NAMESPACE_URL, args.use_ns or ID_NAMESPACE_SEED)
+
+
+def get_stage_key(args, stage, input_file=None):
+    # Schlüssel eines Prozessschritts im Zwischenspeicher aus den Hashwerten der Eingabedateien und den Optionen, die das Ergebnis beeinflussen
+    if stage == 'IFC2GRAPH':
+        key_list = [os.path.basename(input_file), calculate_file_hash(input_file), args.data, args.data_props, args.rds, args.ce, args.inc]
+    elif stage == 'GRAPH':
+        key_list = [get_stage_key(args, 'IFC2GRAPH', input_file) for input_file in args.input_files]
+        for add_file in (args.add_edges, args.add_sh, args.naming):
+            if add_file:
+                key_list.append(calculate_file_hash(add_file))
+            else:
+                key_list.append(None)
+        key_list.extend([args.r, args.cr, args.det_ids, args.use_ns])
+    else:
+        key_list = [calculate_file_hash(args.add_spatial)]
+
+    return hashlib.sha256(repr([stage] + key_list).encode()).hexdigest()
+
+
+def load_stage_cache(args, stage, stage_key):
+    # Laden des Ergebnisses eines Prozessschritts aus dem Zwischenspeicher, sofern für den Schlüssel vorhanden
+    # Die Ergebnisse werden mit pickle geladen, das Verzeichnis des Zwischenspeichers muss daher vertrauenswürdig sein
+    cache_path = os.path.join(args.cache, '%s_%s.pickle' % (stage, stage_key))
+    if not os.path.isfile(cache_path):
+        return None
+
+    logging.info('Results of %s are being loaded from the cache', stage)
+    try:
+        with open(cache_path, 'rb') as cache_file:
+            result = pickle.load(cache_file)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        logging.warning('Results of %s could not be loaded from the cache and are recalculated', stage)
+        return None
+    logging.info('Results of %s were successfully loaded from the cache', stage)
+    return result
+
+
+def save_stage_cache(args, stage, stage_key, result):
+    # Ablage des Ergebnisses eines Prozessschritts im Zwischenspeicher, die Datei wird erst nach dem vollständigen Schreiben umbenannt
+    os.makedirs(args.cache, exist_ok=True)
+    cache_path = os.path.join(args.cache, '%s_%s.pickle' % (stage, stage_key))
+    tmp_path = '%s.%d.tmp' % (cache_path, os.getpid())
+    with open(tmp_path, 'wb') as cache_file:
+        pickle.dump(result, cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, cache_path)
+
+
+def get_cpu_time():
+    # CPU-Zeit des Prozesses einschließlich beendeter Unterprozesse, z.B. der parallelen Überführung der IFC-Modelle
+    cpu_time = time.process_time()
+    if resource is not None:
+        usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+        cpu_time += usage.ru_utime + usage.ru_stime
+    return cpu_time
+
+
+def get_peak_rss():
+    # Maximaler Arbeitsspeicher (Resident Set Size) in MB, unter macOS in Byte und unter Linux in KB angegeben
+    if resource is None:
+        return None
+    peak_rss = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss, resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    if sys.platform == 'darwin':
+        return round(peak_rss / 1024 / 1024, 1)
+    return round(peak_rss / 1024, 1)
+
+
+def enable_profiling():
+    # Aktivierung der Aufzeichnung der Messwerte
+    global PROFILE_LIST
+    PROFILE_LIST = list()
+
+
+def start_profile_step():
+    # Startzeitpunkt eines Prozessschritts, ohne Profiling None
+    if PROFILE_LIST is None:
+        return None
+    return time.perf_counter(), get_cpu_time()
+
+
+def record_profile_step(step, profile_start, input_file=None, **counts):
+    # Ablage der Wandzeit, CPU-Zeit, des maximalen Arbeitsspeichers und der Anzahl der verarbeiteten Objekte eines Prozessschritts
+    if profile_start is None:
+        return
+    PROFILE_LIST.append({'Step': step,
+                         'Input': os.path.basename(input_file) if input_file else None,
+                         'Wall time [s]': round(time.perf_counter() - profile_start[0], 4),
+                         'CPU time [s]': round(get_cpu_time() - profile_start[1], 4),
+                         'Peak RSS [MB]': get_peak_rss(),
+                         'Counts': counts})
+
+
+def write_profile_report(args, name):
+    # Export der Messwerte aller Prozessschritte als Datei im JSON-Format am Pfad der Ausgabe
+    if PROFILE_LIST is None:
+        return
+    logging.info('Profiling report is being saved')
+    report_dict = {'Options': vars(args),
+                   'Steps': PROFILE_LIST}
+    with open(os.path.dirname(args.input_files[0]) + '/PROFILE_' + name + '.json', 'w', encoding='utf8') as json_file:
+        json.dump(report_dict, json_file, ensure_ascii=False, indent=4)
+    logging.info('Profiling report was successfully saved')
+
+
+def configure_logging(args):
     # Konfiguration des Logs
     if args.l:
         logging.basicConfig(handlers=[logging.FileHandler(os.path.dirname(args.input_files[0]) + '/LOG_' + os.path.basename(args.input_files[0])[:-4] + '.log'),
@@ -478,34 +767,118 @@ def main(args):
     else:
         logging.basicConfig(level=logging.INFO, format='%(asctime)s | %(levelname)s | %(message)s')
 
+
+def main(args):
+    # Konfiguration des Logs
+    configure_logging(args)
+
     logging.info('Process IFC2TSO started with options %r', args)
 
+    # Aufzeichnung der Messwerte der einzelnen Prozessschritte
+    if args.profile:
+        enable_profiling()
+    process_start = start_profile_step()
+
+    # Kontrolle der optionalen Abhängigkeit des binären Austauschformats
+    if args.bin and msgpack is None:
+        return logging.warning('The binary graph format requires the package msgpack')
+
+    # Die Beschränkung der Eigenschaften wirkt nur in Verbindung mit -data
+    if args.data_props and not args.data:
+        logging.warning('The option -data_props is ignored without -data')
+        args.data_props = None
+
+    if args.det_ids:
+        # Ableitung deterministischer Bezeichner, damit wiederholte Überführungen identische und vergleichbare Ausgaben erzeugen
+        id_namespace = get_id_namespace(args)
+        set_system_id_namespace(id_namespace)
+        set_instance_id_namespace(id_namespace)
+
+    if args.naming:
+        # Import der Namenskonventionen zur Erkennung der funktionalen Systeme und Systemteile
+        logging.info('Naming conventions are being imported')
+        if not args.naming.lower().endswith(('.json', '.yml', '.yaml')):
+            return logging.warning('The given naming conventions are not in the *.json or *.yaml Format')
+        if not args.naming.lower().endswith('.json') and yaml is None:
+            return logging.warning('Naming conventions in the YAML format require the package PyYAML')
+        try:
+            set_system_naming_conventions(load_system_naming_conventions(args.naming))
+        except (OSError, ValueError, KeyError, TypeError, AttributeError, re.error) as error:
+            return logging.warning('The given naming conventions could not be handled: %s', error)
+        logging.info('Naming conventions were successfully imported')
+
+    # Abfrage des Zwischenspeichers des Prozessschritts GRAPH, dessen Schlüssel die Schlüssel der Prozessschritte IFC2GRAPH enthält
+    graph_key = None
+    graph_result = None
+    if args.cache and not args.ifc2graph and not args.bcf_sh:
+        graph_key = get_stage_key(args, 'GRAPH')
+        graph_result = load_stage_cache(args, 'GRAPH', graph_key)
+
     graph_list = list()
-    for input_file in args.input_files:
-        graph, ifc2graph_info_dict = main_ifc2graph(args, input_file)
-        graph_list.append((graph, ifc2graph_info_dict))
+    if graph_result is not None and not args.i and not args.bcf_p and not args.bcf_pm and not args.inc:
+        # Die Graphen der einzelnen IFC-Modelle werden nur für die Analyseergebnisse, BCF-Dateien und als Grundlage der nächsten Revision benötigt
+        logging.info('Processstep IFC2GRAPH is skipped, the enriched graph is taken from the cache')
+
+    elif args.jobs > 1 and len(args.input_files) > 1:
+        # Parallele Überführung der IFC-Modelle in Graphen, die Prozesse geben nur den Graph und die Analyseergebnisse zurück
+        num_jobs = min(args.jobs, len(args.input_files))
+        logging.info('IFC models are being converted in %d processes', num_jobs)
+        # Die Messwerte der einzelnen Schritte in den Prozessen werden nicht übertragen, daher wird der Prozessschritt insgesamt aufgezeichnet
+        profile_start = start_profile_step()
+        with ProcessPoolExecutor(max_workers=num_jobs, initializer=configure_logging, initargs=(args,)) as executor:
+            for graph, ifc2graph_info_dict in executor.map(main_ifc2graph, repeat(args), args.input_files):
+                graph_list.append((graph, ifc2graph_info_dict))
+        record_profile_step('IFC2GRAPH parallel', profile_start, jobs=num_jobs, nodes=sum(graph[0].number_of_nodes() for graph in graph_list), edges=sum(graph[0].number_of_edges() for graph in graph_list))
+        logging.info('IFC models were successfully converted in %d processes', num_jobs)
 
-    if args.ifc2graph:
+    else:
+        for input_file in args.input_files:
+            graph, ifc2graph_info_dict = main_ifc2graph(args, input_file)
+            graph_list.append((graph, ifc2graph_info_dict))
+
+    if args.ifc2graph or args.inc:
+        profile_start = start_profile_step()
         for idx, graph in enumerate(graph_list):
-            # Export des Graphs in Knoten-/Kantenliste Darstellung und Ablage als JSON-Datei
-            data_drop = nx.node_link_data(graph[0])
-            with open(os.path.dirname(args.input_files[idx]) + '/GRAPH_' + os.path.basename(args.input_files[idx])[:-4] + '.json', 'w', encoding='utf8') as json_file:
-                json.dump(data_drop, json_file, ensure_ascii=False)
+            # Export des Graphs in Knoten-/Kantenliste Darstellung und Ablage als JSON-Datei oder binär, bei inkrementeller Überführung als Grundlage der nächsten Revision
+            graph_path = os.path.dirname(args.input_files[idx]) + '/GRAPH_' + os.path.basename(args.input_files[idx])[:-4] + get_graph_extension(args)
+            if args.bin:
+                write_graph_binary(graph[0], graph_path)
+            else:
+                data_drop = nx.node_link_data(graph[0])
+                with open(graph_path, 'w', encoding='utf8') as json_file:
+                    json.dump(data_drop, json_file, ensure_ascii=False)
             logging.info('Graph was successfully saved')
+        record_profile_step('IFC2GRAPH serialization', profile_start, graphs=len(graph_list))
 
+    if args.ifc2graph:
+        record_profile_step('IFC2TSO total', process_start)
+        write_profile_report(args, os.path.basename(args.input_files[0])[:-4])
         return None
 
-    merged_graph, graph_info_dict, hierarchie_dict = main_graph(args, graph_list)
-    graph_name = str(uuid.uuid4())
+    if graph_result is not None:
+        merged_graph, graph_info_dict, hierarchie_dict = graph_result
+    else:
+        merged_graph, graph_info_dict, hierarchie_dict = main_graph(args, graph_list)
+        if graph_key:
+            save_stage_cache(args, 'GRAPH', graph_key, (merged_graph, graph_info_dict, hierarchie_dict))
+    graph_name = create_system_id('ENRICHED_GRAPH')
 
     if args.graph:
-        # Export des Graphs in Knoten-/Kantenliste Darstellung und Ablage als JSON-Datei
-        data_drop = nx.node_link_data(merged_graph)
-        data_drop['hierarchy'] = hierarchie_dict
-        with open(os.path.dirname(args.input_files[0]) + '/ENRICHED_GRAPH_' + graph_name + '.json', 'w', encoding='utf8') as json_file:
-            json.dump(data_drop, json_file, ensure_ascii=False)
+        # Export des Graphs in Knoten-/Kantenliste Darstellung und Ablage als JSON-Datei oder binär
+        profile_start = start_profile_step()
+        graph_path = os.path.dirname(args.input_files[0]) + '/ENRICHED_GRAPH_' + graph_name + get_graph_extension(args)
+        if args.bin:
+            write_graph_binary(merged_graph, graph_path, {'hierarchy': hierarchie_dict})
+        else:
+            data_drop = nx.node_link_data(merged_graph)
+            data_drop['hierarchy'] = hierarchie_dict
+            with open(graph_path, 'w', encoding='utf8') as json_file:
+                json.dump(data_drop, json_file, ensure_ascii=False)
         logging.info('Graph was successfully saved')
+        record_profile_step('GRAPH serialization', profile_start, nodes=merged_graph.number_of_nodes(), edges=merged_graph.number_of_edges())
 
+        record_profile_step('IFC2TSO total', process_start)
+        write_profile_report(args, graph_name)
         return None
 
     g_ld, graph2tso_info_dict, name = main_graph2tso(args, merged_graph, hierarchie_dict)
@@ -518,9 +891,17 @@ def main(args):
 
     # Ablage der Wissensrepräsentation am Pfad
     logging.info('Linked data representation is getting serialized')
-    g_ld.serialize(destination=os.path.dirname(args.input_files[0]) + '/LD-REP_' + name + '.ttl', format='turtle')
+    profile_start = start_profile_step()
+    if args.stream:
+        g_ld.close()
+    else:
+        g_ld.serialize(destination=os.path.dirname(args.input_files[0]) + '/LD-REP_' + name + '.ttl', format='turtle')
+    record_profile_step('GRAPH2TSO serialization', profile_start, triples=len(g_ld))
     logging.info('Linked data representation was successfully serialized and saved')
 
+    record_profile_step('IFC2TSO total', process_start)
+    write_profile_report(args, name)
+
 
 if __name__ == "__main__":
     # Konzeption des Command Line Interface
@@ -564,6 +945,9 @@ if __name__ == "__main__":
     # Hinzufügen zusätzlicher Systemhierarchie in den importierten Graph.
     parser.add_argument('-add_sh', type=str, default=None, help='Add system hierarchy based on the given json file')
 
+    # Namenskonventionen zur Erkennung der funktionalen Systeme und Systemteile anhand der Bezeichner der IFC-Systeme als Datei im JSON- oder YAML-Format.
+    parser.add_argument('-naming', type=str, default=None, help='Recognise functional and technical systems using the naming conventions in the given json or yaml file')
+
     # Ablage der Anreicherungsergebnisse zu [...] als BCF- Datei am Pfad des Graphs.
     parser.add_argument('-bcf_sh', action='store_true', help='Create bcf-files of the system hierarchy')
 
@@ -588,6 +972,30 @@ if __name__ == "__main__":
     # Nutzung des angegebenen Namespaces zur eindeutigen Identifizierung der Instanzen.
     parser.add_argument('-use_ns', type=str, default=None, help='Identify instances using the given namespace')
 
+    # Verzeichnis zur Zwischenspeicherung von Ergebnissen, die bei erneuten Aufrufen mit unveränderten Eingaben wiederverwendet werden.
+    parser.add_argument('-cache', type=str, default=None, help='Directory to cache intermediate results, e.g. the graphs of the process steps and the tessellated spatial elements')
+
+    # Direkte Ausgabe der Tripel als N-Triples oder Turtle während der Überführung, ohne die Wissensrepräsentation im Arbeitsspeicher aufzubauen.
+    parser.add_argument('-stream', type=str, default=None, choices=['nt', 'ttl'], help='Stream the triples to an N-Triples (nt) or Turtle (ttl) file instead of building the graph in memory')
+
+    # Vergabe deterministischer Bezeichner (UUIDv5) für Systeme, Zustände, Verbindungspunkte und Verbindungen, abgeleitet aus dem Inhalt der Eingabedateien und dem Namespace.
+    parser.add_argument('-det_ids', action='store_true', help='Derive reproducible identifiers from the input files and component GUIDs instead of random ones')
+
+    # Anzahl der Prozesse zur parallelen Überführung mehrerer IFC-Modelle im Prozessschritt IFC2GRAPH.
+    parser.add_argument("-jobs", type=int, default=1, help="Number of worker processes used to convert several IFC models in parallel")
+
+    # Inkrementelle Überführung einer neuen Revision auf Basis des Graphs der vorherigen Revision (GRAPH_*.json am Pfad des IFC-Modells), nur geänderte Elemente und deren Nachbarn werden neu aufbereitet.
+    parser.add_argument("-inc", action='store_true', help="Update the graph of the previous revision instead of converting the whole model and save it as GRAPH_*.json")
+
+    # Beschränkung der mit -data an den Knoten abgelegten Eigenschaften auf die kommagetrennt angegebenen Bezeichner.
+    parser.add_argument("-data_props", type=split_property_names, default=None, help="Store only the properties with the given comma separated names when using -data, e.g. Manufacturer,ModelReference")
+
+    # Austausch der Graphen im binären MessagePack-Format mit spaltenweise abgelegten Knoten und Kanten anstelle des JSON-Formats.
+    parser.add_argument("-bin", action='store_true', help="Save and read the graphs in the binary MessagePack format (*.msgpack) instead of JSON")
+
+    # Aufzeichnung der Wandzeit, CPU-Zeit, des maximalen Arbeitsspeichers und der Anzahl verarbeiteter Objekte je Prozessschritt, Ablage als Datei im JSON-Format mit dem Präfix PROFILE_ am Pfad der Ausgabe.
+    parser.add_argument("-profile", action='store_true', help="Record wall time, CPU time, peak memory and object counts of every process step and save them as PROFILE_*.json")
+
     # Unterbrechnung des Prozesses nach dem Prozessschritt IFC2GRAPH
     parser.add_argument("-ifc2graph", action='store_true', default=None, help="Break the process after IFC2GRAPH and export the resulting graphs")
 
@@ -0,0 +1,225 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+import networkx as nx
+import pytest
+
+ifcopenshell = pytest.importorskip('ifcopenshell')
+import ifcopenshell.guid
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT_DIR, 'src'))
+
+from IFC2GRAPH.helper_check import build_spatial_index, calculate_all_absolute_positions, check_model, check_ports, check_ports_of_changed_elements, get_port_tables
+from IFC2GRAPH.helper_graph import calculate_entity_hashes, create_directed_graph, get_affected_elements, get_distribution_elements, get_topo_info, update_directed_graph
+
+# Länge der Elemente des Strangs in mm
+ELEMENT_LENGTH = 1000.
+
+
+@pytest.fixture
+def chain_model():
+    # Strang aus Rohrsegmenten mit Ein- und Ausgang, die Ports aufeinanderfolgender Elemente liegen an derselben Position
+    # Zwischen den Elementen 2 und 3 sowie 6 und 7 fehlt die Verbindung, die offenen Ports werden über -ce verbunden
+    # Der Ausgang des Elements 4 hat keine Flussrichtung, die Kante 4 -> 5 stammt damit nur aus dem Datensatz von Element 5
+    model = ifcopenshell.file(schema='IFC4')
+    axis = model.createIfcDirection((0., 0., 1.))
+    ref_direction = model.createIfcDirection((1., 0., 0.))
+    origin_axis = model.createIfcAxis2Placement3D(model.createIfcCartesianPoint((0., 0., 0.)), axis, ref_direction)
+    end_axis = model.createIfcAxis2Placement3D(model.createIfcCartesianPoint((ELEMENT_LENGTH, 0., 0.)), axis, ref_direction)
+
+    length_unit = model.createIfcSIUnit(UnitType='LENGTHUNIT', Prefix='MILLI', Name='METRE')
+    context = model.createIfcGeometricRepresentationContext(None, 'Model', 3, 1e-5, origin_axis, None)
+    project = model.createIfcProject(ifcopenshell.guid.new(), None, 'Test Project', None, None, None, None, [context], model.createIfcUnitAssignment([length_unit]))
+    site_placement = model.createIfcLocalPlacement(None, origin_axis)
+    site = model.createIfcSite(ifcopenshell.guid.new(), None, 'Site', None, None, site_placement, None, None, 'ELEMENT', None, None, None, None, None)
+    model.createIfcRelAggregates(ifcopenshell.guid.new(), None, None, None, project, [site])
+    system = model.createIfcDistributionSystem(ifcopenshell.guid.new(), None, 'HVL Heizung 1', None, None, None, 'HEATING')
+
+    element_list = []
+    previous_port = None
+    for position in range(8):
+        placement = model.createIfcLocalPlacement(site_placement, model.createIfcAxis2Placement3D(model.createIfcCartesianPoint((position * ELEMENT_LENGTH, 0., 0.)), axis, ref_direction))
+        element = model.createIfcPipeSegment(ifcopenshell.guid.new(), None, 'PipeSegment %d' % position, None, None, placement, None, None, 'NOTDEFINED')
+        in_port = model.createIfcDistributionPort(ifcopenshell.guid.new(), None, 'Port', None, None, model.createIfcLocalPlacement(placement, origin_axis), None, 'SINK', 'PIPE', 'HEATING')
+        out_port = model.createIfcDistributionPort(ifcopenshell.guid.new(), None, 'Port', None, None, model.createIfcLocalPlacement(placement, end_axis), None, 'SOURCE', 'PIPE', 'HEATING')
+        if position == 4:
+            out_port.FlowDirection = 'NOTDEFINED'
+        model.createIfcRelNests(ifcopenshell.guid.new(), None, None, None, element, [in_port, out_port])
+        if previous_port is not None and position not in (3, 7):
+            model.createIfcRelConnectsPorts(ifcopenshell.guid.new(), None, None, None, in_port, previous_port, None)
+        previous_port = out_port
+        element_list.append(element)
+
+    model.createIfcRelAssignsToGroup(ifcopenshell.guid.new(), None, None, None, element_list, None, system)
+    model.createIfcRelContainedInSpatialStructure(ifcopenshell.guid.new(), None, None, None, element_list, site)
+
+    return model, [element.GlobalId for element in element_list]
+
+
+def remove_element(model, element):
+    # Entfernen eines Elements einschließlich der zugeordneten Ports
+    for rel in element.IsNestedBy:
+        port_list = list(rel.RelatedObjects)
+        model.remove(rel)
+        for port in port_list:
+            model.remove(port)
+    model.remove(element)
+
+
+def get_args(**options):
+    # Optionen der Überführung mit den Standardwerten des Command Line Interface
+    args = argparse.Namespace(data=False, data_props=None, rds=None, ce=None)
+    for key, value in options.items():
+        setattr(args, key, value)
+    return args
+
+
+def analyse_model(model):
+    # Tabellen der Ports, Ergebnisse der Analyse und Positionen wie im IFC2GRAPH Prozess
+    port_tables = get_port_tables(model)
+    check_dict = check_model(model, port_tables)
+    info_dict = {'port_relationship': check_dict['port_relationship'], 'Elements without ports': check_dict['Elements_without_ports'],
+                 'Ports without assignment': check_dict['Ports without assignment']}
+    position_dict = calculate_all_absolute_positions(model)
+    return port_tables, info_dict, position_dict
+
+
+def get_hashes(model, args):
+    # Hashwerte aller Elemente des Modells
+    port_tables, info_dict, position_dict = analyse_model(model)
+    return calculate_entity_hashes(model, args, get_distribution_elements(model, info_dict), position_dict, port_tables)
+
+
+def get_port_pairs(possible_matches):
+    # Ungeordnete Paare der Ports der möglichen Verbindungen
+    return set(frozenset((possible_match['source_port_id'], possible_match['sink_port_id'])) for possible_match in possible_matches)
+
+
+def run_ifc2graph(ifc_path, *options):
+    # Aufruf des IFC2TSO Prozesses bis einschließlich IFC2GRAPH und Import des exportierten Graphs
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join([os.path.join(ROOT_DIR, 'src', 'GRAPH2TSO')] + [path for path in [env.get('PYTHONPATH')] if path])
+    subprocess.run([sys.executable, os.path.join(ROOT_DIR, 'src', 'main.py'), ifc_path, '-ifc2graph'] + list(options),
+                   cwd=os.path.join(ROOT_DIR, 'src'), env=env, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    graph_path = os.path.join(os.path.dirname(ifc_path), 'GRAPH_' + os.path.basename(ifc_path)[:-4] + '.json')
+    with open(graph_path, 'r', encoding='utf8') as json_file:
+        graph_json = json.load(json_file)
+
+    graph = nx.node_link_graph(graph_json)
+    return dict(graph.nodes(data=True)), set(graph.edges())
+
+
+def test_entity_hashes_change_only_for_renamed_element(chain_model):
+    model, guid_list = chain_model
+    args = get_args()
+    previous_hashes = get_hashes(model, args)
+
+    model.by_guid(guid_list[1]).Name = 'PipeSegment renamed'
+    hash_dict = get_hashes(model, args)
+
+    assert set(hash_dict) == set(guid_list)
+    assert [guid for guid in guid_list if hash_dict[guid] != previous_hashes[guid]] == [guid_list[1]]
+
+
+def test_entity_hashes_change_for_both_ends_of_a_removed_connection(chain_model):
+    model, guid_list = chain_model
+    args = get_args()
+    previous_hashes = get_hashes(model, args)
+
+    # Entfernen der Verbindung zwischen den Elementen 0 und 1
+    port_tables = get_port_tables(model)
+    for rel in [rel for rel in model.by_type('IfcRelConnectsPorts') if port_tables['Element'][rel.RelatingPort.GlobalId] == [guid_list[1]]]:
+        model.remove(rel)
+    hash_dict = get_hashes(model, args)
+
+    assert [guid for guid in guid_list if hash_dict[guid] != previous_hashes[guid]] == guid_list[:2]
+
+
+def test_affected_elements_include_neighbours_of_affected_elements():
+    previous_graph = nx.DiGraph([('A', 'X'), ('X', 'C'), ('C', 'D'), ('D', 'E'), ('F', 'G'), ('G', 'H')])
+    possible_matches = [{'source_elem_id': 'G', 'source_port_id': 'g', 'sink_elem_id': 'H', 'sink_port_id': 'h'}]
+
+    affected_dict = get_affected_elements(previous_graph, {'A'}, {'E'}, possible_matches)
+
+    assert affected_dict['Affected'] == {'A', 'X', 'D', 'G', 'H'}
+    assert affected_dict['Neighbours'] == {'C', 'F'}
+
+
+def test_update_directed_graph_matches_full_build(chain_model):
+    model, guid_list = chain_model
+    args = get_args()
+    port_tables, info_dict, position_dict = analyse_model(model)
+    previous_graph = create_directed_graph(get_topo_info(model, args, info_dict, position_dict, port_tables), args)
+
+    # Entfernen des letzten Elements und Umbenennen des Elements 3
+    remove_element(model, model.by_guid(guid_list[7]))
+    model.by_guid(guid_list[3]).Name = 'PipeSegment renamed'
+    port_tables, info_dict, position_dict = analyse_model(model)
+    full_graph = create_directed_graph(get_topo_info(model, args, info_dict, position_dict, port_tables), args)
+
+    affected_dict = get_affected_elements(previous_graph, {guid_list[3]}, {guid_list[7]}, [])
+    topo_records = get_topo_info(model, args, info_dict, position_dict, port_tables, affected_dict['Affected'] | affected_dict['Neighbours'])
+    updated_graph = update_directed_graph(previous_graph, topo_records, affected_dict['Affected'] | {guid_list[7]}, args)
+
+    assert set(updated_graph.edges()) == set(full_graph.edges())
+    assert dict(updated_graph.nodes(data=True)) == dict(full_graph.nodes(data=True))
+
+
+def test_port_matching_of_changed_elements_matches_full_check(chain_model):
+    model, guid_list = chain_model
+    port_tables, info_dict, position_dict = analyse_model(model)
+    previous_matches = check_ports(port_tables, info_dict, build_spatial_index(position_dict), position_dict, 10)['Possible_connected_elements']
+    assert len(previous_matches) == 2
+
+    # Verschieben des Elements 3, der offene Port liegt weiterhin innerhalb der räumlichen Grenze zum Ausgang des Elements 2
+    model.by_guid(guid_list[3]).ObjectPlacement.RelativePlacement.Location.Coordinates = (3. * ELEMENT_LENGTH + 5., 0., 0.)
+    port_tables, info_dict, position_dict = analyse_model(model)
+    index_dict = build_spatial_index(position_dict)
+    full_dict = check_ports(port_tables, info_dict, index_dict, position_dict, 10)
+    result_dict = check_ports_of_changed_elements(port_tables, info_dict, index_dict, position_dict, 10, {guid_list[3]}, set(), previous_matches)
+
+    assert get_port_pairs(result_dict['Possible_connected_elements']) == get_port_pairs(full_dict['Possible_connected_elements'])
+    assert result_dict['Checked_ports'] == 2
+
+
+def test_incremental_update_matches_full_build(chain_model, tmp_path):
+    model, guid_list = chain_model
+    ifc_path = str(tmp_path / 'model.ifc')
+    model.write(ifc_path)
+
+    # Erste Revision, der Graph wird vollständig aufgebaut und als Grundlage der nächsten Revision abgelegt
+    run_ifc2graph(ifc_path, '-inc')
+
+    # In der zweiten Revision wird nur das vorherige Element 3 von Element 4 umbenannt, sodass Element 4, aber nicht Element 5 geändert ist
+    model.by_guid(guid_list[3]).Name = 'PipeSegment renamed'
+    model.write(ifc_path)
+
+    inc_nodes, inc_edges = run_ifc2graph(ifc_path, '-inc')
+    full_nodes, full_edges = run_ifc2graph(ifc_path)
+
+    assert (guid_list[4], guid_list[5]) in full_edges
+    assert inc_edges == full_edges
+    assert inc_nodes == full_nodes
+
+
+def test_incremental_update_with_port_matching_matches_full_build(chain_model, tmp_path):
+    model, guid_list = chain_model
+    ifc_path = str(tmp_path / 'model.ifc')
+    model.write(ifc_path)
+    run_ifc2graph(ifc_path, '-inc', '-ce', '10')
+
+    # Die mögliche Verbindung zu Element 3 wird erneut kontrolliert, die zu Element 7 aus der vorherigen Revision übernommen
+    model.by_guid(guid_list[3]).ObjectPlacement.RelativePlacement.Location.Coordinates = (3. * ELEMENT_LENGTH + 5., 0., 0.)
+    model.write(ifc_path)
+
+    inc_nodes, inc_edges = run_ifc2graph(ifc_path, '-inc', '-ce', '10')
+    full_nodes, full_edges = run_ifc2graph(ifc_path, '-ce', '10')
+
+    assert {(guid_list[2], guid_list[3]), (guid_list[6], guid_list[7])} <= full_edges
+    assert inc_edges == full_edges
+    assert inc_nodes == full_nodes